@@ -4,14 +4,28 @@ import signal
 from app.config.settings import settings
 from app.core.schema import initialize_database_schema
 from app.processing.adapters.celery_dispatcher import CeleryProcessingTaskDispatcher
+from app.processing.adapters.queue_routing import ProcessingQueueRoutingPolicy
 from app.processing.adapters.sqlalchemy_stores import SqlAlchemyProcessingRequestRepository
 from app.processing.application.dispatch import DispatchProcessingApplicationService
 
 
+def processing_queue_routing_policy() -> ProcessingQueueRoutingPolicy | None:
+    if not settings.CELERY_QUEUE_ROUTING_ENABLED:
+        return None
+    return ProcessingQueueRoutingPolicy(
+        short_queue=settings.CELERY_SHORT_QUEUE,
+        long_queue=settings.CELERY_LONG_QUEUE,
+        huge_queue=settings.CELERY_HUGE_QUEUE,
+        short_max_bytes=settings.CELERY_SHORT_QUEUE_MAX_BYTES,
+        huge_min_bytes=settings.CELERY_HUGE_QUEUE_MIN_BYTES,
+        video_bytes_ratio=settings.WHISPER_VIDEO_BYTES_RATIO,
+    )
+
+
 def build_processing_dispatch_service(db, *, dispatcher=None) -> DispatchProcessingApplicationService:
     return DispatchProcessingApplicationService(
         repository=SqlAlchemyProcessingRequestRepository(db),
-        dispatcher=dispatcher or CeleryProcessingTaskDispatcher(),
+        dispatcher=dispatcher or CeleryProcessingTaskDispatcher(queue_routing=processing_queue_routing_policy()),
     )
 
 
@@ -29,4 +43,4 @@ def run_processing_consumer() -> None:
     runner.run_forever()
 
 
-__all__ = ["build_processing_dispatch_service", "run_processing_consumer"]
+__all__ = ["build_processing_dispatch_service", "processing_queue_routing_policy", "run_processing_consumer"]
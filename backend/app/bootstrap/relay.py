@@ -1,17 +1,47 @@
 from app.config.settings import settings
 from app.result_delivery.adapters.kafka_publisher import build_processing_result_publisher
+from app.result_delivery.adapters.outbox_notifications import PostgresOutboxNotificationListener
 from app.result_delivery.adapters.sqlalchemy_repository import SqlAlchemyProcessingResultOutboxRepository
 from app.result_delivery.application.reconcile import ReconcileFailedProcessingResultsApplicationService
 from app.result_delivery.application.relay import (
     ProcessingResultRelayPolicy,
     RelayProcessingResultsApplicationService,
 )
+from app.result_delivery.application.relay_schedule import AdaptiveRelayPolicy, AdaptiveRelaySchedule
 
 
 def build_result_publisher():
     return build_processing_result_publisher()
 
 
+def build_result_outbox_listener(engine) -> PostgresOutboxNotificationListener | None:
+    if not settings.PROCESSING_OUTBOX_AUTO_RELAY_LISTEN_ENABLED:
+        return None
+    if engine.dialect.name != "postgresql":
+        return None
+    return PostgresOutboxNotificationListener(engine)
+
+
+def build_adaptive_relay_schedule() -> AdaptiveRelaySchedule | None:
+    if not settings.PROCESSING_OUTBOX_AUTO_RELAY_ADAPTIVE_ENABLED:
+        return None
+    return AdaptiveRelaySchedule(
+        AdaptiveRelayPolicy(
+            min_batch_size=settings.PROCESSING_OUTBOX_AUTO_RELAY_BATCH_SIZE,
+            max_batch_size=max(
+                settings.PROCESSING_OUTBOX_AUTO_RELAY_BATCH_SIZE,
+                settings.PROCESSING_OUTBOX_AUTO_RELAY_MAX_BATCH_SIZE,
+            ),
+            min_idle_seconds=min(
+                settings.PROCESSING_OUTBOX_AUTO_RELAY_MIN_IDLE_SECONDS,
+                settings.PROCESSING_OUTBOX_AUTO_RELAY_INTERVAL_SECONDS,
+            ),
+            max_idle_seconds=settings.PROCESSING_OUTBOX_AUTO_RELAY_INTERVAL_SECONDS,
+            target_pass_seconds=settings.PROCESSING_OUTBOX_AUTO_RELAY_TARGET_PASS_MS / 1000,
+        )
+    )
+
+
 def result_relay_policy() -> ProcessingResultRelayPolicy:
     return ProcessingResultRelayPolicy(
         batch_size=settings.PROCESSING_OUTBOX_RELAY_BATCH_SIZE,
@@ -1,9 +1,21 @@
+import logging
+
+from app.config.settings import settings
 from app.core.database import SessionLocal
-from app.processing.adapters.media_source import ObjectStorageProcessingMediaSource
+from app.processing.adapters.faster_whisper_transcriber import FasterWhisperProcessingTranscriptionProvider
+from app.processing.adapters.long_media import LongMediaTranscriptionPolicy
+from app.processing.adapters.media_source import (
+    ObjectStorageProcessingMediaSource,
+    RangedDownloadPolicy,
+    StreamingObjectStorageProcessingMediaSource,
+)
+from app.processing.adapters.model_selection import TranscriptionModelSelectionPolicy
 from app.processing.adapters.sqlalchemy_stores import (
     SqlAlchemyDirectUploadArtifactStore,
     SqlAlchemyProcessingArtifactStore,
 )
+from app.processing.adapters.transcript_cache import SqlAlchemyProcessingTranscriptCache
+from app.processing.adapters.voice_activity import VoiceActivityPolicy
 from app.processing.adapters.whisper_transcriber import WhisperProcessingTranscriptionProvider
 from app.processing.application.execute import (
     ExecuteDirectUploadProcessingApplicationService,
@@ -11,24 +23,134 @@ from app.processing.application.execute import (
 )
 from app.result_delivery.adapters.sqlalchemy_repository import SqlAlchemyProcessingResultOutboxRepository
 from app.result_delivery.application.record_result import RecordProcessingResultApplicationService
+from app.services.media_cache import LocalMediaCache
 from app.services.object_storage import get_object_storage_client
 
+logger = logging.getLogger(__name__)
+
+
+def long_media_transcription_policy() -> LongMediaTranscriptionPolicy | None:
+    if not settings.WHISPER_LONG_MEDIA_ENABLED:
+        return None
+    return LongMediaTranscriptionPolicy(
+        min_duration_seconds=settings.WHISPER_LONG_MEDIA_MIN_DURATION_SECONDS,
+        workers=settings.WHISPER_LONG_MEDIA_WORKERS,
+        window_seconds=settings.WHISPER_LONG_MEDIA_WINDOW_SECONDS,
+        overlap_seconds=settings.WHISPER_LONG_MEDIA_OVERLAP_SECONDS,
+    )
+
+
+def voice_activity_policy() -> VoiceActivityPolicy | None:
+    if not settings.WHISPER_VAD_ENABLED:
+        return None
+    return VoiceActivityPolicy(
+        rms_threshold=settings.WHISPER_VAD_RMS_THRESHOLD,
+        min_silence_seconds=settings.WHISPER_VAD_MIN_SILENCE_SECONDS,
+        padding_seconds=settings.WHISPER_VAD_PADDING_SECONDS,
+    )
+
+
+def transcription_model_selection_policy() -> TranscriptionModelSelectionPolicy:
+    return TranscriptionModelSelectionPolicy(
+        default_model=settings.WHISPER_MODEL_NAME,
+        small_media_model=settings.WHISPER_SMALL_MEDIA_MODEL_NAME or None,
+        small_media_max_bytes=settings.WHISPER_SMALL_MEDIA_MAX_BYTES,
+        large_media_model=settings.WHISPER_LARGE_MEDIA_MODEL_NAME or None,
+        large_media_min_bytes=settings.WHISPER_LARGE_MEDIA_MIN_BYTES,
+        video_bytes_ratio=settings.WHISPER_VIDEO_BYTES_RATIO,
+    )
+
+
+def build_transcription_provider() -> WhisperProcessingTranscriptionProvider:
+    if settings.TRANSCRIPTION_ENGINE == "faster-whisper":
+        return FasterWhisperProcessingTranscriptionProvider(
+            compute_type=settings.FASTER_WHISPER_COMPUTE_TYPE,
+            audio_decode_mode=settings.WHISPER_AUDIO_DECODE_MODE,
+            long_media=long_media_transcription_policy(),
+            voice_activity=voice_activity_policy(),
+            model_selection=transcription_model_selection_policy(),
+        )
+    return WhisperProcessingTranscriptionProvider(
+        audio_decode_mode=settings.WHISPER_AUDIO_DECODE_MODE,
+        long_media=long_media_transcription_policy(),
+        voice_activity=voice_activity_policy(),
+        model_selection=transcription_model_selection_policy(),
+    )
+
+
+def preload_transcription_model() -> None:
+    try:
+        build_transcription_provider().warm_up()
+    except Exception:
+        # The first task will load the model lazily, as it would without preloading.
+        logger.exception("transcription model preload failed")
+
+
+def ranged_download_policy() -> RangedDownloadPolicy | None:
+    if not settings.PROCESSING_RANGED_DOWNLOAD_ENABLED:
+        return None
+    return RangedDownloadPolicy(
+        min_size_bytes=settings.PROCESSING_RANGED_DOWNLOAD_MIN_BYTES,
+        part_size_bytes=settings.PROCESSING_RANGED_DOWNLOAD_PART_BYTES,
+        concurrency=settings.PROCESSING_RANGED_DOWNLOAD_CONCURRENCY,
+    )
+
+
+def build_media_source(storage_client) -> ObjectStorageProcessingMediaSource:
+    media_cache = None
+    if settings.PROCESSING_MEDIA_CACHE_ENABLED:
+        media_cache = LocalMediaCache(
+            settings.PROCESSING_MEDIA_CACHE_DIR,
+            max_bytes=settings.PROCESSING_MEDIA_CACHE_MAX_BYTES,
+        )
+    if not settings.PROCESSING_MEDIA_STREAMING_ENABLED:
+        return ObjectStorageProcessingMediaSource(
+            storage_client,
+            media_cache=media_cache,
+            ranged_download=ranged_download_policy(),
+        )
+    return StreamingObjectStorageProcessingMediaSource(
+        storage_client,
+        streamable_content_types=frozenset(
+            content_type.strip().lower()
+            for content_type in settings.PROCESSING_MEDIA_STREAMING_CONTENT_TYPES.split(",")
+            if content_type.strip()
+        ),
+        media_cache=media_cache,
+        ranged_download=ranged_download_policy(),
+    )
+
 
 def build_processing_execution_service() -> ExecuteProcessingApplicationService:
     db = SessionLocal()
-    store = SqlAlchemyProcessingArtifactStore(db)
+    store = SqlAlchemyProcessingArtifactStore(
+        db,
+        transcript_artifact_enabled=settings.PROCESSING_TRANSCRIPT_ARTIFACT_ENABLED,
+    )
+    storage_client = get_object_storage_client()
+    transcriber = build_transcription_provider()
+    transcript_cache = None
+    if settings.PROCESSING_TRANSCRIPT_CACHE_ENABLED:
+        # Separate session so cache bookkeeping never shares a transaction with artifact persistence.
+        transcript_cache = SqlAlchemyProcessingTranscriptCache(
+            SessionLocal(),
+            storage_client,
+            transcription_profile=transcriber.cache_profile,
+            max_bytes=settings.PROCESSING_TRANSCRIPT_CACHE_MAX_BYTES,
+        )
     return ExecuteProcessingApplicationService(
-        media_source=ObjectStorageProcessingMediaSource(get_object_storage_client()),
-        transcriber=WhisperProcessingTranscriptionProvider(),
+        media_source=build_media_source(storage_client),
+        transcriber=transcriber,
         artifact_store=store,
         result_sink=RecordProcessingResultApplicationService(
             SqlAlchemyProcessingResultOutboxRepository(db)
         ),
+        transcript_cache=transcript_cache,
     )
 
 
 def build_direct_upload_execution_service() -> ExecuteDirectUploadProcessingApplicationService:
     return ExecuteDirectUploadProcessingApplicationService(
-        transcriber=WhisperProcessingTranscriptionProvider(),
+        transcriber=build_transcription_provider(),
         artifact_store=SqlAlchemyDirectUploadArtifactStore(SessionLocal()),
     )
@@ -2,12 +2,14 @@ import json
 import logging
 import time
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
 from sqlalchemy.orm import Session
 
 from app import models as _models  # noqa: F401
 from app.config.settings import settings
+from app.consumers.keyed_worker_pool import KeyedWorkerPool, PartitionOffsetTracker
 from app.core.database import SessionLocal
 from app.events.asset_processing import EventValidationError, parse_asset_processing_requested_event
 from app.processing.application.dispatch import ProcessingAcceptance
@@ -72,6 +74,46 @@ def handle_asset_processing_message(raw_value: bytes | str | dict, db: Session)
     )
 
 
+def handle_asset_processing_messages(
+    raw_values: list[bytes | str | dict],
+    db: Session,
+) -> list[MessageHandlingResult]:
+    """Validate a batch, then accept every valid event through one bulk dispatch."""
+    results: list[MessageHandlingResult | None] = []
+    commands = []
+    for raw_value in raw_values:
+        try:
+            event = parse_asset_processing_requested_event(raw_value)
+        except EventValidationError as exc:
+            logger.warning(
+                "rejecting asset processing event context=%s reason=%s",
+                _decode_event_context(raw_value),
+                exc,
+            )
+            results.append(MessageHandlingResult(accepted=False, duplicate=False, rejected=True, reason=str(exc)))
+            continue
+        results.append(None)
+        commands.append(event.to_processing_command())
+
+    acceptances = {
+        acceptance.event_id: acceptance
+        for acceptance in (build_processing_dispatch_service(db).dispatch_many(commands) if commands else ())
+    }
+    accepted = iter(commands)
+    for index, result in enumerate(results):
+        if result is not None:
+            continue
+        acceptance = acceptances[next(accepted).event_id]
+        results[index] = MessageHandlingResult(
+            accepted=acceptance.accepted,
+            duplicate=acceptance.duplicate,
+            rejected=False,
+            event_id=acceptance.event_id,
+            celery_task_id=acceptance.task_id,
+        )
+    return results
+
+
 class AssetProcessingKafkaConsumer:
     def __init__(self) -> None:
         self._stopped = False
@@ -103,23 +145,12 @@ class AssetProcessingKafkaConsumer:
             try:
                 consumer = self.build_consumer()
                 logger.info("asset processing Kafka consumer connected")
-                for message in consumer:
-                    if self._stopped:
-                        break
-
-                    db = SessionLocal()
-                    try:
-                        result = handle_asset_processing_message(message.value, db)
-                        if result.rejected:
-                            logger.warning(
-                                "committing rejected event offset to avoid blocking the partition reason=%s",
-                                result.reason,
-                            )
-                        consumer.commit()
-                    except Exception:
-                        logger.exception("asset processing handoff or offset commit failed; offset left uncommitted")
-                    finally:
-                        db.close()
+                if settings.KAFKA_CONSUMER_CONCURRENCY > 1:
+                    self._consume_keyed(consumer)
+                elif settings.KAFKA_CONSUMER_BATCH_ENABLED:
+                    self._consume_batches(consumer)
+                else:
+                    self._consume_messages(consumer)
             except Exception:
                 if self._stopped:
                     break
@@ -132,6 +163,186 @@ class AssetProcessingKafkaConsumer:
                 if consumer is not None:
                     consumer.close()
 
+    def _consume_messages(self, consumer) -> None:
+        for message in consumer:
+            if self._stopped:
+                break
+
+            db = SessionLocal()
+            try:
+                result = handle_asset_processing_message(message.value, db)
+                if result.rejected:
+                    logger.warning(
+                        "committing rejected event offset to avoid blocking the partition reason=%s",
+                        result.reason,
+                    )
+                consumer.commit()
+            except Exception:
+                logger.exception("asset processing handoff or offset commit failed; offset left uncommitted")
+            finally:
+                db.close()
+
+    def _consume_batches(self, consumer) -> None:
+        """Hand off each polled batch through one session and one bulk dispatch, then commit once.
+
+        If any handoff or the commit fails, every partition in the batch is rewound to its first
+        polled offset so the whole batch is redelivered; dispatch is idempotent by `eventId`.
+        """
+        while not self._stopped:
+            records = consumer.poll(
+                timeout_ms=settings.KAFKA_CONSUMER_POLL_TIMEOUT_MS,
+                max_records=settings.KAFKA_CONSUMER_BATCH_MAX_RECORDS,
+            )
+            if not records:
+                continue
+            db = SessionLocal()
+            try:
+                results = handle_asset_processing_messages(
+                    [message.value for messages in records.values() for message in messages],
+                    db,
+                )
+                rejected = sum(result.rejected for result in results)
+                if rejected:
+                    logger.warning(
+                        "committing %s rejected event offsets to avoid blocking the partition",
+                        rejected,
+                    )
+                consumer.commit()
+            except Exception:
+                logger.exception(
+                    "asset processing batch handoff or offset commit failed; rewinding %s partitions",
+                    len(records),
+                )
+                db.rollback()
+                for partition, messages in records.items():
+                    consumer.seek(partition, messages[0].offset)
+                time.sleep(settings.KAFKA_RECONNECT_BACKOFF_SECONDS)
+            finally:
+                db.close()
+
+    def _consume_keyed(self, consumer) -> None:
+        """Hand messages to a key-hashed worker pool and commit each partition's contiguous progress.
+
+        Messages for one `aggregateId` always land on the same worker, so they are handed off in
+        offset order while other keys proceed in parallel. Offsets are committed per partition only
+        up to the first message that is still in flight or failed. A failed handoff makes later
+        messages from its partition skip, then the partition is rewound to the failed offset so
+        ordering is preserved on redelivery. Revoked partitions are drained and committed before the
+        rebalance completes.
+        """
+        if settings.KAFKA_CONSUMER_BATCH_ENABLED:
+            logger.warning(
+                "KAFKA_CONSUMER_CONCURRENCY=%s takes precedence; KAFKA_CONSUMER_BATCH_ENABLED and bulk dispatch "
+                "are ignored and each message is handed off individually",
+                settings.KAFKA_CONSUMER_CONCURRENCY,
+            )
+        tracker = PartitionOffsetTracker()
+        pool = KeyedWorkerPool(
+            settings.KAFKA_CONSUMER_CONCURRENCY,
+            partial(_handle_tracked_message, tracker),
+            queue_size=settings.KAFKA_CONSUMER_BATCH_MAX_RECORDS,
+            name="asset-consumer",
+        )
+        consumer.subscribe(
+            topics=[settings.KAFKA_ASSET_PROCESSING_TOPIC],
+            listener=_build_rebalance_listener(consumer, pool, tracker),
+        )
+        try:
+            while not self._stopped:
+                records = consumer.poll(
+                    timeout_ms=settings.KAFKA_CONSUMER_POLL_TIMEOUT_MS,
+                    max_records=settings.KAFKA_CONSUMER_BATCH_MAX_RECORDS,
+                )
+                for partition, messages in records.items():
+                    for message in messages:
+                        tracker.start(partition, message.offset)
+                        pool.submit(_ordering_key(message, partition), (partition, message))
+                _commit_tracked_offsets(consumer, tracker)
+                if tracker.failed_offsets():
+                    # A lower offset of the same partition may still fail while the pool drains, so
+                    # rewind and commit from the post-drain failures only.
+                    pool.drain()
+                    failed = tracker.failed_offsets()
+                    _commit_tracked_offsets(consumer, tracker, failed)
+                    for partition, offset in failed.items():
+                        consumer.seek(partition, offset)
+                    tracker.forget(failed)
+                    logger.warning(
+                        "asset processing handoff failed; rewound %s partitions for redelivery",
+                        len(failed),
+                    )
+                    time.sleep(settings.KAFKA_RECONNECT_BACKOFF_SECONDS)
+        finally:
+            pool.drain()
+            try:
+                _commit_tracked_offsets(consumer, tracker)
+            except Exception:
+                logger.exception("final asset processing offset commit failed; offsets left uncommitted")
+            pool.close()
+
+
+def _ordering_key(message, partition) -> str | bytes:
+    aggregate_id = _decode_event_context(message.value).get("aggregateId")
+    if isinstance(aggregate_id, str) and aggregate_id:
+        return aggregate_id
+    return getattr(message, "key", None) or str(partition)
+
+
+def _handle_tracked_message(tracker: PartitionOffsetTracker, item) -> None:
+    partition, message = item
+    if tracker.failed_before(partition, message.offset):
+        tracker.fail(partition, message.offset)
+        return
+    db = SessionLocal()
+    try:
+        result = handle_asset_processing_message(message.value, db)
+        if result.rejected:
+            logger.warning(
+                "committing rejected event offset to avoid blocking the partition reason=%s",
+                result.reason,
+            )
+        tracker.complete(partition, message.offset)
+    except Exception:
+        logger.exception("asset processing handoff failed; partition will be rewound")
+        tracker.fail(partition, message.offset)
+    finally:
+        db.close()
+
+
+def _commit_tracked_offsets(consumer, tracker: PartitionOffsetTracker, partitions=None) -> None:
+    offsets = tracker.committable(partitions)
+    if not offsets:
+        return
+    from kafka.structs import OffsetAndMetadata
+
+    consumer.commit(
+        offsets={partition: OffsetAndMetadata(offset, None, -1) for partition, offset in offsets.items()}
+    )
+    tracker.mark_committed(offsets)
+
+
+def _build_rebalance_listener(consumer, pool: KeyedWorkerPool, tracker: PartitionOffsetTracker):
+    from kafka import ConsumerRebalanceListener
+
+    class DrainingRebalanceListener(ConsumerRebalanceListener):
+        def on_partitions_revoked(self, revoked):
+            pool.drain()
+            try:
+                _commit_tracked_offsets(consumer, tracker, revoked)
+            except Exception:
+                logger.exception("offset commit for revoked partitions failed; they will be redelivered")
+            tracker.forget(revoked)
+
+        def on_partitions_assigned(self, assigned):
+            logger.info("asset processing Kafka consumer assigned partitions=%s", len(assigned))
+
+        def on_partitions_lost(self, lost):
+            # The group already moved on; committing would fail, so only stop tracking them.
+            pool.drain()
+            tracker.forget(lost)
+
+    return DrainingRebalanceListener()
+
 
 def main() -> None:
     from app.bootstrap.consumer import run_processing_consumer
@@ -0,0 +1,135 @@
+"""Key-ordered parallel handoff and per-partition offset tracking for the asset consumer."""
+from collections import defaultdict
+import logging
+import queue
+import threading
+import zlib
+from typing import Any, Callable, Hashable, Iterable
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class PartitionOffsetTracker:
+    """Track in-flight offsets per partition and report how far each one can be committed.
+
+    A partition is committable up to (not including) its lowest offset that is still in flight or
+    has failed, or one past the highest offset seen once everything completed. Offsets are started
+    in poll order on the consumer thread and completed from worker threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_flight: dict[Hashable, set[int]] = defaultdict(set)
+        self._failed: dict[Hashable, int] = {}
+        self._next_offset: dict[Hashable, int] = {}
+        self._committed: dict[Hashable, int] = {}
+
+    def start(self, partition: Hashable, offset: int) -> None:
+        with self._lock:
+            self._in_flight[partition].add(offset)
+            self._next_offset[partition] = max(self._next_offset.get(partition, 0), offset + 1)
+
+    def complete(self, partition: Hashable, offset: int) -> None:
+        with self._lock:
+            self._in_flight[partition].discard(offset)
+
+    def fail(self, partition: Hashable, offset: int) -> None:
+        with self._lock:
+            self._in_flight[partition].discard(offset)
+            self._failed[partition] = min(self._failed.get(partition, offset), offset)
+
+    def failed_before(self, partition: Hashable, offset: int) -> bool:
+        with self._lock:
+            failed = self._failed.get(partition)
+            return failed is not None and failed < offset
+
+    def failed_offsets(self) -> dict[Hashable, int]:
+        with self._lock:
+            return dict(self._failed)
+
+    def committable(self, partitions: Iterable[Hashable] | None = None) -> dict[Hashable, int]:
+        """Return partitions whose committable offset advanced since the last `mark_committed`."""
+        with self._lock:
+            selected = self._next_offset.keys() if partitions is None else partitions
+            offsets = {}
+            for partition in selected:
+                if partition not in self._next_offset:
+                    continue
+                candidates = [self._next_offset[partition], *self._in_flight[partition]]
+                if partition in self._failed:
+                    candidates.append(self._failed[partition])
+                offset = min(candidates)
+                if offset > self._committed.get(partition, -1):
+                    offsets[partition] = offset
+            return offsets
+
+    def mark_committed(self, offsets: dict[Hashable, int]) -> None:
+        with self._lock:
+            for partition, offset in offsets.items():
+                self._committed[partition] = max(self._committed.get(partition, -1), offset)
+
+    def forget(self, partitions: Iterable[Hashable]) -> None:
+        with self._lock:
+            for partition in partitions:
+                self._in_flight.pop(partition, None)
+                self._failed.pop(partition, None)
+                self._next_offset.pop(partition, None)
+                self._committed.pop(partition, None)
+
+
+class KeyedWorkerPool:
+    """Run `handler` on a fixed set of threads, keeping items with the same key in submit order.
+
+    Each key hashes to one worker's bounded queue, so a slow handoff only delays keys that share
+    its worker, and `submit` blocks once that queue is full to push back on the poll loop.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        handler: Callable[[Any], None],
+        *,
+        queue_size: int = 100,
+        name: str = "keyed-worker",
+    ) -> None:
+        self._handler = handler
+        self._queues = [queue.Queue(maxsize=queue_size) for _ in range(workers)]
+        self._threads = [
+            threading.Thread(target=self._run, args=(work_queue,), name=f"{name}-{index}", daemon=True)
+            for index, work_queue in enumerate(self._queues)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    @property
+    def workers(self) -> int:
+        return len(self._queues)
+
+    def submit(self, key: str | bytes, item: Any) -> None:
+        raw_key = key.encode("utf-8") if isinstance(key, str) else key
+        self._queues[zlib.crc32(raw_key) % len(self._queues)].put(item)
+
+    def drain(self) -> None:
+        """Block until every submitted item has been handled."""
+        for work_queue in self._queues:
+            work_queue.join()
+
+    def close(self) -> None:
+        for work_queue in self._queues:
+            work_queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+
+    def _run(self, work_queue: queue.Queue) -> None:
+        while True:
+            item = work_queue.get()
+            try:
+                if item is _STOP:
+                    return
+                self._handler(item)
+            except Exception:
+                logger.exception("keyed worker handler raised")
+            finally:
+                work_queue.task_done()
@@ -18,9 +18,22 @@ celery_app.conf.update(
     timezone="UTC",
     enable_utc=True,
     worker_prefetch_multiplier=settings.CELERY_WORKER_PREFETCH_MULTIPLIER,
+    result_expires=settings.CELERY_RESULT_EXPIRES_SECONDS,
 )
+if settings.WHISPER_PRELOAD_ENABLED:
+    # Child processes must finish worker_process_init before this timeout; model load takes seconds.
+    celery_app.conf.worker_proc_alive_timeout = settings.WHISPER_PRELOAD_TIMEOUT_SECONDS
 
 
 @worker_process_init.connect
 def initialize_worker_database_schema(**_kwargs) -> None:
     initialize_database_schema()
+
+
+@worker_process_init.connect
+def preload_worker_transcription_model(**_kwargs) -> None:
+    if not settings.WHISPER_PRELOAD_ENABLED:
+        return
+    from app.bootstrap.worker import preload_transcription_model
+
+    preload_transcription_model()
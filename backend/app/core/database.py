@@ -1,4 +1,9 @@
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.config.settings import settings
 
@@ -7,6 +12,11 @@ engine = create_engine(settings.DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+_ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+_async_session_factory = None
+
+DbRunner = Callable[..., Awaitable[Any]]
+
 
 def get_db():
     db = SessionLocal()
@@ -14,3 +24,58 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def async_database_url(url: str) -> str:
+    """Swap the sync driver in DATABASE_URL for its asyncio counterpart (psycopg2 -> asyncpg)."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    return parsed.set(drivername=f"{backend}+{_ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+
+def get_async_session_factory():
+    """Create the async engine on first use so sync-only processes never import the asyncio driver."""
+    global _async_session_factory
+    if _async_session_factory is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        async_engine = create_async_engine(
+            async_database_url(settings.DATABASE_URL),
+            pool_size=settings.DATABASE_ASYNC_POOL_SIZE,
+            max_overflow=settings.DATABASE_ASYNC_MAX_OVERFLOW,
+        )
+        _async_session_factory = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    return _async_session_factory
+
+
+async def get_async_db():
+    async with get_async_session_factory()() as db:
+        yield db
+
+
+async def get_db_runner() -> AsyncIterator[DbRunner]:
+    """Yield `run(fn, *args)`, which calls `fn(session, *args)` with a sync-style ORM session.
+
+    With DATABASE_ASYNC_ENABLED the session is an AsyncSession driven through `run_sync`, so the
+    query runs on the event loop without holding a threadpool slot. Otherwise `fn` runs on the
+    threadpool with a regular session, as before. Keep `fn` to the database reads: in async mode it
+    runs on the event loop, so serialization and decoding belong on the threadpool.
+    """
+    if settings.DATABASE_ASYNC_ENABLED:
+        async for async_db in get_async_db():
+
+            async def run_async(fn: Callable[..., Any], *args: Any) -> Any:
+                return await async_db.run_sync(fn, *args)
+
+            yield run_async
+        return
+
+    db = SessionLocal()
+
+    async def run_in_pool(fn: Callable[..., Any], *args: Any) -> Any:
+        return await run_in_threadpool(fn, db, *args)
+
+    try:
+        yield run_in_pool
+    finally:
+        await run_in_threadpool(db.close)
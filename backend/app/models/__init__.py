@@ -1,3 +1,9 @@
 from .video import Video
 from .transcript import Transcript
-from .processing_request import ProcessingOutboxEvent, ProcessingRequest, ProcessingRequestTranscript
+from .processing_request import (
+    ProcessingOutboxEvent,
+    ProcessingRequest,
+    ProcessingRequestTranscript,
+    ProcessingTranscriptArtifact,
+    ProcessingTranscriptCacheEntry,
+)
@@ -7,6 +7,7 @@ from sqlalchemy import (
     Integer,
     Index,
     JSON,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
@@ -77,6 +78,24 @@ class ProcessingRequestTranscript(Base):
     processing_request = relationship("ProcessingRequest", back_populates="transcripts")
 
 
+class ProcessingTranscriptArtifact(Base):
+    """Precomputed, compressed transcript-rows response; `processing_request_transcripts` stays authoritative."""
+
+    __tablename__ = "processing_transcript_artifacts"
+
+    processing_request_event_id = Column(
+        String(64),
+        ForeignKey("processing_requests.event_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    content_type = Column(String(64), nullable=False)
+    content_encoding = Column(String(16), nullable=False)
+    payload = Column(LargeBinary, nullable=False)
+    segment_count = Column(Integer, nullable=False)
+    size_bytes = Column(BigInteger, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
 class ProcessingOutboxEvent(Base):
     __tablename__ = "processing_outbox_events"
 
@@ -138,3 +157,16 @@ class ProcessingOutboxEvent(Base):
             "created_at",
         ),
     )
+
+
+class ProcessingTranscriptCacheEntry(Base):
+    __tablename__ = "processing_transcript_cache"
+
+    cache_key = Column(String(64), primary_key=True)
+    transcription_profile = Column(String(255), nullable=False)
+    rows = Column(JSON, nullable=False)
+    segment_count = Column(Integer, nullable=False)
+    size_bytes = Column(BigInteger, nullable=False)
+    hit_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_accessed_at = Column(DateTime(timezone=True), nullable=False, index=True)
@@ -1,5 +1,6 @@
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 
+from app.processing.adapters.queue_routing import ProcessingQueueRoutingPolicy
 from app.processing.domain.models import ProcessingExecutionCommand
 from app.processing.ports.task_dispatcher import ProcessingDispatch
 
@@ -32,9 +33,19 @@ def decode_processing_task_payload(payload: dict) -> ProcessingExecutionCommand:
     )
 
 
+def processing_task_id(command: ProcessingExecutionCommand) -> str:
+    return f"asset-processing-{command.event_id}"
+
+
 class CeleryProcessingTaskDispatcher:
-    def __init__(self, enqueue: Callable[..., object] | None = None) -> None:
+    def __init__(
+        self,
+        enqueue: Callable[..., object] | None = None,
+        *,
+        queue_routing: ProcessingQueueRoutingPolicy | None = None,
+    ) -> None:
         self._enqueue = enqueue
+        self._queue_routing = queue_routing
 
     def dispatch(self, command: ProcessingExecutionCommand) -> ProcessingDispatch:
         if self._enqueue is None:
@@ -43,6 +54,39 @@ class CeleryProcessingTaskDispatcher:
             enqueue = process_asset_object_task.apply_async
         else:
             enqueue = self._enqueue
-        task_id = f"asset-processing-{command.event_id}"
-        result = enqueue(args=[encode_processing_task_payload(command)], task_id=task_id)
+        task_id = processing_task_id(command)
+        result = enqueue(
+            args=[encode_processing_task_payload(command)],
+            task_id=task_id,
+            **self._routing_options(command),
+        )
         return ProcessingDispatch(task_id=getattr(result, "id", task_id))
+
+    def dispatch_many(self, commands: Sequence[ProcessingExecutionCommand]) -> tuple[ProcessingDispatch, ...]:
+        """Publish all tasks as one Celery group so they share a producer and broker connection."""
+        if not commands:
+            return ()
+        if self._enqueue is not None:
+            return tuple(self.dispatch(command) for command in commands)
+        from celery import group
+
+        from app.tasks.video_tasks import process_asset_object_task
+
+        signatures = [
+            process_asset_object_task.signature(
+                args=[encode_processing_task_payload(command)],
+                task_id=processing_task_id(command),
+                **self._routing_options(command),
+            )
+            for command in commands
+        ]
+        results = group(signatures).apply_async()
+        return tuple(
+            ProcessingDispatch(task_id=getattr(result, "id", processing_task_id(command)))
+            for command, result in zip(commands, results.results)
+        )
+
+    def _routing_options(self, command: ProcessingExecutionCommand) -> dict:
+        if self._queue_routing is None:
+            return {}
+        return {"queue": self._queue_routing.select(command)}
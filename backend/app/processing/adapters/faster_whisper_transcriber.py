@@ -0,0 +1,41 @@
+from typing import Any
+
+from app.processing.adapters.long_media import LongMediaTranscriptionPolicy
+from app.processing.adapters.model_selection import TranscriptionModelSelectionPolicy
+from app.processing.adapters.voice_activity import VoiceActivityPolicy
+from app.processing.adapters.whisper_transcriber import WhisperProcessingTranscriptionProvider
+from app.services.video_processing import get_faster_whisper_model, transcribe_audio_with_faster_whisper
+
+
+class FasterWhisperProcessingTranscriptionProvider(WhisperProcessingTranscriptionProvider):
+    """Whisper pipeline backed by an int8-quantized CTranslate2 model on CPU.
+
+    Decoding, long-media windowing, and `normalize_whisper_result` are inherited, so both
+    engines produce identical transcript row shapes.
+    """
+
+    engine = "faster-whisper"
+    engine_distribution = "faster-whisper"
+
+    def __init__(
+        self,
+        *,
+        compute_type: str = "int8",
+        audio_decode_mode: str = "file",
+        long_media: LongMediaTranscriptionPolicy | None = None,
+        voice_activity: VoiceActivityPolicy | None = None,
+        model_selection: TranscriptionModelSelectionPolicy | None = None,
+    ) -> None:
+        super().__init__(
+            audio_decode_mode=audio_decode_mode,
+            long_media=long_media,
+            voice_activity=voice_activity,
+            model_selection=model_selection,
+        )
+        self.compute_type = compute_type
+
+    def _transcribe_single(self, audio, model_name: str) -> dict[str, Any] | None:
+        return transcribe_audio_with_faster_whisper(audio, compute_type=self.compute_type, model_name=model_name)
+
+    def _load_model(self, model_name: str) -> None:
+        get_faster_whisper_model(model_name, compute_type=self.compute_type)
@@ -0,0 +1,119 @@
+"""Parallel windowed transcription for long media."""
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+import threading
+from typing import Any
+
+from app.services.audio_segmentation import AudioWindow, is_segment_timestamp, plan_transcription_windows
+from app.services.video_processing import (
+    DEFAULT_WHISPER_MODEL_NAME,
+    WHISPER_SAMPLE_RATE,
+    transcribe_audio_with_faster_whisper,
+    transcribe_audio_with_whisper,
+)
+
+
+@dataclass(frozen=True)
+class LongMediaTranscriptionPolicy:
+    min_duration_seconds: int
+    workers: int
+    window_seconds: int
+    overlap_seconds: int
+
+
+# openai-whisper installs kv-cache hooks on the shared model for each call, so its calls cannot
+# overlap; torch already spreads one call across the cores. faster-whisper runs windows concurrently.
+_WHISPER_TRANSCRIBE_LOCK = threading.Lock()
+
+
+def _transcribe_window(engine: str, model_name: str, compute_type: str | None, samples) -> dict[str, Any]:
+    if engine == "faster-whisper":
+        result = transcribe_audio_with_faster_whisper(
+            samples,
+            compute_type=compute_type or "int8",
+            model_name=model_name,
+        )
+    else:
+        with _WHISPER_TRANSCRIBE_LOCK:
+            result = transcribe_audio_with_whisper(samples, model_name=model_name)
+    if result is None:
+        raise RuntimeError("Whisper transcription failed for a long-media window")
+    return result
+
+
+def stitch_window_results(
+    windows: tuple[AudioWindow, ...],
+    results: list[dict[str, Any]],
+    sample_rate: int = WHISPER_SAMPLE_RATE,
+) -> dict[str, Any]:
+    """Shift window segments onto the media timeline and keep each one only in the window that owns it.
+
+    A timed segment is owned by the window whose keep range contains its midpoint, so a phrase
+    transcribed twice inside an overlap is emitted once. Untimed text cannot be placed in an owned
+    range, so it is kept only when there is a single window; with neighbours it would repeat their
+    overlap text.
+    """
+    segments: list[dict[str, Any]] = []
+    last_index = len(windows) - 1
+    keep_untimed = last_index == 0
+    for index, (window, result) in enumerate(zip(windows, results)):
+        offset = window.start_sample / sample_rate
+        keep_start = window.keep_start_sample / sample_rate
+        keep_end = window.keep_end_sample / sample_rate
+        raw_segments = result.get("segments")
+        if not raw_segments:
+            text = str(result.get("text") or "").strip()
+            if text and keep_untimed:
+                segments.append({"text": text})
+            continue
+        for raw_segment in raw_segments:
+            if not isinstance(raw_segment, dict):
+                if keep_untimed:
+                    segments.append(raw_segment)
+                continue
+            start = raw_segment.get("start")
+            end = raw_segment.get("end")
+            if not (is_segment_timestamp(start) and is_segment_timestamp(end)):
+                if keep_untimed:
+                    segments.append(dict(raw_segment))
+                continue
+            midpoint = offset + (start + end) / 2
+            if midpoint < keep_start or (midpoint >= keep_end and index != last_index):
+                continue
+            segments.append({**raw_segment, "start": start + offset, "end": end + offset})
+
+    text = " ".join(
+        str(segment.get("text") or "").strip() for segment in segments if isinstance(segment, dict)
+    )
+    return {"text": text.strip(), "segments": segments}
+
+
+def transcribe_long_media(
+    samples,
+    policy: LongMediaTranscriptionPolicy,
+    *,
+    engine: str = "whisper",
+    model_name: str = DEFAULT_WHISPER_MODEL_NAME,
+    compute_type: str | None = None,
+) -> tuple[dict[str, Any], int]:
+    """Transcribe silence-aligned overlapping windows on a thread pool; return the stitched result.
+
+    Threads share the process's model registry, so the model is loaded once and stays resident
+    across jobs, and the path works inside a daemonic Celery prefork child, which cannot fork.
+    """
+    windows = plan_transcription_windows(
+        samples,
+        WHISPER_SAMPLE_RATE,
+        window_seconds=policy.window_seconds,
+        overlap_seconds=policy.overlap_seconds,
+    )
+    workers = min(policy.workers, len(windows))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="long-media-window") as pool:
+        results = list(
+            pool.map(
+                partial(_transcribe_window, engine, model_name, compute_type),
+                (samples[window.start_sample:window.end_sample] for window in windows),
+            )
+        )
+    return stitch_window_results(windows, results), len(windows)
@@ -1,31 +1,243 @@
 from contextlib import contextmanager
+from dataclasses import dataclass
+import errno
+import logging
+import os
+from pathlib import Path
 import tempfile
+import threading
 import time
 
 from app.processing.domain.models import ProcessingExecutionCommand
-from app.services.object_storage import ObjectStorageClient
+from app.services.media_cache import LocalMediaCache
+from app.services.object_storage import ObjectChangedError, ObjectStorageClient
 from app.processing.adapters.timing import log_processing_timing
 
+logger = logging.getLogger(__name__)
+STREAM_CHUNK_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class RangedDownloadPolicy:
+    min_size_bytes: int
+    part_size_bytes: int
+    concurrency: int
+
+
+def _file_size(path: str) -> int | None:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return None
+
+
+def _head_etag(head: dict) -> str | None:
+    return str(head.get("ETag") or "").strip('"') or None
+
 
 class ObjectStorageProcessingMediaSource:
-    def __init__(self, client: ObjectStorageClient) -> None:
+    def __init__(
+        self,
+        client: ObjectStorageClient,
+        *,
+        media_cache: LocalMediaCache | None = None,
+        ranged_download: RangedDownloadPolicy | None = None,
+    ) -> None:
         self._client = client
+        self._media_cache = media_cache
+        self._ranged_download = ranged_download
 
     @contextmanager
     def acquire(self, command: ProcessingExecutionCommand):
         with tempfile.TemporaryDirectory(prefix="asset_") as temp_dir:
             started_at = time.perf_counter()
+            media_path, cache_result = self._download(command, temp_dir)
+            elapsed_seconds = time.perf_counter() - started_at
+            fetched_bytes = None if cache_result == "hit" else _file_size(media_path)
+            log_processing_timing(
+                "object_download_ms",
+                elapsed_seconds * 1000,
+                asset_id=command.asset_id,
+                bucket=command.storage_bucket,
+                object_key=command.object_key,
+                cache_result=cache_result,
+                download_mode=(
+                    None if cache_result == "hit"
+                    else "ranged" if self._uses_ranged_download(command) else "single"
+                ),
+                fetched_bytes=fetched_bytes,
+                throughput_mib_s=(
+                    f"{fetched_bytes / elapsed_seconds / (1024 * 1024):.1f}"
+                    if fetched_bytes is not None and elapsed_seconds > 0
+                    else None
+                ),
+            )
+            yield media_path
+
+    def _uses_ranged_download(self, command: ProcessingExecutionCommand) -> bool:
+        policy = self._ranged_download
+        return policy is not None and command.size_bytes >= policy.min_size_bytes
+
+    def _fetch_to_path(
+        self,
+        command: ProcessingExecutionCommand,
+        destination_path: str,
+        head: dict | None = None,
+    ) -> None:
+        # The request's sizeBytes only picks the mode; the ranged fetch sizes itself from HEAD.
+        if self._uses_ranged_download(command):
+            self._client.download_ranged_to_path(
+                bucket=command.storage_bucket,
+                object_key=command.object_key,
+                destination_path=destination_path,
+                part_size_bytes=self._ranged_download.part_size_bytes,
+                concurrency=self._ranged_download.concurrency,
+                head=head,
+            )
+            return
+        self._client.download_to_path(
+            bucket=command.storage_bucket,
+            object_key=command.object_key,
+            destination_path=destination_path,
+            etag=_head_etag(head) if head is not None else None,
+        )
+
+    def _download(self, command: ProcessingExecutionCommand, temp_dir: str) -> tuple[str, str | None]:
+        head = None
+        etag = None
+        if self._media_cache is not None:
+            head = self._client.head_object(bucket=command.storage_bucket, object_key=command.object_key)
+            etag = _head_etag(head)
+        if etag is None and not self._uses_ranged_download(command):
             media_path = self._client.download_to_file(
                 bucket=command.storage_bucket,
                 object_key=command.object_key,
                 destination_dir=temp_dir,
                 filename=command.original_filename,
             )
-            log_processing_timing(
-                "object_download_ms",
-                (time.perf_counter() - started_at) * 1000,
-                asset_id=command.asset_id,
+            return media_path, None
+
+        safe_name = Path(command.original_filename or command.object_key).name or "asset-media"
+        media_path = str(Path(temp_dir) / safe_name)
+        if etag is None:
+            self._fetch_to_path(command, media_path)
+            return media_path, None
+        try:
+            hit = self._media_cache.materialize(
                 bucket=command.storage_bucket,
                 object_key=command.object_key,
+                etag=etag,
+                destination_path=media_path,
+                download=lambda staging_path: self._fetch_to_path(command, staging_path, head),
             )
-            yield media_path
+        except ObjectChangedError:
+            # Overwritten between HEAD and GET: fetch the current bytes without caching them under the old ETag.
+            logger.info(
+                "media cache bypassed for object changed since HEAD bucket=%s object_key=%s",
+                command.storage_bucket,
+                command.object_key,
+            )
+            self._fetch_to_path(command, media_path)
+            return media_path, "miss"
+        return media_path, "hit" if hit else "miss"
+
+
+class StreamingObjectStorageProcessingMediaSource(ObjectStorageProcessingMediaSource):
+    """Stream GetObject bytes through a named pipe so ffmpeg decodes while the object downloads.
+
+    The port still hands out a path: ffmpeg opens the FIFO like a file. Containers that need
+    seeking (MP4/MOV with a trailing index) are not listed as streamable and use the temp file.
+    A GetObject or download error surfaces when the context exits, so a missing object or a
+    truncated stream fails the job instead of yielding a partial transcript.
+    """
+
+    def __init__(
+        self,
+        client: ObjectStorageClient,
+        *,
+        streamable_content_types: frozenset[str],
+        media_cache: LocalMediaCache | None = None,
+        ranged_download: RangedDownloadPolicy | None = None,
+    ) -> None:
+        super().__init__(client, media_cache=media_cache, ranged_download=ranged_download)
+        self._streamable_content_types = streamable_content_types
+
+    def _streams(self, command: ProcessingExecutionCommand) -> bool:
+        content_type = command.content_type.split(";", 1)[0].strip().lower()
+        return hasattr(os, "mkfifo") and content_type in self._streamable_content_types
+
+    @contextmanager
+    def acquire(self, command: ProcessingExecutionCommand):
+        if not self._streams(command):
+            with super().acquire(command) as media_path:
+                yield media_path
+            return
+
+        with tempfile.TemporaryDirectory(prefix="asset_") as temp_dir:
+            safe_name = Path(command.original_filename or command.object_key).name or "asset-media"
+            fifo_path = str(Path(temp_dir) / safe_name)
+            os.mkfifo(fifo_path)
+            errors: list[BaseException] = []
+            pump = threading.Thread(
+                target=self._pump,
+                args=(command, fifo_path, errors),
+                name=f"object-stream-{command.asset_id}",
+                daemon=True,
+            )
+            pump.start()
+            try:
+                yield fifo_path
+            finally:
+                self._release_writer(fifo_path, pump)
+                pump.join()
+            if errors:
+                raise errors[0]
+
+    def _pump(self, command: ProcessingExecutionCommand, fifo_path: str, errors: list[BaseException]) -> None:
+        started_at = time.perf_counter()
+        streamed_bytes = 0
+        try:
+            # Open the writer before GetObject so a failed request still closes the pipe and the
+            # reader sees EOF instead of blocking in open() forever.
+            with open(fifo_path, "wb") as fifo:
+                body = self._client.open_object_stream(bucket=command.storage_bucket, object_key=command.object_key)
+                try:
+                    for chunk in body.iter_chunks(STREAM_CHUNK_BYTES):
+                        fifo.write(chunk)
+                        streamed_bytes += len(chunk)
+                finally:
+                    body.close()
+        except BrokenPipeError:
+            # The reader stopped early (decode failure or an abandoned job); nothing left to deliver.
+            logger.info("media stream reader closed early asset_id=%s", command.asset_id)
+        except Exception as exc:
+            errors.append(exc)
+        log_processing_timing(
+            "object_download_ms",
+            (time.perf_counter() - started_at) * 1000,
+            asset_id=command.asset_id,
+            bucket=command.storage_bucket,
+            object_key=command.object_key,
+            streamed=True,
+            bytes=streamed_bytes,
+        )
+
+    @staticmethod
+    def _release_writer(fifo_path: str, pump: threading.Thread) -> None:
+        """Unblock a writer still waiting in open() when nobody read the pipe to the end.
+
+        Briefly opening a reader lets a pending open() complete; once the reader closes again the
+        writer's next write fails with EPIPE and the pump exits. Repeat until it does, because the
+        writer may reach open() only after a given reader has come and gone.
+        """
+        while pump.is_alive():
+            try:
+                reader = os.open(fifo_path, os.O_RDONLY | os.O_NONBLOCK)
+            except OSError as exc:
+                if exc.errno != errno.ENOENT:
+                    raise
+                return
+            try:
+                pump.join(0.05)
+            finally:
+                os.close(reader)
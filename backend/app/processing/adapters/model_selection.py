@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+
+from app.processing.domain.models import ProcessingExecutionCommand
+
+
+@dataclass(frozen=True)
+class TranscriptionModelSelectionPolicy:
+    """Pick a model per job from the object size, normalized to audio-equivalent bytes.
+
+    Video containers carry far more bytes per second of speech than audio files, so video sizes are
+    divided by `video_bytes_ratio` before they are compared with the audio-oriented thresholds.
+    """
+
+    default_model: str = "base"
+    small_media_model: str | None = None
+    small_media_max_bytes: int = 0
+    large_media_model: str | None = None
+    large_media_min_bytes: int = 0
+    video_bytes_ratio: float = 1.0
+
+    def select(self, command: ProcessingExecutionCommand | None) -> str:
+        if command is None:
+            return self.default_model
+        audio_bytes = command.size_bytes
+        if command.content_type.lower().startswith("video/") and self.video_bytes_ratio > 0:
+            audio_bytes = command.size_bytes / self.video_bytes_ratio
+        if self.small_media_model and audio_bytes <= self.small_media_max_bytes:
+            return self.small_media_model
+        if self.large_media_model and audio_bytes >= self.large_media_min_bytes:
+            return self.large_media_model
+        return self.default_model
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+
+from app.processing.domain.models import ProcessingExecutionCommand
+
+
+@dataclass(frozen=True)
+class ProcessingQueueRoutingPolicy:
+    """Pick a Celery queue per job from the object size, normalized to audio-equivalent bytes.
+
+    Sizes are normalized the same way as model selection: video sizes are divided by
+    `video_bytes_ratio`. Jobs up to `short_max_bytes` go to the short queue, jobs of at least
+    `huge_min_bytes` to the huge queue, and everything in between to the long queue.
+    """
+
+    short_queue: str = "processing.short"
+    long_queue: str = "processing.long"
+    huge_queue: str = "processing.huge"
+    short_max_bytes: int = 0
+    huge_min_bytes: int = 0
+    video_bytes_ratio: float = 1.0
+
+    def select(self, command: ProcessingExecutionCommand) -> str:
+        audio_bytes = command.size_bytes
+        if command.content_type.lower().startswith("video/") and self.video_bytes_ratio > 0:
+            audio_bytes = command.size_bytes / self.video_bytes_ratio
+        if audio_bytes <= self.short_max_bytes:
+            return self.short_queue
+        if audio_bytes >= self.huge_min_bytes:
+            return self.huge_queue
+        return self.long_queue
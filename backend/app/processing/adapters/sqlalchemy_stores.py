@@ -1,7 +1,15 @@
+import csv
+import io
+
+from typing import Sequence
+
+from sqlalchemy import case, func, insert, null, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app import models
+from app.processing.adapters.transcript_artifacts import replace_transcript_artifact
 from app.processing.domain.models import (
     ProcessingFailed,
     ProcessingRequestCommand,
@@ -10,6 +18,26 @@ from app.processing.domain.models import (
 from app.processing.ports.request_repository import ProcessingRequestState
 
 
+def _request_row(command: ProcessingRequestCommand) -> dict:
+    return {
+        "event_id": command.event_id,
+        "asset_id": command.asset_id,
+        "workspace_id": command.workspace_id,
+        "owner_id": command.owner_id,
+        "storage_bucket": command.storage_bucket,
+        "object_key": command.object_key,
+        "original_filename": command.original_filename,
+        "content_type": command.content_type,
+        "size_bytes": command.size_bytes,
+        "status": "accepted",
+        "occurred_at": command.occurred_at,
+        "requested_at": command.requested_at,
+    }
+
+
+_ON_CONFLICT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
 def _request_state(request: models.ProcessingRequest) -> ProcessingRequestState:
     return ProcessingRequestState(
         event_id=request.event_id,
@@ -21,6 +49,45 @@ def _request_state(request: models.ProcessingRequest) -> ProcessingRequestState:
     )
 
 
+_TRANSCRIPT_COLUMNS = ("processing_request_event_id", "segment_index", "text", "start_ms", "end_ms")
+# Below this many rows a multi-row INSERT beats COPY's fixed setup cost.
+COPY_MIN_ROWS = 500
+
+
+def insert_transcript_rows(db: Session, rows: list[dict]) -> None:
+    """Bulk-insert transcript rows inside the session's transaction.
+
+    PostgreSQL (psycopg2) uses COPY FROM STDIN for large artifacts; other cases use a Core
+    executemany INSERT, which SQLAlchemy batches into multi-row VALUES statements.
+    """
+    if not rows:
+        return
+    dialect = db.get_bind().dialect
+    if dialect.name == "postgresql" and dialect.driver == "psycopg2" and len(rows) >= COPY_MIN_ROWS:
+        cursor = db.connection().connection.dbapi_connection.cursor()
+        try:
+            _copy_transcript_rows(cursor, rows)
+        finally:
+            cursor.close()
+        return
+    # Core table insert: the ORM bulk path splits batches whenever a nullable column flips to None.
+    db.execute(insert(models.ProcessingRequestTranscript.__table__), rows)
+
+
+def _copy_transcript_rows(cursor, rows: list[dict]) -> None:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        # Unquoted empty fields are NULL in COPY CSV; FORCE_NOT_NULL keeps text as a string.
+        writer.writerow(["" if row[column] is None else row[column] for column in _TRANSCRIPT_COLUMNS])
+    buffer.seek(0)
+    cursor.copy_expert(
+        f"COPY processing_request_transcripts ({', '.join(_TRANSCRIPT_COLUMNS)}) "
+        "FROM STDIN WITH (FORMAT csv, FORCE_NOT_NULL (text))",
+        buffer,
+    )
+
+
 class SqlAlchemyProcessingRequestRepository:
     def __init__(self, db: Session) -> None:
         self._db = db
@@ -81,10 +148,75 @@ class SqlAlchemyProcessingRequestRepository:
         ).one()
         return _request_state(request)
 
+    def get_or_create_many(
+        self,
+        commands: Sequence[ProcessingRequestCommand],
+    ) -> tuple[ProcessingRequestState, ...]:
+        """Insert missing requests in one statement; return one state per distinct event id.
+
+        PostgreSQL and SQLite use `INSERT ... ON CONFLICT DO NOTHING RETURNING`, so concurrent
+        consumers never fail on a duplicate and only rows this call created come back; the rest are
+        read in one SELECT. Other dialects fall back to `get_or_create` per command.
+        """
+        by_event_id: dict[str, ProcessingRequestCommand] = {}
+        for command in commands:
+            by_event_id.setdefault(command.event_id, command)
+        distinct = list(by_event_id.values())
+        if not distinct:
+            return ()
+        insert_factory = _ON_CONFLICT_INSERTS.get(self._db.get_bind().dialect.name)
+        if insert_factory is None:
+            return tuple(self.get_or_create(command) for command in distinct)
+
+        table = models.ProcessingRequest.__table__
+        created_rows = self._db.execute(
+            insert_factory(table)
+            .values([_request_row(command) for command in distinct])
+            .on_conflict_do_nothing(index_elements=[table.c.event_id])
+            .returning(*table.c)
+        ).all()
+        created = {row.event_id: row for row in created_rows}
+        missing = [command.event_id for command in distinct if command.event_id not in created]
+        existing = {}
+        if missing:
+            existing = {
+                row.event_id: row
+                for row in self._db.execute(select(table).where(table.c.event_id.in_(missing))).all()
+            }
+        self._db.commit()
+        return tuple(
+            _request_state(created.get(command.event_id) or existing[command.event_id])
+            for command in distinct
+        )
+
+    def mark_enqueued_many(self, task_ids: dict[str, str]) -> tuple[ProcessingRequestState, ...]:
+        """Record task ids for many requests in one UPDATE with the same rules as `mark_enqueued`."""
+        if not task_ids:
+            return ()
+        if self._db.get_bind().dialect.name not in _ON_CONFLICT_INSERTS:
+            return tuple(self.mark_enqueued(event_id, task_id) for event_id, task_id in task_ids.items())
+        table = models.ProcessingRequest.__table__
+        task_id = case(task_ids, value=table.c.event_id)
+        accepted = table.c.status == "accepted"
+        rows = self._db.execute(
+            update(table)
+            .where(table.c.event_id.in_(list(task_ids)))
+            .values(
+                celery_task_id=case((accepted, task_id), else_=func.coalesce(table.c.celery_task_id, task_id)),
+                status=case((accepted, "enqueued"), else_=table.c.status),
+                error=case((accepted, null()), else_=table.c.error),
+            )
+            .returning(*table.c)
+        ).all()
+        self._db.commit()
+        states = {row.event_id: _request_state(row) for row in rows}
+        return tuple(states[event_id] for event_id in task_ids if event_id in states)
+
 
 class SqlAlchemyProcessingArtifactStore:
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: Session, *, transcript_artifact_enabled: bool = False) -> None:
         self.db = db
+        self._transcript_artifact_enabled = transcript_artifact_enabled
 
     def claim(self, command) -> str | None:
         updated = (
@@ -107,16 +239,20 @@ class SqlAlchemyProcessingArtifactStore:
         self.db.query(models.ProcessingRequestTranscript).filter(
             models.ProcessingRequestTranscript.processing_request_event_id == outcome.event_id,
         ).delete(synchronize_session=False)
-        for row in outcome.artifact.rows:
-            self.db.add(
-                models.ProcessingRequestTranscript(
-                    processing_request_event_id=outcome.event_id,
-                    segment_index=row.segment_index,
-                    text=row.text,
-                    start_ms=row.start_ms,
-                    end_ms=row.end_ms,
-                )
-            )
+        insert_transcript_rows(
+            self.db,
+            [
+                {
+                    "processing_request_event_id": outcome.event_id,
+                    "segment_index": row.segment_index,
+                    "text": row.text,
+                    "start_ms": row.start_ms,
+                    "end_ms": row.end_ms,
+                }
+                for row in outcome.artifact.rows
+            ],
+        )
+        replace_transcript_artifact(self.db, outcome.event_id, enabled=self._transcript_artifact_enabled)
         request = self.db.query(models.ProcessingRequest).filter(
             models.ProcessingRequest.event_id == outcome.event_id,
         ).one()
@@ -0,0 +1,83 @@
+"""Precomputed gzip JSON transcript-rows artifacts served by the internal transcript endpoint."""
+import gzip
+from collections.abc import Sequence
+
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+
+from app import models
+from app.schemas.transcripts import ProcessingTranscriptRowRead
+
+TRANSCRIPT_ARTIFACT_CONTENT_TYPE = "application/json"
+TRANSCRIPT_ARTIFACT_CONTENT_ENCODING = "gzip"
+
+_ROWS_ADAPTER = TypeAdapter(list[ProcessingTranscriptRowRead])
+
+
+def transcript_row_is_usable(row: models.ProcessingRequestTranscript) -> bool:
+    return not (
+        row.segment_index is None
+        or row.segment_index < 0
+        or not row.text
+        or not row.text.strip()
+        or row.created_at is None
+        or (row.start_ms is None) != (row.end_ms is None)
+        or (row.start_ms is not None and (row.start_ms < 0 or row.end_ms < row.start_ms))
+    )
+
+
+def transcript_row_read(row: models.ProcessingRequestTranscript) -> ProcessingTranscriptRowRead:
+    return ProcessingTranscriptRowRead(
+        id=str(row.id),
+        video_id=row.processing_request_event_id,
+        segment_index=row.segment_index,
+        start_ms=row.start_ms,
+        end_ms=row.end_ms,
+        text=row.text,
+        created_at=row.created_at,
+    )
+
+
+def encode_transcript_artifact(rows: Sequence[models.ProcessingRequestTranscript]) -> bytes:
+    """Serialize rows exactly as the list endpoint does and gzip them (mtime fixed for stable bytes)."""
+    body = _ROWS_ADAPTER.dump_json([transcript_row_read(row) for row in rows])
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+def decode_transcript_artifact(payload: bytes) -> bytes:
+    return gzip.decompress(payload)
+
+
+def replace_transcript_artifact(db: Session, event_id: str, *, enabled: bool) -> None:
+    """Drop any previous artifact and, when enabled, build one from the rows just written.
+
+    Rows are read back so the artifact carries their database ids and timestamps. Nothing is written
+    when a row would fail the endpoint's usability check; the endpoint then reads the row table.
+    """
+    db.query(models.ProcessingTranscriptArtifact).filter(
+        models.ProcessingTranscriptArtifact.processing_request_event_id == event_id,
+    ).delete(synchronize_session=False)
+    if not enabled:
+        return
+    rows = (
+        db.query(models.ProcessingRequestTranscript)
+        .filter(models.ProcessingRequestTranscript.processing_request_event_id == event_id)
+        .order_by(
+            models.ProcessingRequestTranscript.segment_index.asc(),
+            models.ProcessingRequestTranscript.id.asc(),
+        )
+        .all()
+    )
+    if not rows or not all(transcript_row_is_usable(row) for row in rows):
+        return
+    payload = encode_transcript_artifact(rows)
+    db.add(
+        models.ProcessingTranscriptArtifact(
+            processing_request_event_id=event_id,
+            content_type=TRANSCRIPT_ARTIFACT_CONTENT_TYPE,
+            content_encoding=TRANSCRIPT_ARTIFACT_CONTENT_ENCODING,
+            payload=payload,
+            segment_count=len(rows),
+            size_bytes=len(payload),
+        )
+    )
@@ -0,0 +1,113 @@
+from datetime import UTC, datetime
+from typing import Callable
+import hashlib
+import json
+import logging
+import time
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app import models
+from app.processing.adapters.timing import log_processing_timing
+from app.processing.domain.models import ProcessingExecutionCommand, ProcessingTranscriptRow
+from app.services.object_storage import ObjectStorageClient, object_content_fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+class SqlAlchemyProcessingTranscriptCache:
+    """Normalized transcripts keyed by object content identity plus the transcription profile.
+
+    The content identity comes from a HEAD request (stored SHA-256 checksum, else ETag, plus
+    length), so a hit skips the media download as well as transcription. Entries are evicted
+    least-recently-used first once the stored rows exceed `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        storage_client: ObjectStorageClient,
+        *,
+        transcription_profile: Callable[[ProcessingExecutionCommand], str],
+        max_bytes: int,
+        clock=lambda: datetime.now(UTC),
+    ) -> None:
+        self._db = db
+        self._storage_client = storage_client
+        self._transcription_profile = transcription_profile
+        self._profiles_by_key: dict[str, str] = {}
+        self._max_bytes = max_bytes
+        self._clock = clock
+
+    def key_for(self, command: ProcessingExecutionCommand) -> str | None:
+        head = self._storage_client.head_object(bucket=command.storage_bucket, object_key=command.object_key)
+        fingerprint = object_content_fingerprint(head)
+        if fingerprint is None:
+            return None
+        profile = self._transcription_profile(command)
+        identity = f"{profile}\n{fingerprint}\n{head.get('ContentLength')}"
+        key = hashlib.sha256(identity.encode("utf-8")).hexdigest()
+        # Profiles grow with every enabled policy; store a fixed-width digest to group entries by profile.
+        self._profiles_by_key[key] = hashlib.sha256(profile.encode("utf-8")).hexdigest()
+        return key
+
+    def get(self, key: str) -> tuple[ProcessingTranscriptRow, ...] | None:
+        started_at = time.perf_counter()
+        entry = self._db.get(models.ProcessingTranscriptCacheEntry, key)
+        if entry is not None:
+            entry.hit_count += 1
+            entry.last_accessed_at = self._clock()
+            self._db.commit()
+        log_processing_timing(
+            "transcript_cache_lookup_ms",
+            (time.perf_counter() - started_at) * 1000,
+            cache_result="hit" if entry is not None else "miss",
+            segment_count=entry.segment_count if entry is not None else None,
+        )
+        if entry is None:
+            return None
+        return tuple(ProcessingTranscriptRow(*row) for row in entry.rows)
+
+    def put(self, key: str, rows: tuple[ProcessingTranscriptRow, ...]) -> None:
+        payload = [[row.segment_index, row.text, row.start_ms, row.end_ms] for row in rows]
+        size_bytes = len(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+        if size_bytes > self._max_bytes:
+            return
+        try:
+            self._db.merge(
+                models.ProcessingTranscriptCacheEntry(
+                    cache_key=key,
+                    transcription_profile=self._profiles_by_key.pop(key, ""),
+                    rows=payload,
+                    segment_count=len(rows),
+                    size_bytes=size_bytes,
+                    hit_count=0,
+                    last_accessed_at=self._clock(),
+                )
+            )
+            self._db.commit()
+            self._evict_over_budget()
+        except Exception:
+            self._db.rollback()
+            raise
+
+    def _evict_over_budget(self) -> None:
+        entry = models.ProcessingTranscriptCacheEntry
+        total = self._db.query(func.coalesce(func.sum(entry.size_bytes), 0)).scalar()
+        if total <= self._max_bytes:
+            return
+        evicted: list[str] = []
+        for cache_key, size_bytes in (
+            self._db.query(entry.cache_key, entry.size_bytes).order_by(entry.last_accessed_at.asc()).yield_per(500)
+        ):
+            if total <= self._max_bytes:
+                break
+            evicted.append(cache_key)
+            total -= size_bytes
+        self._db.query(entry).filter(entry.cache_key.in_(evicted)).delete(synchronize_session=False)
+        self._db.commit()
+        logger.info("transcript cache evicted entries=%s remaining_bytes=%s", len(evicted), total)
+
+    def close(self) -> None:
+        self._db.close()
@@ -0,0 +1,46 @@
+"""Energy-based voice-activity pre-pass that drops non-speech audio before transcription."""
+from dataclasses import dataclass
+from typing import Any
+
+from app.services.audio_segmentation import (
+    SpeechTimeMap,
+    compact_speech,
+    detect_speech_regions,
+    is_segment_timestamp,
+)
+from app.services.video_processing import WHISPER_SAMPLE_RATE
+
+
+@dataclass(frozen=True)
+class VoiceActivityPolicy:
+    rms_threshold: float
+    min_silence_seconds: float
+    padding_seconds: float
+
+
+def filter_speech(samples, policy: VoiceActivityPolicy) -> tuple[Any, SpeechTimeMap, float]:
+    """Return speech-only samples, the map back to media time, and the fraction of audio skipped."""
+    regions = detect_speech_regions(
+        samples,
+        WHISPER_SAMPLE_RATE,
+        rms_threshold=policy.rms_threshold,
+        min_silence_seconds=policy.min_silence_seconds,
+        padding_seconds=policy.padding_seconds,
+    )
+    compacted, time_map = compact_speech(samples, regions, WHISPER_SAMPLE_RATE)
+    skipped_ratio = 1 - len(compacted) / len(samples) if len(samples) else 0.0
+    return compacted, time_map, skipped_ratio
+
+
+def restore_media_timeline(result: dict[str, Any] | None, time_map: SpeechTimeMap) -> dict[str, Any] | None:
+    """Rewrite segment timestamps from the speech-only timeline onto the original media timeline."""
+    if result is None or not isinstance(result.get("segments"), list):
+        return result
+    segments = []
+    for segment in result["segments"]:
+        if isinstance(segment, dict) and is_segment_timestamp(segment.get("start")) and is_segment_timestamp(segment.get("end")):
+            start = time_map.to_original_seconds(segment["start"])
+            end = time_map.to_original_seconds(segment["end"], is_end=True)
+            segment = {**segment, "start": start, "end": max(start, end)}
+        segments.append(segment)
+    return {**result, "segments": segments}
@@ -1,18 +1,31 @@
+from importlib import metadata
 import math
 import tempfile
 import time
-from numbers import Real
 from typing import Any
 
 from app.processing.domain.models import ProcessingExecutionCommand, ProcessingTranscriptRow
-from app.services.video_processing import extract_audio_to_wav, segment_text, transcribe_audio_with_whisper
+from app.services.audio_segmentation import is_segment_timestamp
+from app.services.video_processing import (
+    audio_duration_seconds,
+    decode_audio_to_array,
+    WHISPER_SAMPLE_RATE,
+    extract_audio_to_wav,
+    get_whisper_model,
+    load_wav_to_array,
+    segment_text,
+    transcribe_audio_with_whisper,
+)
+from app.processing.adapters.long_media import LongMediaTranscriptionPolicy, transcribe_long_media
+from app.processing.adapters.model_selection import TranscriptionModelSelectionPolicy
 from app.processing.adapters.timing import log_processing_timing
+from app.processing.adapters.voice_activity import VoiceActivityPolicy, filter_speech, restore_media_timeline
 
 
 def seconds_to_milliseconds(value: object | None) -> int | None:
     if value is None:
         return None
-    if isinstance(value, bool) or not isinstance(value, Real):
+    if not is_segment_timestamp(value):
         raise ValueError("Whisper segment timestamp must be a finite number")
     seconds = float(value)
     if not math.isfinite(seconds):
@@ -54,6 +67,100 @@ def normalize_whisper_result(result: dict[str, Any] | None) -> tuple[ProcessingT
 
 
 class WhisperProcessingTranscriptionProvider:
+    engine = "whisper"
+    engine_distribution = "openai-whisper"
+    compute_type: str | None = None
+
+    def __init__(
+        self,
+        *,
+        audio_decode_mode: str = "file",
+        long_media: LongMediaTranscriptionPolicy | None = None,
+        voice_activity: VoiceActivityPolicy | None = None,
+        model_selection: TranscriptionModelSelectionPolicy | None = None,
+    ) -> None:
+        self._audio_decode_mode = audio_decode_mode
+        self._long_media = long_media
+        self._voice_activity = voice_activity
+        self._model_selection = model_selection or TranscriptionModelSelectionPolicy()
+
+    def cache_profile(self, command: ProcessingExecutionCommand | None = None) -> str:
+        """Describe every setting that can change this job's transcript, for content-addressed caching."""
+        try:
+            engine_version = metadata.version(self.engine_distribution)
+        except metadata.PackageNotFoundError:
+            engine_version = "unknown"
+        return "|".join(
+            (
+                f"{self.engine}={engine_version}",
+                f"model={self._model_selection.select(command)}",
+                f"compute_type={self.compute_type}",
+                f"long_media={self._long_media_profile()}",
+                f"voice_activity={self._voice_activity_profile()}",
+            )
+        )
+
+    def _long_media_profile(self) -> str:
+        # The pool size only changes throughput, so it is left out of the cache identity.
+        policy = self._long_media
+        if policy is None:
+            return "off"
+        return f"{policy.min_duration_seconds}/{policy.window_seconds}/{policy.overlap_seconds}"
+
+    def _voice_activity_profile(self) -> str:
+        policy = self._voice_activity
+        if policy is None:
+            return "off"
+        return f"{policy.rms_threshold}/{policy.min_silence_seconds}/{policy.padding_seconds}"
+
+    def _decode_audio(self, media_path: str, temp_dir: str):
+        if self._audio_decode_mode == "pipe":
+            return decode_audio_to_array(media_path)
+        return extract_audio_to_wav(media_path, temp_dir=temp_dir)
+
+    def _transcribe_audio(self, audio, model_name: str) -> tuple[dict[str, Any] | None, dict[str, Any]]:
+        if self._long_media is not None:
+            duration_seconds = audio_duration_seconds(audio)
+            if duration_seconds >= self._long_media.min_duration_seconds:
+                samples = load_wav_to_array(audio) if isinstance(audio, str) else audio
+                result, window_count = transcribe_long_media(
+                    samples,
+                    self._long_media,
+                    engine=self.engine,
+                    model_name=model_name,
+                    compute_type=self.compute_type,
+                )
+                return result, {"window_count": window_count, "workers": self._long_media.workers}
+        return self._transcribe_single(audio, model_name), {}
+
+    def _transcribe_single(self, audio, model_name: str) -> dict[str, Any] | None:
+        return transcribe_audio_with_whisper(audio, model_name=model_name)
+
+    def _load_model(self, model_name: str) -> None:
+        get_whisper_model(model_name)
+
+    def warm_up(self, *, clip_seconds: float = 1.0) -> None:
+        """Load the model and run it once on synthetic silence so the first task skips that cost."""
+        import numpy as np
+
+        model_name = self._model_selection.default_model
+        started_at = time.perf_counter()
+        self._load_model(model_name)
+        log_processing_timing(
+            "model_load_ms",
+            (time.perf_counter() - started_at) * 1000,
+            engine=self.engine,
+            model=model_name,
+        )
+        started_at = time.perf_counter()
+        self._transcribe_single(np.zeros(int(WHISPER_SAMPLE_RATE * clip_seconds), dtype=np.float32), model_name)
+        log_processing_timing(
+            "model_warmup_ms",
+            (time.perf_counter() - started_at) * 1000,
+            engine=self.engine,
+            model=model_name,
+        )
+
     def transcribe(
         self,
         media_path: str,
@@ -63,24 +170,48 @@ class WhisperProcessingTranscriptionProvider:
         video_id: int | None = None,
     ) -> tuple[ProcessingTranscriptRow, ...]:
         asset_id = command.asset_id if command else None
+        model_name = self._model_selection.select(command)
         with tempfile.TemporaryDirectory(prefix="vp_") as temp_dir:
             started_at = time.perf_counter()
-            audio_path = extract_audio_to_wav(media_path, temp_dir=temp_dir)
+            audio = self._decode_audio(media_path, temp_dir)
             log_processing_timing(
                 "ffmpeg_ms",
                 (time.perf_counter() - started_at) * 1000,
                 task_id=task_id,
                 video_id=video_id,
                 asset_id=asset_id,
+                decode_mode=self._audio_decode_mode,
             )
+            time_map = None
+            if self._voice_activity is not None:
+                started_at = time.perf_counter()
+                samples = load_wav_to_array(audio) if isinstance(audio, str) else audio
+                audio, time_map, skipped_ratio = filter_speech(samples, self._voice_activity)
+                log_processing_timing(
+                    "vad_ms",
+                    (time.perf_counter() - started_at) * 1000,
+                    task_id=task_id,
+                    video_id=video_id,
+                    asset_id=asset_id,
+                    skipped_audio_ratio=f"{skipped_ratio:.3f}",
+                    speech_region_count=len(time_map.compacted_starts),
+                )
             started_at = time.perf_counter()
-            result = transcribe_audio_with_whisper(audio_path)
+            if time_map is not None and len(audio) == 0:
+                result, transcription_details = {"text": "", "segments": []}, {}
+            else:
+                result, transcription_details = self._transcribe_audio(audio, model_name)
+            if time_map is not None:
+                result = restore_media_timeline(result, time_map)
             log_processing_timing(
                 "whisper_ms",
                 (time.perf_counter() - started_at) * 1000,
                 task_id=task_id,
                 video_id=video_id,
                 asset_id=asset_id,
+                engine=self.engine,
+                model=model_name,
+                **transcription_details,
             )
 
         started_at = time.perf_counter()
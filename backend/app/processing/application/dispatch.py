@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 import logging
+from typing import Sequence
 
 from app.processing.domain.models import ProcessingRequestCommand
 from app.processing.ports.request_repository import ProcessingRequestRepository
@@ -65,3 +66,44 @@ class DispatchProcessingApplicationService:
             task_id=request.task_id,
             status=request.status,
         )
+
+    def dispatch_many(self, commands: Sequence[ProcessingRequestCommand]) -> tuple[ProcessingAcceptance, ...]:
+        """Accept a batch with one insert, one task publish, and one enqueue update.
+
+        Requests still in `accepted` (new, or left behind by an earlier failed handoff) are
+        dispatched; anything further along is reported as a duplicate, exactly as in `dispatch`.
+        Acceptances are returned once per distinct event id, in first-seen order.
+        """
+        requested = self._repository.get_or_create_many(commands)
+        commands_by_event_id = {command.event_id: command for command in commands}
+        pending = [state for state in requested if state.status == "accepted"]
+        dispatched = self._dispatcher.dispatch_many(
+            [commands_by_event_id[state.event_id].to_execution_command() for state in pending]
+        )
+        enqueued = {
+            state.event_id: state
+            for state in self._repository.mark_enqueued_many(
+                {request.event_id: dispatch.task_id for request, dispatch in zip(pending, dispatched)}
+            )
+        }
+        acceptances = []
+        for state in requested:
+            duplicate = state.event_id not in enqueued
+            request = state if duplicate else enqueued[state.event_id]
+            acceptances.append(
+                ProcessingAcceptance(
+                    event_id=request.event_id,
+                    asset_id=request.asset_id,
+                    accepted=True,
+                    duplicate=duplicate,
+                    task_id=request.task_id,
+                    status=request.status,
+                )
+            )
+        logger.info(
+            "asset processing batch accepted events=%s dispatched=%s duplicates=%s",
+            len(acceptances),
+            len(enqueued),
+            len(acceptances) - len(enqueued),
+        )
+        return tuple(acceptances)
@@ -13,6 +13,7 @@ from app.processing.domain.models import (
 from app.processing.ports.artifact_store import DirectUploadArtifactStore, ProcessingArtifactStore
 from app.processing.ports.media_source import ProcessingMediaSource
 from app.processing.ports.result_sink import ProcessingResultSink
+from app.processing.ports.transcript_cache import ProcessingTranscriptCache
 from app.processing.ports.transcription import ProcessingTranscriptionProvider
 
 logger = logging.getLogger(__name__)
@@ -27,12 +28,14 @@ class ExecuteProcessingApplicationService:
         transcriber: ProcessingTranscriptionProvider,
         artifact_store: ProcessingArtifactStore,
         result_sink: ProcessingResultSink,
+        transcript_cache: ProcessingTranscriptCache | None = None,
         clock=lambda: datetime.now(UTC),
     ) -> None:
         self._media_source = media_source
         self._transcriber = transcriber
         self._artifact_store = artifact_store
         self._result_sink = result_sink
+        self._transcript_cache = transcript_cache
         self._clock = clock
 
     def execute(self, command: ProcessingExecutionCommand, *, task_id: str | None = None):
@@ -47,13 +50,18 @@ class ExecuteProcessingApplicationService:
             return ProcessingSkipped(command.event_id, command.asset_id, existing_status)
 
         try:
-            with self._media_source.acquire(command) as media_path:
-                segments = self._transcriber.transcribe(media_path, command=command, task_id=task_id)
+            cache_key, segments = self._cached_transcript(command)
+            cache_hit = segments is not None
+            if not cache_hit:
+                with self._media_source.acquire(command) as media_path:
+                    segments = self._transcriber.transcribe(media_path, command=command, task_id=task_id)
             artifact = ProcessingArtifact(tuple(segments))
             outcome = ProcessingSucceeded(command.event_id, command.asset_id, artifact, self._clock())
             self._artifact_store.persist_success(outcome)
             self._result_sink.record(outcome)
             self._artifact_store.commit()
+            if cache_key is not None and not cache_hit:
+                self._store_cached_transcript(command, cache_key, artifact.rows)
             return outcome
         except Exception as exc:
             logger.exception(
@@ -73,8 +81,47 @@ class ExecuteProcessingApplicationService:
             self._artifact_store.commit()
             return outcome
 
+    def _cached_transcript(
+        self,
+        command: ProcessingExecutionCommand,
+    ) -> tuple[str | None, tuple[ProcessingTranscriptRow, ...] | None]:
+        """Look up a cached transcript; cache faults fall back to a normal run instead of failing it."""
+        if self._transcript_cache is None:
+            return None, None
+        try:
+            cache_key = self._transcript_cache.key_for(command)
+            if cache_key is None:
+                return None, None
+            return cache_key, self._transcript_cache.get(cache_key)
+        except Exception:
+            logger.warning(
+                "transcript cache lookup failed event_id=%s asset_id=%s",
+                command.event_id,
+                command.asset_id,
+                exc_info=True,
+            )
+            return None, None
+
+    def _store_cached_transcript(
+        self,
+        command: ProcessingExecutionCommand,
+        cache_key: str,
+        rows: tuple[ProcessingTranscriptRow, ...],
+    ) -> None:
+        try:
+            self._transcript_cache.put(cache_key, rows)
+        except Exception:
+            logger.warning(
+                "transcript cache store failed event_id=%s asset_id=%s",
+                command.event_id,
+                command.asset_id,
+                exc_info=True,
+            )
+
     def close(self) -> None:
         self._artifact_store.close()
+        if self._transcript_cache is not None:
+            self._transcript_cache.close()
 
 
 class ExecuteDirectUploadProcessingApplicationService:
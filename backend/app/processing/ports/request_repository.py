@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Protocol, Sequence
 
 from app.processing.domain.models import ProcessingRequestCommand
 
@@ -20,3 +20,13 @@ class ProcessingRequestRepository(Protocol):
 
     def mark_enqueued(self, event_id: str, task_id: str) -> ProcessingRequestState:
         ...
+
+    def get_or_create_many(
+        self,
+        commands: Sequence[ProcessingRequestCommand],
+    ) -> tuple[ProcessingRequestState, ...]:
+        """Return one state per distinct event id, in first-seen order."""
+        ...
+
+    def mark_enqueued_many(self, task_ids: dict[str, str]) -> tuple[ProcessingRequestState, ...]:
+        ...
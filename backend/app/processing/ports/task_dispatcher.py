@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Protocol, Sequence
 
 from app.processing.domain.models import ProcessingExecutionCommand
 
@@ -12,3 +12,6 @@ class ProcessingDispatch:
 class ProcessingTaskDispatcher(Protocol):
     def dispatch(self, command: ProcessingExecutionCommand) -> ProcessingDispatch:
         ...
+
+    def dispatch_many(self, commands: Sequence[ProcessingExecutionCommand]) -> tuple[ProcessingDispatch, ...]:
+        ...
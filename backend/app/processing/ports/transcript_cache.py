@@ -0,0 +1,18 @@
+from typing import Protocol
+
+from app.processing.domain.models import ProcessingExecutionCommand, ProcessingTranscriptRow
+
+
+class ProcessingTranscriptCache(Protocol):
+    def key_for(self, command: ProcessingExecutionCommand) -> str | None:
+        """Return a key for the media content and transcription profile, or None when unknown."""
+        ...
+
+    def get(self, key: str) -> tuple[ProcessingTranscriptRow, ...] | None:
+        ...
+
+    def put(self, key: str, rows: tuple[ProcessingTranscriptRow, ...]) -> None:
+        ...
+
+    def close(self) -> None:
+        ...
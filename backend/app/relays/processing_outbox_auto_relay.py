@@ -5,12 +5,14 @@ from threading import Event
 
 from app import models as _models  # noqa: F401
 from app.bootstrap.relay import (
+    build_adaptive_relay_schedule,
+    build_result_outbox_listener,
     build_result_publisher,
     build_result_reconciliation_service,
     build_result_relay_service,
 )
 from app.config.settings import settings
-from app.core.database import SessionLocal
+from app.core.database import SessionLocal, engine
 from app.core.schema import initialize_database_schema
 
 logger = logging.getLogger(__name__)
@@ -37,7 +39,7 @@ def _auto_relay_configuration_is_valid() -> bool:
     return True
 
 
-def _run_iteration(db, publisher, *, run_recovery: bool):
+def _run_iteration(db, publisher, *, run_recovery: bool, batch_size: int | None = None):
     recovery_result = None
     if run_recovery:
         try:
@@ -52,11 +54,49 @@ def _run_iteration(db, publisher, *, run_recovery: bool):
             )
     relay_result = build_result_relay_service(db, publisher).relay_once(
         enabled=settings.PROCESSING_OUTBOX_AUTO_RELAY_ENABLED,
-        batch_size=settings.PROCESSING_OUTBOX_AUTO_RELAY_BATCH_SIZE,
+        batch_size=batch_size or settings.PROCESSING_OUTBOX_AUTO_RELAY_BATCH_SIZE,
     )
     return recovery_result, relay_result
 
 
+def _wait_for_next_iteration(shutdown_requested: Event, listener, timeout: float) -> None:
+    if listener is None:
+        shutdown_requested.wait(timeout)
+    elif not shutdown_requested.is_set():
+        listener.wait(timeout)
+
+
+class _RelayLoopMetrics:
+    """Emit backlog depth and loop rate once per metrics interval."""
+
+    def __init__(self, interval_seconds: float, clock=time.monotonic) -> None:
+        self._interval_seconds = interval_seconds
+        self._clock = clock
+        self._window_started = clock()
+        self._passes = 0
+
+    def record_pass(self, db, publisher, *, batch_size: int, delay_seconds: float) -> None:
+        self._passes += 1
+        elapsed = self._clock() - self._window_started
+        if elapsed < self._interval_seconds:
+            return
+        try:
+            backlog_depth = build_result_relay_service(db, publisher).backlog_depth()
+        except Exception as exc:
+            db.rollback()
+            backlog_depth = None
+            logger.warning("processing outbox backlog query failed category=%s", type(exc).__name__)
+        logger.info(
+            "processing outbox auto relay metrics backlog_depth=%s loop_rate_per_second=%.2f batch_size=%s next_delay_seconds=%.2f",
+            backlog_depth,
+            self._passes / elapsed,
+            batch_size,
+            delay_seconds,
+        )
+        self._window_started = self._clock()
+        self._passes = 0
+
+
 def main() -> int:
     _configure_logging()
     if not _auto_relay_configuration_is_valid():
@@ -64,20 +104,31 @@ def main() -> int:
 
     initialize_database_schema()
     shutdown_requested = Event()
+    listener = build_result_outbox_listener(engine)
 
     def _request_shutdown(signum, _frame) -> None:
         logger.info("processing outbox auto relay shutdown requested signal=%s", signum)
         shutdown_requested.set()
+        if listener is not None:
+            listener.wake()
 
     signal.signal(signal.SIGINT, _request_shutdown)
     signal.signal(signal.SIGTERM, _request_shutdown)
 
     publisher = build_result_publisher()
+    schedule = build_adaptive_relay_schedule()
+    metrics = (
+        _RelayLoopMetrics(settings.PROCESSING_OUTBOX_AUTO_RELAY_METRICS_INTERVAL_SECONDS)
+        if schedule is not None
+        else None
+    )
     try:
         logger.info(
-            "processing outbox auto relay started interval_seconds=%s batch_size=%s recovery_enabled=%s recovery_interval_seconds=%s",
+            "processing outbox auto relay started interval_seconds=%s batch_size=%s listen=%s adaptive=%s recovery_enabled=%s recovery_interval_seconds=%s",
             settings.PROCESSING_OUTBOX_AUTO_RELAY_INTERVAL_SECONDS,
             settings.PROCESSING_OUTBOX_AUTO_RELAY_BATCH_SIZE,
+            listener is not None and listener.listen(),
+            schedule is not None,
             settings.PROCESSING_OUTBOX_RECOVERY_ENABLED,
             settings.PROCESSING_OUTBOX_RECOVERY_INTERVAL_SECONDS,
         )
@@ -92,9 +143,27 @@ def main() -> int:
                 next_recovery_deadline = (
                     monotonic_now + settings.PROCESSING_OUTBOX_RECOVERY_INTERVAL_SECONDS
                 )
+            batch_size = schedule.batch_size if schedule is not None else None
+            delay_seconds = float(settings.PROCESSING_OUTBOX_AUTO_RELAY_INTERVAL_SECONDS)
             db = SessionLocal()
             try:
-                recovery_result, result = _run_iteration(db, publisher, run_recovery=run_recovery)
+                started = time.perf_counter()
+                recovery_result, result = _run_iteration(
+                    db,
+                    publisher,
+                    run_recovery=run_recovery,
+                    batch_size=batch_size,
+                )
+                if schedule is not None:
+                    # A pass that also ran recovery is not a clean latency sample for batch sizing.
+                    elapsed_seconds = None if run_recovery else time.perf_counter() - started
+                    delay_seconds = schedule.observe(result, elapsed_seconds)
+                    metrics.record_pass(
+                        db,
+                        publisher,
+                        batch_size=schedule.batch_size,
+                        delay_seconds=delay_seconds,
+                    )
             finally:
                 db.close()
 
@@ -116,11 +185,14 @@ def main() -> int:
                     result.skipped,
                 )
 
-            shutdown_requested.wait(settings.PROCESSING_OUTBOX_AUTO_RELAY_INTERVAL_SECONDS)
+            if delay_seconds > 0:
+                _wait_for_next_iteration(shutdown_requested, listener, delay_seconds)
     finally:
         close = getattr(publisher, "close", None)
         if close is not None:
             close()
+        if listener is not None:
+            listener.close()
         logger.info("processing outbox auto relay stopped")
 
     return 0
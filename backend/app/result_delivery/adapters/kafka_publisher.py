@@ -1,6 +1,7 @@
 import json
 import logging
-from typing import Any
+import time
+from typing import Any, Sequence
 
 from app.config.settings import settings
 from app.result_delivery.adapters.event_codec import ProcessingResultEventCodec
@@ -21,6 +22,17 @@ class DisabledProcessingResultPublisher:
             "processing result publisher is disabled; set PROCESSING_RESULT_PUBLISHER_ENABLED=true"
         )
 
+    def publish_batch(
+        self,
+        events: Sequence[ProcessingResultEvent],
+    ) -> tuple[ProcessingResultPublisherError | None, ...]:
+        return tuple(
+            ProcessingResultPublisherDisabledError(
+                "processing result publisher is disabled; set PROCESSING_RESULT_PUBLISHER_ENABLED=true"
+            )
+            for _event in events
+        )
+
 
 class KafkaProcessingResultPublisher:
     def __init__(
@@ -29,11 +41,17 @@ class KafkaProcessingResultPublisher:
         topic: str | None = None,
         bootstrap_servers: list[str] | None = None,
         send_timeout_seconds: float | None = None,
+        linger_ms: int | None = None,
+        batch_size_bytes: int | None = None,
+        compression_type: str | None = None,
         codec: ProcessingResultEventCodec | None = None,
     ) -> None:
         self.topic = topic or settings.KAFKA_PROCESSING_RESULT_TOPIC
         self.bootstrap_servers = bootstrap_servers or settings.KAFKA_BOOTSTRAP_SERVERS_LIST
         self.send_timeout_seconds = send_timeout_seconds or settings.KAFKA_SEND_TIMEOUT_SECONDS
+        self.linger_ms = settings.KAFKA_PRODUCER_LINGER_MS if linger_ms is None else linger_ms
+        self.batch_size_bytes = batch_size_bytes or settings.KAFKA_PRODUCER_BATCH_SIZE_BYTES
+        self.compression_type = compression_type or settings.KAFKA_PRODUCER_COMPRESSION_TYPE
         self._codec = codec or ProcessingResultEventCodec()
         self._producer = None
 
@@ -42,6 +60,9 @@ class KafkaProcessingResultPublisher:
             "bootstrap_servers": self.bootstrap_servers,
             "acks": "all",
             "enable_idempotence": True,
+            "linger_ms": self.linger_ms,
+            "batch_size": self.batch_size_bytes,
+            "compression_type": None if self.compression_type == "none" else self.compression_type,
             "key_serializer": lambda value: value.encode("utf-8"),
             "value_serializer": lambda value: json.dumps(
                 value,
@@ -76,6 +97,64 @@ class KafkaProcessingResultPublisher:
                 f"failed to publish processing outbox event event_id={event.id} topic={self.topic}: {exc}"
             ) from exc
 
+    def publish_batch(
+        self,
+        events: Sequence[ProcessingResultEvent],
+    ) -> tuple[ProcessingResultPublisherError | None, ...]:
+        """Send every event, flush once, then resolve each send into None or a publisher error.
+
+        Results are positional. All sends share one `send_timeout_seconds` deadline, so a stalled
+        broker costs the batch one timeout rather than one per event.
+        """
+        if not events:
+            return ()
+        deadline = time.monotonic() + self.send_timeout_seconds
+        try:
+            producer = self._get_producer()
+        except Exception as exc:
+            return tuple(self._publication_error(event, exc) for event in events)
+        sends: list[Any] = []
+        for event in events:
+            try:
+                envelope = self._codec.encode(event)
+                sends.append(producer.send(self.topic, key=event.event_key, value=envelope))
+            except Exception as exc:
+                sends.append(self._publication_error(event, exc))
+        try:
+            producer.flush(timeout=max(0.0, deadline - time.monotonic()))
+        except Exception as exc:
+            logger.warning("processing outbox batch flush did not complete: %s", type(exc).__name__)
+        outcomes: list[ProcessingResultPublisherError | None] = []
+        for event, send in zip(events, sends):
+            if isinstance(send, ProcessingResultPublisherError):
+                outcomes.append(send)
+                continue
+            try:
+                metadata = send.get(timeout=max(0.0, deadline - time.monotonic()))
+            except Exception as exc:
+                outcomes.append(self._publication_error(event, exc))
+                continue
+            logger.info(
+                "published processing outbox event event_id=%s event_type=%s topic=%s partition=%s offset=%s",
+                event.id,
+                event.event_type,
+                metadata.topic,
+                metadata.partition,
+                metadata.offset,
+            )
+            outcomes.append(None)
+        return tuple(outcomes)
+
+    def _publication_error(self, event: ProcessingResultEvent, exc: Exception) -> ProcessingResultPublisherError:
+        if isinstance(exc, ProcessingResultPublisherError):
+            return exc
+        translated = _translate_transport_failure(exc)
+        error = translated(
+            f"failed to publish processing outbox event event_id={event.id} topic={self.topic}: {exc}"
+        )
+        error.__cause__ = exc
+        return error
+
     def close(self) -> None:
         if self._producer is not None:
             self._producer.close(timeout=self.send_timeout_seconds)
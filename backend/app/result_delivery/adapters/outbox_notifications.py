@@ -0,0 +1,98 @@
+"""PostgreSQL LISTEN/NOTIFY wakeups for the result outbox relay."""
+import logging
+import os
+import select
+
+logger = logging.getLogger(__name__)
+
+PROCESSING_OUTBOX_NOTIFY_CHANNEL = "processing_outbox_events"
+
+
+class PostgresOutboxNotificationListener:
+    """Block until an outbox NOTIFY arrives, the timeout passes, or `wake()` is called.
+
+    The listener owns one dedicated autocommit connection detached from the engine pool. If that
+    connection fails, the wait degrades to a plain timeout and the next wait reconnects, so the relay
+    keeps its polling interval as a fallback. `wake()` is called from signal handlers, so it takes no
+    lock; `close()` marks the listener closed before closing the pipe, and a later `wake()` does nothing.
+    """
+
+    def __init__(self, engine, *, channel: str = PROCESSING_OUTBOX_NOTIFY_CHANNEL) -> None:
+        self._engine = engine
+        self._channel = channel
+        self._pooled_connection = None
+        self._connection = None
+        self._wake_read, self._wake_write = os.pipe()
+        os.set_blocking(self._wake_read, False)
+        os.set_blocking(self._wake_write, False)
+        self._closed = False
+
+    def listen(self) -> bool:
+        if self._connection is not None:
+            return True
+        try:
+            pooled_connection = self._engine.raw_connection()
+            pooled_connection.detach()
+            connection = pooled_connection.driver_connection
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {self._channel}")
+        except Exception as exc:
+            logger.warning("processing outbox listener unavailable category=%s", type(exc).__name__)
+            return False
+        self._pooled_connection = pooled_connection
+        self._connection = connection
+        return True
+
+    def wait(self, timeout: float) -> bool:
+        """Return True when at least one notification was received."""
+        watched = [self._wake_read]
+        if self.listen():
+            watched.append(self._connection)
+        readable, _, _ = select.select(watched, [], [], timeout)
+        if self._wake_read in readable:
+            self._drain_wake()
+        if self._connection is None or self._connection not in readable:
+            return False
+        try:
+            self._connection.poll()
+        except Exception as exc:
+            logger.warning("processing outbox listener lost its connection category=%s", type(exc).__name__)
+            self._reset()
+            return False
+        notified = bool(self._connection.notifies)
+        self._connection.notifies.clear()
+        return notified
+
+    def wake(self) -> None:
+        if self._closed:
+            return
+        try:
+            os.write(self._wake_write, b"\0")
+        except OSError:
+            # Full pipe (a wake is already pending) or a close that won the race.
+            pass
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._reset()
+        for fd in (self._wake_read, self._wake_write):
+            os.close(fd)
+
+    def _drain_wake(self) -> None:
+        try:
+            while os.read(self._wake_read, 512):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _reset(self) -> None:
+        if self._pooled_connection is not None:
+            try:
+                self._pooled_connection.close()
+            except Exception:
+                pass
+        self._pooled_connection = None
+        self._connection = None
@@ -1,9 +1,11 @@
 from datetime import timedelta
+from typing import Sequence
 
-from sqlalchemy import or_
+from sqlalchemy import and_, case, func, null, or_, select, update
 from sqlalchemy.orm import Session
 
 from app import models
+from app.result_delivery.adapters.outbox_notifications import PROCESSING_OUTBOX_NOTIFY_CHANNEL
 from app.result_delivery.domain.event import ProcessingResultEvent
 from app.result_delivery.domain.failure_classification import (
     PublicationFailureClassification,
@@ -52,28 +54,41 @@ class SqlAlchemyProcessingResultOutboxRepository:
                 attempt_count=0,
             )
         )
+        if self.db.get_bind().dialect.name == "postgresql":
+            # pg_notify is transactional: listeners hear it only if the caller commits the append.
+            self.db.execute(select(func.pg_notify(PROCESSING_OUTBOX_NOTIFY_CHANNEL, event.id)))
         return event
 
-    def select_due_event_ids(self, *, now, limit: int) -> tuple[str, ...]:
-        rows = (
-            self.db.query(models.ProcessingOutboxEvent.id)
-            .filter(models.ProcessingOutboxEvent.status == "pending")
-            .filter(
-                or_(
-                    models.ProcessingOutboxEvent.next_attempt_at.is_(None),
-                    models.ProcessingOutboxEvent.next_attempt_at <= now,
-                )
-            )
-            .order_by(models.ProcessingOutboxEvent.created_at.asc(), models.ProcessingOutboxEvent.id.asc())
+    def claim_due_batch(self, *, now, limit: int) -> tuple[ProcessingResultEvent, ...]:
+        """Move up to `limit` due events to publishing in one statement and return them.
+
+        On PostgreSQL the candidate rows are locked with `FOR UPDATE SKIP LOCKED`, so concurrent
+        relays claim disjoint batches instead of blocking on, or double-claiming, each other's rows.
+        Dialects without row locks ignore the clause and rely on the status guard in the UPDATE.
+        """
+        table = models.ProcessingOutboxEvent.__table__
+        due_ids = (
+            select(table.c.id)
+            .where(table.c.status == "pending")
+            .where(or_(table.c.next_attempt_at.is_(None), table.c.next_attempt_at <= now))
+            .order_by(table.c.created_at.asc(), table.c.id.asc())
             .limit(limit)
-            .all()
+            .with_for_update(skip_locked=True)
         )
-        return tuple(row[0] for row in rows)
+        rows = self.db.execute(
+            update(table)
+            .where(table.c.id.in_(due_ids.scalar_subquery()))
+            .where(table.c.status == "pending")
+            .values(status="publishing", last_error=None, updated_at=now)
+            .returning(*table.c)
+        ).all()
+        self.db.commit()
+        rows.sort(key=lambda row: (row.created_at is None, row.created_at, row.id))
+        return tuple(event_from_model(row) for row in rows)
 
-    def claim(self, event_id: str, *, now) -> ProcessingResultEvent | None:
-        updated = (
-            self.db.query(models.ProcessingOutboxEvent)
-            .filter(models.ProcessingOutboxEvent.id == event_id)
+    def count_due_events(self, *, now) -> int:
+        count = (
+            self.db.query(func.count(models.ProcessingOutboxEvent.id))
             .filter(models.ProcessingOutboxEvent.status == "pending")
             .filter(
                 or_(
@@ -81,43 +96,38 @@ class SqlAlchemyProcessingResultOutboxRepository:
                     models.ProcessingOutboxEvent.next_attempt_at <= now,
                 )
             )
-            .update(
-                {"status": "publishing", "last_error": None, "updated_at": now},
-                synchronize_session=False,
-            )
+            .scalar()
         )
-        self.db.commit()
-        if updated == 0:
-            return None
-        row = self.db.query(models.ProcessingOutboxEvent).filter(
-            models.ProcessingOutboxEvent.id == event_id,
-        ).one()
-        event = event_from_model(row)
-        self.db.expunge(row)
         self.db.rollback()
-        return event
+        return count or 0
 
     def finalize_published(self, event_id: str, *, now) -> bool:
-        row = (
-            self.db.query(models.ProcessingOutboxEvent)
-            .filter(models.ProcessingOutboxEvent.id == event_id)
-            .filter(models.ProcessingOutboxEvent.status == "publishing")
-            .one_or_none()
-        )
-        if row is None:
-            self.db.rollback()
-            return False
-        row.status = "published"
-        row.published_at = now
-        row.next_attempt_at = None
-        row.last_error = None
-        row.failure_disposition = None
-        row.next_recovery_at = None
-        row.last_failure_category = None
-        row.recovery_exhausted_at = None
-        row.updated_at = now
+        return event_id in self.finalize_published_many((event_id,), now=now)
+
+    def finalize_published_many(self, event_ids: Sequence[str], *, now) -> frozenset[str]:
+        """Mark publishing events as published in one statement; return the ids that were still claimed."""
+        if not event_ids:
+            return frozenset()
+        table = models.ProcessingOutboxEvent.__table__
+        rows = self.db.execute(
+            update(table)
+            .where(table.c.id.in_(tuple(event_ids)))
+            .where(table.c.status == "publishing")
+            .values(
+                status="published",
+                published_at=now,
+                next_attempt_at=None,
+                last_error=None,
+                failure_disposition=None,
+                next_recovery_at=None,
+                last_failure_category=None,
+                recovery_exhausted_at=None,
+                updated_at=now,
+            )
+            .returning(table.c.id)
+        ).all()
         self.db.commit()
-        return True
+        return frozenset(row.id for row in rows)
 
     def record_publication_failure(
         self,
@@ -130,44 +140,75 @@ class SqlAlchemyProcessingResultOutboxRepository:
         recovery_max_cycles: int,
         recovery_cooldown_seconds: int,
     ) -> bool | None:
-        row = (
-            self.db.query(models.ProcessingOutboxEvent)
-            .filter(models.ProcessingOutboxEvent.id == event_id)
-            .filter(models.ProcessingOutboxEvent.status == "publishing")
-            .one_or_none()
+        return self.record_publication_failures(
+            ((event_id, classification),),
+            now=now,
+            max_attempts=max_attempts,
+            retry_delay_seconds=retry_delay_seconds,
+            recovery_max_cycles=recovery_max_cycles,
+            recovery_cooldown_seconds=recovery_cooldown_seconds,
+        ).get(event_id)
+
+    def record_publication_failures(
+        self,
+        failures: Sequence[tuple[str, PublicationFailureClassification]],
+        *,
+        now,
+        max_attempts: int,
+        retry_delay_seconds: int,
+        recovery_max_cycles: int,
+        recovery_cooldown_seconds: int,
+    ) -> dict[str, bool]:
+        """Apply the retry/terminal transition to every publishing event in one statement.
+
+        Returns True (retry) or False (terminal failure) per event id; ids whose claim was lost are
+        absent. Per-event classifications are bound through CASE expressions keyed by id.
+        """
+        if not failures:
+            return {}
+        table = models.ProcessingOutboxEvent.__table__
+        category = case(
+            {event_id: classification.safe_category for event_id, classification in failures},
+            value=table.c.id,
         )
-        if row is None:
-            self.db.rollback()
-            return None
-        attempts = (row.attempt_count or 0) + 1
-        row.attempt_count = attempts
-        row.last_error = classification.safe_category
-        row.last_failure_category = classification.safe_category
-        row.updated_at = now
-        row.recovery_exhausted_at = None
-        if attempts >= max_attempts:
-            row.status = "failed"
-            row.next_attempt_at = None
-            recovery_cycles = row.recovery_cycle_count or 0
-            if classification.disposition == PublicationFailureDisposition.TRANSIENT:
-                if recovery_cycles >= recovery_max_cycles:
-                    row.failure_disposition = PublicationFailureDisposition.RECOVERY_EXHAUSTED.value
-                    row.next_recovery_at = None
-                    row.recovery_exhausted_at = now
-                else:
-                    row.failure_disposition = PublicationFailureDisposition.TRANSIENT.value
-                    row.next_recovery_at = now + timedelta(seconds=recovery_cooldown_seconds)
-            else:
-                row.failure_disposition = classification.disposition.value
-                row.next_recovery_at = None
-            self.db.commit()
-            return False
-        row.status = "pending"
-        row.next_attempt_at = now + timedelta(seconds=retry_delay_seconds)
-        row.failure_disposition = None
-        row.next_recovery_at = None
+        disposition = case(
+            {event_id: classification.disposition.value for event_id, classification in failures},
+            value=table.c.id,
+        )
+        attempts = func.coalesce(table.c.attempt_count, 0) + 1
+        terminal = attempts >= max_attempts
+        transient = disposition == PublicationFailureDisposition.TRANSIENT.value
+        exhausted = and_(terminal, transient, func.coalesce(table.c.recovery_cycle_count, 0) >= recovery_max_cycles)
+        recoverable = and_(terminal, transient, func.coalesce(table.c.recovery_cycle_count, 0) < recovery_max_cycles)
+        rows = self.db.execute(
+            update(table)
+            .where(table.c.id.in_(tuple(event_id for event_id, _ in failures)))
+            .where(table.c.status == "publishing")
+            .values(
+                attempt_count=attempts,
+                last_error=category,
+                last_failure_category=category,
+                updated_at=now,
+                status=case((terminal, "failed"), else_="pending"),
+                next_attempt_at=case(
+                    (terminal, null()),
+                    else_=now + timedelta(seconds=retry_delay_seconds),
+                ),
+                failure_disposition=case(
+                    (exhausted, PublicationFailureDisposition.RECOVERY_EXHAUSTED.value),
+                    (terminal, disposition),
+                    else_=null(),
+                ),
+                next_recovery_at=case(
+                    (recoverable, now + timedelta(seconds=recovery_cooldown_seconds)),
+                    else_=null(),
+                ),
+                recovery_exhausted_at=case((exhausted, now), else_=null()),
+            )
+            .returning(table.c.id, table.c.status)
+        ).all()
         self.db.commit()
-        return True
+        return {row.id: row.status == "pending" for row in rows}
 
     def select_recovery_event_ids(self, *, now, limit: int, max_cycles: int) -> tuple[str, ...]:
         rows = (
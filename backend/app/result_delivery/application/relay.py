@@ -45,46 +45,46 @@ class RelayProcessingResultsApplicationService:
         self._policy = policy
         self._clock = clock
 
+    def backlog_depth(self) -> int:
+        return self._repository.count_due_events(now=self._clock())
+
     def relay_once(self, *, enabled: bool, batch_size: int | None = None) -> ProcessingOutboxRelayResult:
         if not enabled:
             logger.warning("processing outbox relay is disabled")
             return ProcessingOutboxRelayResult(disabled=True)
         selected_batch_size = self._policy.batch_size if batch_size is None else batch_size
-        ids = self._repository.select_due_event_ids(now=self._clock(), limit=selected_batch_size)
-        claimed = published = retried = failed = skipped = 0
-        for event_id in ids:
-            event = self._repository.claim(event_id, now=self._clock())
-            if event is None:
-                skipped += 1
+        events = self._repository.claim_due_batch(now=self._clock(), limit=selected_batch_size)
+        claimed = len(events)
+        published = retried = failed = skipped = 0
+        outcomes = self._publisher.publish_batch(events) if events else ()
+        delivered: list[str] = []
+        failures = []
+        for event, error in zip(events, outcomes):
+            if error is None:
+                delivered.append(event.id)
                 continue
-            claimed += 1
-            try:
-                self._publisher.publish(event)
-                if self._repository.finalize_published(event.id, now=self._clock()):
-                    published += 1
-                else:
-                    skipped += 1
-            except Exception as exc:
-                classification = classify_publication_failure(exc)
-                logger.warning(
-                    "processing outbox publish failed disposition=%s category=%s attempt_count=%s",
-                    classification.disposition.value,
-                    classification.safe_category,
-                    event.attempt_count,
-                )
-                retry = self._repository.record_publication_failure(
-                    event.id,
-                    classification=classification,
-                    now=self._clock(),
-                    max_attempts=self._policy.max_attempts,
-                    retry_delay_seconds=self._policy.retry_delay_seconds,
-                    recovery_max_cycles=self._policy.recovery_max_cycles,
-                    recovery_cooldown_seconds=self._policy.recovery_cooldown_seconds,
-                )
-                if retry is None:
-                    skipped += 1
-                elif retry:
-                    retried += 1
-                else:
-                    failed += 1
+            classification = classify_publication_failure(error)
+            logger.warning(
+                "processing outbox publish failed disposition=%s category=%s attempt_count=%s",
+                classification.disposition.value,
+                classification.safe_category,
+                event.attempt_count,
+            )
+            failures.append((event.id, classification))
+        if delivered:
+            finalized = self._repository.finalize_published_many(delivered, now=self._clock())
+            published = len(finalized)
+            skipped += len(delivered) - published
+        if failures:
+            transitions = self._repository.record_publication_failures(
+                failures,
+                now=self._clock(),
+                max_attempts=self._policy.max_attempts,
+                retry_delay_seconds=self._policy.retry_delay_seconds,
+                recovery_max_cycles=self._policy.recovery_max_cycles,
+                recovery_cooldown_seconds=self._policy.recovery_cooldown_seconds,
+            )
+            retried = sum(1 for retry in transitions.values() if retry)
+            failed = len(transitions) - retried
+            skipped += len(failures) - len(transitions)
         return ProcessingOutboxRelayResult(claimed, published, retried, failed, skipped)
@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+
+from app.result_delivery.application.relay import ProcessingOutboxRelayResult
+
+
+@dataclass(frozen=True)
+class AdaptiveRelayPolicy:
+    min_batch_size: int
+    max_batch_size: int
+    min_idle_seconds: float
+    max_idle_seconds: float
+    target_pass_seconds: float
+
+
+class AdaptiveRelaySchedule:
+    """Decide the next relay batch size and how long to wait before the next pass.
+
+    A full batch means more rows are probably due, so the next pass runs immediately. A partial
+    batch drained the backlog and waits the minimum idle delay; each empty pass doubles that delay
+    up to `max_idle_seconds`. Batch size doubles after a full pass that finished within the target
+    latency and halves after a slow pass, staying within the policy bounds.
+    """
+
+    def __init__(self, policy: AdaptiveRelayPolicy) -> None:
+        self._policy = policy
+        self._batch_size = policy.min_batch_size
+        self._idle_seconds = policy.min_idle_seconds
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    def observe(self, result: ProcessingOutboxRelayResult, elapsed_seconds: float | None) -> float:
+        """Record one pass and return the delay in seconds before the next one.
+
+        Pass `elapsed_seconds=None` when the pass time is not a fair latency sample; the batch size
+        is then left unchanged.
+        """
+        policy = self._policy
+        full = result.claimed >= self._batch_size
+        if elapsed_seconds is not None and elapsed_seconds > policy.target_pass_seconds:
+            self._batch_size = max(policy.min_batch_size, self._batch_size // 2)
+        elif elapsed_seconds is not None and full:
+            self._batch_size = min(policy.max_batch_size, self._batch_size * 2)
+
+        if full:
+            self._idle_seconds = policy.min_idle_seconds
+            return 0.0
+        if result.claimed:
+            self._idle_seconds = policy.min_idle_seconds
+            return policy.min_idle_seconds
+        delay = self._idle_seconds
+        self._idle_seconds = min(policy.max_idle_seconds, self._idle_seconds * 2)
+        return delay
@@ -1,8 +1,16 @@
-from typing import Protocol
+from typing import Protocol, Sequence
 
 from app.result_delivery.domain.event import ProcessingResultEvent
+from app.result_delivery.domain.failures import ProcessingResultPublisherError
 
 
 class ProcessingResultPublisher(Protocol):
     def publish(self, event: ProcessingResultEvent) -> None:
         ...
+
+    def publish_batch(
+        self,
+        events: Sequence[ProcessingResultEvent],
+    ) -> tuple[ProcessingResultPublisherError | None, ...]:
+        """Publish events together; return None or the failure for each event, in order."""
+        ...
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Protocol
+from typing import Protocol, Sequence
 
 from app.result_delivery.domain.event import ProcessingResultEvent
 from app.result_delivery.domain.failure_classification import PublicationFailureClassification
@@ -9,15 +9,20 @@ class ProcessingResultOutboxRepository(Protocol):
     def append(self, event: ProcessingResultEvent) -> ProcessingResultEvent:
         ...
 
-    def select_due_event_ids(self, *, now: datetime, limit: int) -> tuple[str, ...]:
+    def count_due_events(self, *, now: datetime) -> int:
         ...
 
-    def claim(self, event_id: str, *, now: datetime) -> ProcessingResultEvent | None:
+    def claim_due_batch(self, *, now: datetime, limit: int) -> tuple[ProcessingResultEvent, ...]:
+        """Atomically claim up to `limit` due events, skipping rows other relays hold."""
         ...
 
     def finalize_published(self, event_id: str, *, now: datetime) -> bool:
         ...
 
+    def finalize_published_many(self, event_ids: Sequence[str], *, now: datetime) -> frozenset[str]:
+        """Return the ids that were still claimed and are now published."""
+        ...
+
     def record_publication_failure(
         self,
         event_id: str,
@@ -32,6 +37,19 @@ class ProcessingResultOutboxRepository(Protocol):
         """Return True for retry, False for terminal failure, and None for lost claim."""
         ...
 
+    def record_publication_failures(
+        self,
+        failures: Sequence[tuple[str, PublicationFailureClassification]],
+        *,
+        now: datetime,
+        max_attempts: int,
+        retry_delay_seconds: int,
+        recovery_max_cycles: int,
+        recovery_cooldown_seconds: int,
+    ) -> dict[str, bool]:
+        """Return True for retry or False for terminal failure per id; lost claims are omitted."""
+        ...
+
     def select_recovery_event_ids(
         self,
         *,
@@ -1,17 +1,32 @@
+from collections.abc import Callable, Iterator
+import hashlib
+import json
 import logging
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, defer
 
 from app import models
-from app.core.database import get_db
+from app.config.settings import settings
+from app.core.database import DbRunner, SessionLocal, get_db, get_db_runner
+from app.processing.adapters.transcript_artifacts import (
+    decode_transcript_artifact,
+    transcript_row_is_usable,
+    transcript_row_read,
+)
 from app.schemas.transcripts import ProcessingTranscriptRowRead
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/internal/processing-requests", tags=["internal-processing"])
 
+MAX_TRANSCRIPT_ROWS_PAGE_SIZE = 1_000
+TRANSCRIPT_ROWS_STREAM_BATCH_SIZE = 500
+NEXT_SEGMENT_INDEX_HEADER = "X-Next-After-Segment-Index"
+
 
 def _normalize_processing_request_id(processing_request_id: str) -> str:
     try:
@@ -21,48 +36,66 @@ def _normalize_processing_request_id(processing_request_id: str) -> str:
         raise HTTPException(status_code=400, detail="Invalid processing request id") from exc
 
 
+def _raise_missing_rows(request: models.ProcessingRequest) -> None:
+    logger.warning(
+        "ready processing request has no transcript artifacts event_id=%s asset_id=%s",
+        request.event_id,
+        request.asset_id,
+    )
+    raise HTTPException(status_code=409, detail="Processing transcript artifacts are not available")
+
+
+def _log_unusable_rows(request: models.ProcessingRequest, row_count: int) -> None:
+    logger.warning(
+        "ready processing request has unusable transcript artifacts event_id=%s asset_id=%s row_count=%s",
+        request.event_id,
+        request.asset_id,
+        row_count,
+    )
+
+
 def _ensure_usable_rows(
     request: models.ProcessingRequest,
     rows: list[models.ProcessingRequestTranscript],
 ) -> None:
     if not rows:
-        logger.warning(
-            "ready processing request has no transcript artifacts event_id=%s asset_id=%s",
-            request.event_id,
-            request.asset_id,
-        )
-        raise HTTPException(status_code=409, detail="Processing transcript artifacts are not available")
-
-    if any(
-        row.segment_index is None
-        or row.segment_index < 0
-        or not row.text
-        or not row.text.strip()
-        or row.created_at is None
-        or (row.start_ms is None) != (row.end_ms is None)
-        or (row.start_ms is not None and (row.start_ms < 0 or row.end_ms < row.start_ms))
-        for row in rows
-    ):
-        logger.warning(
-            "ready processing request has unusable transcript artifacts event_id=%s asset_id=%s row_count=%s",
-            request.event_id,
-            request.asset_id,
-            len(rows),
-        )
+        _raise_missing_rows(request)
+
+    if not all(transcript_row_is_usable(row) for row in rows):
+        _log_unusable_rows(request, len(rows))
         raise HTTPException(status_code=409, detail="Processing transcript artifacts are not usable")
 
 
-@router.get("/{processingRequestId}/transcript-rows", response_model=list[ProcessingTranscriptRowRead])
-def get_processing_request_transcript_rows(
+def _ready_processing_request(
+    db: Session,
     processingRequestId: str,
-    db: Session = Depends(get_db),
-) -> list[ProcessingTranscriptRowRead]:
+    *,
+    with_artifact: bool = False,
+) -> tuple[models.ProcessingRequest, models.ProcessingTranscriptArtifact | None]:
+    """Load a ready request, joining its precomputed artifact in the same primary-key lookup if asked.
+
+    The artifact's payload is deferred, so a conditional request answered with 304 never reads it.
+    """
     normalized_request_id = _normalize_processing_request_id(processingRequestId)
-    request = (
-        db.query(models.ProcessingRequest)
-        .filter(models.ProcessingRequest.event_id == normalized_request_id)
-        .first()
-    )
+    artifact = None
+    if with_artifact:
+        found = (
+            db.query(models.ProcessingRequest, models.ProcessingTranscriptArtifact)
+            .outerjoin(
+                models.ProcessingTranscriptArtifact,
+                models.ProcessingTranscriptArtifact.processing_request_event_id == models.ProcessingRequest.event_id,
+            )
+            .options(defer(models.ProcessingTranscriptArtifact.payload))
+            .filter(models.ProcessingRequest.event_id == normalized_request_id)
+            .first()
+        )
+        request, artifact = found if found is not None else (None, None)
+    else:
+        request = (
+            db.query(models.ProcessingRequest)
+            .filter(models.ProcessingRequest.event_id == normalized_request_id)
+            .first()
+        )
 
     if request is None:
         logger.info(
@@ -87,33 +120,244 @@ def get_processing_request_transcript_rows(
             request.status,
         )
         raise HTTPException(status_code=409, detail="Processing request is not ready")
+    return request, artifact
+
+
+def _transcript_rows_etag(request: models.ProcessingRequest, variant: str) -> str:
+    """Strong ETag for one representation of a ready request's rows; ready rows never change."""
+    updated_at = request.updated_at.isoformat() if request.updated_at is not None else ""
+    version = f"{request.event_id}\n{request.segment_count}\n{updated_at}\n{variant}"
+    return f'"{hashlib.sha256(version.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def _transcript_rows_cache_headers(etag: str) -> dict[str, str]:
+    max_age = settings.PROCESSING_TRANSCRIPT_ROWS_CACHE_MAX_AGE_SECONDS
+    cache_control = f"public, max-age={max_age}, must-revalidate" if max_age > 0 else "no-cache"
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def _not_modified(http_request: Request | None, etag: str) -> bool:
+    if http_request is None:
+        return False
+    if_none_match = http_request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
 
-    rows = (
-        db.query(models.ProcessingRequestTranscript)
-        .filter(models.ProcessingRequestTranscript.processing_request_event_id == request.event_id)
-        .order_by(
-            models.ProcessingRequestTranscript.segment_index.asc(),
-            models.ProcessingRequestTranscript.id.asc(),
+
+def _accepts_encoding(http_request: Request | None, encoding: str) -> bool:
+    if http_request is None:
+        return False
+    for candidate in http_request.headers.get("accept-encoding", "").split(","):
+        name, _, params = candidate.partition(";")
+        if name.strip().lower() != encoding:
+            continue
+        _, _, quality = params.partition("q=")
+        try:
+            return float(quality or 1) > 0
+        except ValueError:
+            return False
+    return False
+
+
+def _transcript_rows_query(db: Session, event_id: str, after_segment_index: int | None):
+    query = db.query(models.ProcessingRequestTranscript).filter(
+        models.ProcessingRequestTranscript.processing_request_event_id == event_id
+    )
+    if after_segment_index is not None:
+        query = query.filter(models.ProcessingRequestTranscript.segment_index > after_segment_index)
+    return query.order_by(
+        models.ProcessingRequestTranscript.segment_index.asc(),
+        models.ProcessingRequestTranscript.id.asc(),
+    )
+
+
+def _validate_page_args(after_segment_index: int | None, limit: int | None) -> None:
+    if after_segment_index is not None and after_segment_index < -1:
+        raise HTTPException(status_code=400, detail="Invalid after_segment_index")
+    if limit is not None and not 1 <= limit <= MAX_TRANSCRIPT_ROWS_PAGE_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"limit must be between 1 and {MAX_TRANSCRIPT_ROWS_PAGE_SIZE}",
         )
-        .all()
+
+
+def _load_transcript_rows(
+    db: Session,
+    processingRequestId: str,
+    after_segment_index: int | None,
+    limit: int | None,
+    response: Response | None,
+    http_request: Request | None,
+) -> Callable[[], Response | list[ProcessingTranscriptRowRead]]:
+    """Run the database reads for one transcript-rows request and return its render step.
+
+    The render step validates rows, builds the response models and decodes the artifact, none of
+    which touch the session, so callers can run it away from the database path.
+    """
+    _validate_page_args(after_segment_index, limit)
+    full_read = after_segment_index is None and limit is None
+    request, artifact = _ready_processing_request(
+        db,
+        processingRequestId,
+        with_artifact=full_read and settings.PROCESSING_TRANSCRIPT_ARTIFACT_ENABLED,
     )
-    _ensure_usable_rows(request, rows)
+    gzip_artifact = artifact is not None and _accepts_encoding(http_request, artifact.content_encoding)
+    variant = f"list:{after_segment_index}:{limit}" + (f":{artifact.content_encoding}" if gzip_artifact else "")
+    cache_headers = _transcript_rows_cache_headers(_transcript_rows_etag(request, variant))
+    if _not_modified(http_request, cache_headers["ETag"]):
+        logger.info(
+            "processing transcript artifacts not modified event_id=%s asset_id=%s",
+            request.event_id,
+            request.asset_id,
+        )
+        return lambda: Response(status_code=304, headers=cache_headers)
 
-    logger.info(
-        "processing transcript artifacts retrieved event_id=%s asset_id=%s row_count=%s",
-        request.event_id,
-        request.asset_id,
-        len(rows),
+    if artifact is not None:
+        payload = artifact.payload
+
+        def render_artifact() -> Response:
+            logger.info(
+                "processing transcript artifact served event_id=%s asset_id=%s row_count=%s encoding=%s",
+                request.event_id,
+                request.asset_id,
+                artifact.segment_count,
+                artifact.content_encoding if gzip_artifact else "identity",
+            )
+            if gzip_artifact:
+                return Response(
+                    content=payload,
+                    media_type=artifact.content_type,
+                    headers={**cache_headers, "Content-Encoding": artifact.content_encoding, "Vary": "Accept-Encoding"},
+                )
+            return Response(
+                content=decode_transcript_artifact(payload),
+                media_type=artifact.content_type,
+                headers={**cache_headers, "Vary": "Accept-Encoding"},
+            )
+
+        return render_artifact
+
+    query = _transcript_rows_query(db, request.event_id, after_segment_index)
+    rows = query.limit(limit).all() if limit is not None else query.all()
+
+    def render_rows() -> list[ProcessingTranscriptRowRead]:
+        if rows or after_segment_index is None:
+            _ensure_usable_rows(request, rows)
+        if response is not None:
+            response.headers.update(cache_headers)
+            if limit is not None and len(rows) == limit:
+                response.headers[NEXT_SEGMENT_INDEX_HEADER] = str(rows[-1].segment_index)
+
+        logger.info(
+            "processing transcript artifacts retrieved event_id=%s asset_id=%s row_count=%s",
+            request.event_id,
+            request.asset_id,
+            len(rows),
+        )
+        return [transcript_row_read(row) for row in rows]
+
+    return render_rows
+
+
+@router.get("/{processingRequestId}/transcript-rows", response_model=list[ProcessingTranscriptRowRead])
+async def read_processing_request_transcript_rows(
+    processingRequestId: str,
+    response: Response,
+    http_request: Request,
+    after_segment_index: int | None = None,
+    limit: int | None = None,
+    run: DbRunner = Depends(get_db_runner),
+):
+    """Return transcript rows in segment order, optionally one keyset page at a time.
+
+    With `limit`, rows after `after_segment_index` are returned and a full page sets the
+    `X-Next-After-Segment-Index` header to the cursor for the next page. A matching
+    `If-None-Match` gets a 304 after the request lookup, without reading any rows. A full
+    (unpaged) read is served from the precomputed artifact when one exists, as gzip bytes when the
+    caller accepts them.
+
+    Only the lookups go through `run`, which is the event loop when async DB access is on; row
+    validation, model building and gzip decoding run on the threadpool so they never block the loop.
+    """
+    render = await run(
+        _load_transcript_rows,
+        processingRequestId,
+        after_segment_index,
+        limit,
+        response,
+        http_request,
     )
-    return [
-        ProcessingTranscriptRowRead(
-            id=str(row.id),
-            video_id=row.processing_request_event_id,
-            segment_index=row.segment_index,
-            start_ms=row.start_ms,
-            end_ms=row.end_ms,
-            text=row.text,
-            created_at=row.created_at,
+    return await run_in_threadpool(render)
+
+
+def _ndjson_transcript_rows(
+    stream_db: Session,
+    request: models.ProcessingRequest,
+    first_row: models.ProcessingRequestTranscript,
+    rows: Iterator[models.ProcessingRequestTranscript],
+) -> Iterator[bytes]:
+    row_count = 0
+    try:
+        row = first_row
+        while row is not None:
+            if not transcript_row_is_usable(row):
+                _log_unusable_rows(request, row_count + 1)
+                yield json.dumps({"error": "Processing transcript artifacts are not usable"}).encode("utf-8") + b"\n"
+                return
+            row_count += 1
+            yield transcript_row_read(row).model_dump_json().encode("utf-8") + b"\n"
+            row = next(rows, None)
+        logger.info(
+            "processing transcript artifacts streamed event_id=%s asset_id=%s row_count=%s",
+            request.event_id,
+            request.asset_id,
+            row_count,
         )
-        for row in rows
-    ]
+    finally:
+        stream_db.close()
+
+
+@router.get("/{processingRequestId}/transcript-rows/stream")
+def stream_processing_request_transcript_rows(
+    processingRequestId: str,
+    db: Session = Depends(get_db),
+    after_segment_index: int | None = None,
+    http_request: Request = None,
+) -> Response:
+    """Stream transcript rows as NDJSON from a server-side cursor, validating each row as it is sent.
+
+    The first row is read before the response starts, so a missing or unusable first row still
+    returns 409. A later unusable row ends the stream with a final `{"error": ...}` line.
+    """
+    _validate_page_args(after_segment_index, None)
+    request, _ = _ready_processing_request(db, processingRequestId)
+    cache_headers = _transcript_rows_cache_headers(_transcript_rows_etag(request, f"stream:{after_segment_index}"))
+    if _not_modified(http_request, cache_headers["ETag"]):
+        return Response(status_code=304, headers=cache_headers)
+
+    # The request-scoped session closes before the body is sent, so the stream owns its own.
+    stream_db = SessionLocal()
+    try:
+        rows = iter(
+            _transcript_rows_query(stream_db, request.event_id, after_segment_index)
+            .execution_options(stream_results=True)
+            .yield_per(TRANSCRIPT_ROWS_STREAM_BATCH_SIZE)
+        )
+        first_row = next(rows, None)
+        if first_row is None:
+            if after_segment_index is None:
+                _raise_missing_rows(request)
+        elif not transcript_row_is_usable(first_row):
+            _log_unusable_rows(request, 1)
+            raise HTTPException(status_code=409, detail="Processing transcript artifacts are not usable")
+    except BaseException:
+        stream_db.close()
+        raise
+
+    return StreamingResponse(
+        _ndjson_transcript_rows(stream_db, request, first_row, rows),
+        media_type="application/x-ndjson",
+        headers=cache_headers,
+    )
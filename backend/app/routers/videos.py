@@ -5,7 +5,7 @@ import logging
 from sqlalchemy.orm import Session
 from typing import List
 
-from app.core.database import get_db
+from app.core.database import DbRunner, get_db, get_db_runner
 from app import models
 from app.schemas import VideoRead
 from app.schemas.transcripts import TranscriptRead
@@ -30,8 +30,28 @@ async def upload_video(
     return await upload_video_compatibility(file=file, title=title, owner_id=owner_id, db=db)
 
 
+def _stored_segments(db: Session, artifact: dict) -> list[str] | None:
+    """Read the segment text a compact task result points at, in segment order."""
+    if artifact.get("type") == "processing_request_transcript":
+        query = (
+            db.query(models.ProcessingRequestTranscript.text)
+            .filter(models.ProcessingRequestTranscript.processing_request_event_id == artifact["processing_request_id"])
+            .order_by(models.ProcessingRequestTranscript.segment_index)
+        )
+    elif artifact.get("type") == "video_transcript":
+        query = (
+            db.query(models.Transcript.text)
+            .filter(models.Transcript.video_id == artifact["video_id"])
+            .order_by(models.Transcript.segment_index)
+        )
+    else:
+        return None
+    return [text for (text,) in query]
+
+
 @router.get("/tasks/{task_id}")
-async def get_task_status(task_id: str):
+async def get_task_status(task_id: str, include_segments: bool = False, run: DbRunner = Depends(get_db_runner)):
+    """Report a Celery task's state; the result-backend lookup stays on the threadpool, segment reads use the DB runner."""
     def _sync_get_task_status():
         res = process_video_task.AsyncResult(task_id)
         state = res.state
@@ -42,24 +62,31 @@ async def get_task_status(task_id: str):
             payload["error"] = str(res.result)
         return payload
 
-    return await run_in_threadpool(_sync_get_task_status)
+    payload = await run_in_threadpool(_sync_get_task_status)
+    result = payload.get("result")
+    if include_segments and isinstance(result, dict) and isinstance(result.get("artifact"), dict):
+        segments = await run(_stored_segments, result["artifact"])
+        if segments is not None:
+            payload["result"] = {**result, "segments": segments}
+    return payload
+
 
 @router.get("/{video_id}", response_model=VideoRead)
-async def get_video(video_id: int, db: Session = Depends(get_db)):
-    def _sync_get_video():
+async def get_video(video_id: int, run: DbRunner = Depends(get_db_runner)):
+    def _sync_get_video(db: Session):
         video = db.query(models.Video).filter(models.Video.id == video_id).first()
         if video is None:
             raise HTTPException(status_code=404, detail="Video not found")
         return video
 
-    return await run_in_threadpool(_sync_get_video)
+    return await run(_sync_get_video)
 
 
 # Get video transcript
 @router.get("/{video_id}/transcript", response_model=List[TranscriptRead])
-async def get_video_transcript(video_id: int, db: Session = Depends(get_db)):
+async def get_video_transcript(video_id: int, run: DbRunner = Depends(get_db_runner)):
     """Get transcript segments for a specific video, ordered by segment index."""
-    def _sync_get_transcript():
+    def _sync_get_transcript(db: Session):
         video = db.query(models.Video).filter(models.Video.id == video_id).first()
         if not video:
             raise HTTPException(status_code=404, detail="Video not found")
@@ -71,4 +98,4 @@ async def get_video_transcript(video_id: int, db: Session = Depends(get_db)):
 
         return query.all()
 
-    return await run_in_threadpool(_sync_get_transcript)
+    return await run(_sync_get_transcript)
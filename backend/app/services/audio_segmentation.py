@@ -0,0 +1,176 @@
+"""Silence-aware window planning and speech detection over decoded 16 kHz mono float32 samples."""
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from numbers import Real
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+ENERGY_FRAME_SECONDS = 0.03
+DEFAULT_CUT_SEARCH_SECONDS = 30.0
+# Roughly -40 dBFS; quieter frames are treated as non-speech.
+DEFAULT_SPEECH_RMS_THRESHOLD = 0.01
+
+
+@dataclass(frozen=True)
+class AudioWindow:
+    """A slice of samples to transcribe and the sub-range whose segments it owns."""
+
+    start_sample: int
+    end_sample: int
+    keep_start_sample: int
+    keep_end_sample: int
+
+
+def is_segment_timestamp(value: object) -> bool:
+    """True for a real-number segment `start`/`end` in seconds; bools are rejected despite being ints."""
+    return isinstance(value, Real) and not isinstance(value, bool)
+
+
+def frame_rms(samples: "np.ndarray", frame_length: int) -> "np.ndarray":
+    import numpy as np
+
+    frame_count = len(samples) // frame_length
+    if frame_count == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = samples[: frame_count * frame_length].reshape(frame_count, frame_length)
+    return np.sqrt(np.einsum("ij,ij->i", frames, frames) / frame_length)
+
+
+def plan_transcription_windows(
+    samples: "np.ndarray",
+    sample_rate: int,
+    *,
+    window_seconds: float,
+    overlap_seconds: float,
+    search_seconds: float = DEFAULT_CUT_SEARCH_SECONDS,
+) -> tuple[AudioWindow, ...]:
+    """Cut audio near the quietest frame around each nominal boundary and add a symmetric overlap."""
+    if window_seconds <= 0:
+        raise ValueError("window_seconds must be positive")
+    if overlap_seconds < 0 or overlap_seconds * 2 >= window_seconds:
+        raise ValueError("overlap_seconds must be >= 0 and less than half of window_seconds")
+
+    sample_count = len(samples)
+    window = int(window_seconds * sample_rate)
+    if sample_count <= window:
+        return (AudioWindow(0, sample_count, 0, sample_count),)
+
+    frame = max(1, int(ENERGY_FRAME_SECONDS * sample_rate))
+    search = int(min(search_seconds, window_seconds / 4) * sample_rate)
+    energies = frame_rms(samples, frame)
+    boundaries = [0]
+    position = 0
+    while sample_count - position > window:
+        nominal = position + window
+        first_frame = max(position + frame, nominal - search) // frame
+        last_frame = min(sample_count - frame, nominal + search) // frame
+        if last_frame <= first_frame:
+            cut = nominal
+        else:
+            quietest = first_frame + int(energies[first_frame:last_frame].argmin())
+            cut = quietest * frame + frame // 2
+        position = max(cut, position + frame)
+        boundaries.append(position)
+    boundaries.append(sample_count)
+
+    overlap = int(overlap_seconds * sample_rate)
+    return tuple(
+        AudioWindow(
+            start_sample=max(0, keep_start - overlap),
+            end_sample=min(sample_count, keep_end + overlap),
+            keep_start_sample=keep_start,
+            keep_end_sample=keep_end,
+        )
+        for keep_start, keep_end in zip(boundaries, boundaries[1:])
+    )
+
+
+@dataclass(frozen=True)
+class SpeechTimeMap:
+    """Maps times on the speech-only timeline back onto the original media timeline."""
+
+    compacted_starts: tuple[int, ...]
+    original_starts: tuple[int, ...]
+    sample_rate: int
+
+    def to_original_seconds(self, seconds: float, *, is_end: bool = False) -> float:
+        if not self.compacted_starts:
+            return seconds
+        sample = seconds * self.sample_rate
+        # An end timestamp sitting exactly on a region seam belongs to the earlier region.
+        locate = bisect_left if is_end else bisect_right
+        index = max(0, locate(self.compacted_starts, sample) - 1)
+        original = self.original_starts[index] + (sample - self.compacted_starts[index])
+        return original / self.sample_rate
+
+
+def detect_speech_regions(
+    samples: "np.ndarray",
+    sample_rate: int,
+    *,
+    rms_threshold: float = DEFAULT_SPEECH_RMS_THRESHOLD,
+    min_silence_seconds: float = 1.0,
+    padding_seconds: float = 0.2,
+) -> tuple[tuple[int, int], ...]:
+    """Return padded `(start_sample, end_sample)` speech regions; shorter silences stay inside regions."""
+    if rms_threshold < 0:
+        raise ValueError("rms_threshold must be >= 0")
+    if min_silence_seconds <= 0:
+        raise ValueError("min_silence_seconds must be positive")
+    if padding_seconds < 0:
+        raise ValueError("padding_seconds must be >= 0")
+
+    import numpy as np
+
+    sample_count = len(samples)
+    frame = max(1, int(ENERGY_FRAME_SECONDS * sample_rate))
+    energies = frame_rms(samples, frame)
+    if sample_count % frame:
+        tail = samples[len(energies) * frame:]
+        energies = np.append(energies, np.sqrt(np.dot(tail, tail) / len(tail)))
+    voiced = np.flatnonzero(energies >= rms_threshold)
+    if len(voiced) == 0:
+        return ()
+
+    min_gap_frames = max(1, int(min_silence_seconds / ENERGY_FRAME_SECONDS))
+    padding = int(padding_seconds * sample_rate)
+    split_points = np.flatnonzero(np.diff(voiced) > min_gap_frames)
+    first_frames = np.concatenate(([voiced[0]], voiced[split_points + 1]))
+    last_frames = np.concatenate((voiced[split_points], [voiced[-1]]))
+
+    regions: list[tuple[int, int]] = []
+    for first, last in zip(first_frames.tolist(), last_frames.tolist()):
+        start = max(0, first * frame - padding)
+        end = min(sample_count, (last + 1) * frame + padding)
+        if regions and start <= regions[-1][1]:
+            regions[-1] = (regions[-1][0], end)
+        else:
+            regions.append((start, end))
+    return tuple(regions)
+
+
+def compact_speech(
+    samples: "np.ndarray",
+    regions: tuple[tuple[int, int], ...],
+    sample_rate: int,
+) -> tuple["np.ndarray", SpeechTimeMap]:
+    """Concatenate the speech regions and return the time map needed to undo the compaction."""
+    import numpy as np
+
+    compacted_starts: list[int] = []
+    position = 0
+    for start, end in regions:
+        compacted_starts.append(position)
+        position += end - start
+    compacted = (
+        np.concatenate([samples[start:end] for start, end in regions])
+        if regions
+        else np.zeros(0, dtype=np.float32)
+    )
+    return compacted, SpeechTimeMap(
+        compacted_starts=tuple(compacted_starts),
+        original_starts=tuple(start for start, _ in regions),
+        sample_rate=sample_rate,
+    )
@@ -0,0 +1,114 @@
+"""Worker-local LRU disk cache for downloaded media objects, shared across processes on one host."""
+from contextlib import contextmanager
+import fcntl
+import hashlib
+import logging
+import os
+from pathlib import Path
+import shutil
+import tempfile
+from typing import Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class LocalMediaCache:
+    """Cache object bytes under `root`, keyed by bucket, key, and ETag.
+
+    Files are published with an atomic rename from a staging directory, so readers never see a
+    partial object. Striped `flock` locks (256 files keyed by entry hash) keep concurrent processes
+    from downloading the same object twice or evicting an entry mid-link, and a cache-wide lock
+    serializes eviction. Recency is the file mtime, refreshed on every hit. Callers get a hard link
+    (or a copy across filesystems) in their own directory, so evicting an entry never removes a file
+    a job is still decoding.
+    """
+
+    def __init__(self, root: str, *, max_bytes: int) -> None:
+        self._root = Path(root)
+        self._objects = self._root / "objects"
+        self._staging = self._root / "staging"
+        self._locks = self._root / "locks"
+        self._max_bytes = max_bytes
+        for directory in (self._objects, self._staging, self._locks):
+            directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def entry_name(bucket: str, object_key: str, etag: str) -> str:
+        digest = hashlib.sha256(f"{bucket}\n{object_key}\n{etag}".encode("utf-8")).hexdigest()
+        return digest + Path(object_key).suffix.lower()[:16]
+
+    def materialize(
+        self,
+        *,
+        bucket: str,
+        object_key: str,
+        etag: str,
+        destination_path: str,
+        download: Callable[[str], None],
+    ) -> bool:
+        """Place the object at `destination_path`, downloading it only on a miss. Returns True on a hit."""
+        name = self.entry_name(bucket, object_key, etag)
+        entry_path = self._objects / name
+        with self._locked(self._lock_path(name)):
+            hit = entry_path.exists()
+            if hit:
+                os.utime(entry_path)
+            else:
+                fd, staging_path = tempfile.mkstemp(dir=self._staging)
+                os.close(fd)
+                try:
+                    download(staging_path)
+                    os.replace(staging_path, entry_path)
+                except BaseException:
+                    Path(staging_path).unlink(missing_ok=True)
+                    raise
+            self._link(entry_path, destination_path)
+        if not hit:
+            self._evict_over_budget(keep=entry_path)
+        return hit
+
+    def _lock_path(self, name: str) -> Path:
+        return self._locks / f"{name[:2]}.lock"
+
+    @staticmethod
+    def _link(entry_path: Path, destination_path: str) -> None:
+        try:
+            os.link(entry_path, destination_path)
+        except OSError:
+            shutil.copyfile(entry_path, destination_path)
+
+    def _evict_over_budget(self, *, keep: Path) -> None:
+        with self._locked(self._root / "eviction.lock"):
+            entries = []
+            for path in self._objects.iterdir():
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self._max_bytes:
+                    break
+                if path == keep:
+                    continue
+                with self._locked(self._lock_path(path.name), blocking=False) as acquired:
+                    if not acquired:
+                        continue
+                    path.unlink(missing_ok=True)
+                total -= size
+                logger.info("evicted cached media entry=%s bytes=%s", path.name, size)
+
+    @staticmethod
+    @contextmanager
+    def _locked(lock_path: Path, *, blocking: bool = True) -> Iterator[bool]:
+        with open(lock_path, "a+b") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -0,0 +1,70 @@
+"""Process-local registry of loaded transcription models with an approximate memory budget."""
+from collections import OrderedDict
+import logging
+import threading
+from typing import Any, Callable, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+# Published parameter counts; unknown names are assumed to be as large as `large`.
+WHISPER_MODEL_PARAMETERS = {
+    "tiny": 39_000_000,
+    "base": 74_000_000,
+    "small": 244_000_000,
+    "medium": 769_000_000,
+    "large": 1_550_000_000,
+    "turbo": 809_000_000,
+}
+_BYTES_PER_PARAMETER = {None: 4, "float32": 4, "float16": 2, "int8_float32": 1, "int8": 1}
+
+
+class ModelKey(NamedTuple):
+    engine: str
+    model_name: str
+    compute_type: str | None = None
+
+
+def estimate_model_bytes(key: ModelKey) -> int:
+    base_name = key.model_name.split(".", 1)[0].split("-", 1)[0]
+    parameters = WHISPER_MODEL_PARAMETERS.get(base_name, WHISPER_MODEL_PARAMETERS["large"])
+    return parameters * _BYTES_PER_PARAMETER.get(key.compute_type, 4)
+
+
+class TranscriptionModelRegistry:
+    """Load each (engine, model, compute type) once and evict least-recently-used models over budget.
+
+    The most recently requested model is never evicted, so a single model larger than the budget
+    still loads; the budget only bounds how many others stay resident beside it.
+    """
+
+    def __init__(self, memory_budget_bytes: int) -> None:
+        self._memory_budget_bytes = memory_budget_bytes
+        self._models: OrderedDict[ModelKey, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: ModelKey, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self._models.move_to_end(key)
+                return model
+            model = loader()
+            self._models[key] = model
+            self._evict_over_budget()
+            return model
+
+    def loaded_keys(self) -> tuple[ModelKey, ...]:
+        with self._lock:
+            return tuple(self._models)
+
+    def _evict_over_budget(self) -> None:
+        resident = sum(estimate_model_bytes(key) for key in self._models)
+        while resident > self._memory_budget_bytes and len(self._models) > 1:
+            key, _ = self._models.popitem(last=False)
+            resident -= estimate_model_bytes(key)
+            logger.info(
+                "evicted transcription model engine=%s model=%s compute_type=%s",
+                key.engine,
+                key.model_name,
+                key.compute_type,
+            )
@@ -1,7 +1,17 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
 from pathlib import Path
+import re
 
 from app.config.settings import settings
 
+RANGE_READ_CHUNK_BYTES = 1024 * 1024
+_CONTENT_RANGE_TOTAL = re.compile(r"/(\d+)$")
+
+
+class ObjectChangedError(ValueError):
+    """The object no longer matches the ETag or length a download was pinned to."""
+
 
 class ObjectStorageClient:
     """Small S3-compatible client wrapper for MinIO-backed media bytes."""
@@ -55,9 +65,133 @@ class ObjectStorageClient:
     ) -> str:
         safe_name = Path(filename or object_key).name or "asset-media"
         destination_path = Path(destination_dir) / safe_name
-        self.client.download_file(bucket, object_key, str(destination_path))
+        self.download_to_path(bucket=bucket, object_key=object_key, destination_path=str(destination_path))
         return str(destination_path)
 
+    def download_to_path(
+        self,
+        *,
+        bucket: str,
+        object_key: str,
+        destination_path: str,
+        etag: str | None = None,
+    ) -> None:
+        """Download the object; with `etag`, fail with `ObjectChangedError` if it was replaced since HEAD."""
+        if etag is None:
+            self.client.download_file(bucket, object_key, destination_path)
+            return
+        try:
+            self.client.download_file(bucket, object_key, destination_path, ExtraArgs={"IfMatch": f'"{etag}"'})
+        except Exception as exc:
+            if _is_precondition_failed(exc):
+                raise ObjectChangedError(f"Object {bucket}/{object_key} no longer matches ETag {etag!r}") from exc
+            raise
+
+    def download_ranged_to_path(
+        self,
+        *,
+        bucket: str,
+        object_key: str,
+        destination_path: str,
+        part_size_bytes: int,
+        concurrency: int,
+        head: dict | None = None,
+    ) -> None:
+        """Fetch byte ranges concurrently into a preallocated file with positional writes.
+
+        The length and ETag come from HEAD (the caller's, when it already made one), not from request
+        metadata, so a stale `sizeBytes` cannot fail a correct object. Every part sends `IfMatch`
+        with that ETag and checks the total length in `Content-Range`, so an object replaced
+        mid-download fails instead of mixing versions.
+        """
+        if head is None:
+            head = self.head_object(bucket=bucket, object_key=object_key)
+        size_bytes = int(head["ContentLength"])
+        etag = str(head.get("ETag") or "").strip('"') or None
+        ranges = [
+            (start, min(start + part_size_bytes, size_bytes) - 1)
+            for start in range(0, size_bytes, part_size_bytes)
+        ]
+        fd = os.open(destination_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if hasattr(os, "posix_fallocate") and size_bytes:
+                os.posix_fallocate(fd, 0, size_bytes)
+            else:
+                os.ftruncate(fd, size_bytes)
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="ranged-download") as pool:
+                list(pool.map(
+                    lambda byte_range: self._download_range(
+                        bucket, object_key, fd, size_bytes, *byte_range, etag=etag,
+                    ),
+                    ranges,
+                ))
+        finally:
+            os.close(fd)
+
+    def _download_range(
+        self,
+        bucket: str,
+        object_key: str,
+        fd: int,
+        size_bytes: int,
+        start: int,
+        end: int,
+        *,
+        etag: str | None,
+    ) -> None:
+        request = {"Bucket": bucket, "Key": object_key, "Range": f"bytes={start}-{end}"}
+        if etag is not None:
+            request["IfMatch"] = f'"{etag}"'
+        try:
+            response = self.client.get_object(**request)
+        except Exception as exc:
+            if _is_precondition_failed(exc):
+                raise ObjectChangedError(
+                    f"Object {bucket}/{object_key} changed during ranged download: ETag {etag!r} no longer matches"
+                ) from exc
+            raise
+        match = _CONTENT_RANGE_TOTAL.search(str(response.get("ContentRange") or ""))
+        if match is None or int(match.group(1)) != size_bytes:
+            response["Body"].close()
+            raise ObjectChangedError(
+                f"Object {bucket}/{object_key} length changed: expected {size_bytes} bytes, "
+                f"got Content-Range {response.get('ContentRange')!r}"
+            )
+        offset = start
+        try:
+            for chunk in response["Body"].iter_chunks(RANGE_READ_CHUNK_BYTES):
+                written = 0
+                while written < len(chunk):
+                    written += os.pwrite(fd, chunk[written:], offset + written)
+                offset += len(chunk)
+        finally:
+            response["Body"].close()
+        if offset != end + 1:
+            raise IOError(f"Short read for {bucket}/{object_key} range {start}-{end}: ended at {offset}")
+
+    def open_object_stream(self, *, bucket: str, object_key: str):
+        """Return the streaming body of a GetObject response; the caller must close it."""
+        return self.client.get_object(Bucket=bucket, Key=object_key)["Body"]
+
+    def head_object(self, *, bucket: str, object_key: str) -> dict:
+        return self.client.head_object(Bucket=bucket, Key=object_key, ChecksumMode="ENABLED")
+
+
+def object_content_fingerprint(head: dict) -> str | None:
+    """Return a content identity from HEAD metadata: the SHA-256 checksum when stored, else the ETag."""
+    checksum = head.get("ChecksumSHA256")
+    if checksum:
+        return f"sha256:{checksum}"
+    etag = str(head.get("ETag") or "").strip('"')
+    return f"etag:{etag}" if etag else None
+
+
+def _is_precondition_failed(exc: Exception) -> bool:
+    response = getattr(exc, "response", None) or {}
+    error_code = str(response.get("Error", {}).get("Code") or "")
+    status_code = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return error_code in {"PreconditionFailed", "412"} or status_code == 412
+
 
 def get_object_storage_client() -> ObjectStorageClient:
     return ObjectStorageClient.from_settings()
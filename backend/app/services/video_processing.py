@@ -1,23 +1,45 @@
 import os
 import subprocess
 import logging
-import threading
-from typing import Any, List
+import wave
+from typing import TYPE_CHECKING, Any, List
+from app.config.settings import settings
+from app.services.model_registry import ModelKey, TranscriptionModelRegistry
 from app.utils import DEFAULT_TRANSCRIPT_CHUNK_CHARS, split_transcript_text
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
-_whisper_model = None
-_whisper_model_lock = threading.Lock()
+PCM_DECODE_CHUNK_BYTES = 1024 * 1024
+WHISPER_SAMPLE_RATE = 16000
+DEFAULT_WHISPER_MODEL_NAME = "base"
+_model_registry = TranscriptionModelRegistry(settings.WHISPER_MODEL_MEMORY_BUDGET_MB * 1024 * 1024)
+
+
+def get_whisper_model(model_name: str = DEFAULT_WHISPER_MODEL_NAME):
+    def load():
+        import whisper  # heavy import; keep inside a worker process
+
+        return whisper.load_model(model_name)
+
+    return _model_registry.get(ModelKey("whisper", model_name), load)
+
 
+def get_faster_whisper_model(model_name: str = DEFAULT_WHISPER_MODEL_NAME, compute_type: str = "int8"):
+    def load():
+        try:
+            from faster_whisper import WhisperModel  # optional CTranslate2 engine
+        except ModuleNotFoundError as exc:
+            raise RuntimeError(
+                "TRANSCRIPTION_ENGINE=faster-whisper requires the faster-whisper package"
+            ) from exc
+        # Long-media windows transcribe on threads; one CTranslate2 replica per window worker lets
+        # them run concurrently instead of queueing on a single replica.
+        num_workers = settings.WHISPER_LONG_MEDIA_WORKERS if settings.WHISPER_LONG_MEDIA_ENABLED else 1
+        return WhisperModel(model_name, device="cpu", compute_type=compute_type, num_workers=num_workers)
 
-def get_whisper_model(model_name: str = "base"):
-    global _whisper_model
-    if _whisper_model is None:
-        with _whisper_model_lock:
-            if _whisper_model is None:
-                import whisper  # heavy import; keep inside a worker process
-                _whisper_model = whisper.load_model(model_name)
-    return _whisper_model
+    return _model_registry.get(ModelKey("faster-whisper", model_name, compute_type), load)
 
 
 def extract_audio_to_wav(abs_video_path: str, temp_dir: str, sample_rate: int = 16000) -> str:
@@ -31,11 +53,76 @@ def extract_audio_to_wav(abs_video_path: str, temp_dir: str, sample_rate: int =
     return audio_path
 
 
-def transcribe_audio_with_whisper(audio_path: str) -> dict[str, Any] | None:
-    """Transcribe audio using Whisper (base model). Returns the provider result or None."""
+def decode_audio_to_array(
+    abs_media_path: str,
+    sample_rate: int = 16000,
+    chunk_bytes: int = PCM_DECODE_CHUNK_BYTES,
+) -> "np.ndarray":
+    """Decode mono 16-bit PCM from ffmpeg's stdout into a float32 array without a temp file."""
+    import numpy as np
+
+    cmd = [
+        "ffmpeg", "-nostdin", "-i", abs_media_path,
+        "-vn", "-ac", "1", "-ar", str(sample_rate),
+        "-f", "s16le", "-acodec", "pcm_s16le", "pipe:1",
+    ]
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    chunks: list[np.ndarray] = []
+    remainder = b""
+    try:
+        while True:
+            data = process.stdout.read(chunk_bytes)
+            if not data:
+                break
+            if remainder:
+                data = remainder + data
+            usable = len(data) - (len(data) % 2)
+            remainder = data[usable:]
+            if usable:
+                samples = np.frombuffer(data, dtype="<i2", count=usable // 2).astype(np.float32)
+                samples *= 1.0 / 32768.0
+                chunks.append(samples)
+    except BaseException:
+        process.kill()
+        raise
+    finally:
+        process.stdout.close()
+        returncode = process.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+    if not chunks:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate(chunks)
+
+
+def load_wav_to_array(audio_path: str) -> "np.ndarray":
+    """Read the mono 16-bit WAV written by extract_audio_to_wav into float32 samples."""
+    import numpy as np
+
+    with wave.open(audio_path, "rb") as wav_file:
+        if wav_file.getsampwidth() != 2 or wav_file.getnchannels() != 1:
+            raise ValueError("expected mono 16-bit PCM audio")
+        frames = wav_file.readframes(wav_file.getnframes())
+    samples = np.frombuffer(frames, dtype="<i2").astype(np.float32)
+    samples *= 1.0 / 32768.0
+    return samples
+
+
+def audio_duration_seconds(audio: "str | np.ndarray", sample_rate: int = WHISPER_SAMPLE_RATE) -> float:
+    if isinstance(audio, str):
+        with wave.open(audio, "rb") as wav_file:
+            return wav_file.getnframes() / wav_file.getframerate()
+    return len(audio) / sample_rate
+
+
+def transcribe_audio_with_whisper(
+    audio: "str | np.ndarray",
+    model_name: str = DEFAULT_WHISPER_MODEL_NAME,
+) -> dict[str, Any] | None:
+    """Transcribe a WAV path or 16 kHz float32 samples with Whisper. Returns the provider result or None."""
     try:
-        model = get_whisper_model()
-        result = model.transcribe(audio_path)
+        model = get_whisper_model(model_name)
+        result = model.transcribe(audio)
     except Exception as e:
         logger.warning("Whisper transcription failed: %s", e)
         return None
@@ -44,5 +131,28 @@ def transcribe_audio_with_whisper(audio_path: str) -> dict[str, Any] | None:
     return result
 
 
+def transcribe_audio_with_faster_whisper(
+    audio: "str | np.ndarray",
+    compute_type: str = "int8",
+    model_name: str = DEFAULT_WHISPER_MODEL_NAME,
+) -> dict[str, Any] | None:
+    """Transcribe with the CTranslate2 engine and return a Whisper-shaped result or None."""
+    model = get_faster_whisper_model(model_name, compute_type=compute_type)
+    try:
+        raw_segments, info = model.transcribe(audio)
+        segments = [
+            {"id": segment.id, "start": segment.start, "end": segment.end, "text": segment.text}
+            for segment in raw_segments
+        ]
+    except Exception as e:
+        logger.warning("faster-whisper transcription failed: %s", e)
+        return None
+    return {
+        "text": "".join(segment["text"] for segment in segments).strip(),
+        "segments": segments,
+        "language": getattr(info, "language", None),
+    }
+
+
 def segment_text(full_text: str, max_len: int = DEFAULT_TRANSCRIPT_CHUNK_CHARS) -> List[str]:
     return split_transcript_text(full_text, max_len=max_len)
@@ -1,6 +1,7 @@
 import logging
 import time
 
+from app.config.settings import settings
 from app.core.celery_app import celery_app
 from app.processing.adapters.celery_dispatcher import decode_processing_task_payload
 from app.bootstrap.worker import (
@@ -17,6 +18,16 @@ from app.processing.adapters.timing import log_processing_timing
 logger = logging.getLogger(__name__)
 
 
+def _compact_result(result: dict, artifact: dict) -> dict:
+    """Replace segment text with a count and a pointer to the rows already stored in the database."""
+    if not settings.CELERY_COMPACT_TASK_RESULTS_ENABLED or "segments" not in result:
+        return result
+    compact = {key: value for key, value in result.items() if key != "segments"}
+    compact["segment_count"] = len(result["segments"])
+    compact["artifact"] = artifact
+    return compact
+
+
 @celery_app.task(name="process_video", bind=True)
 def process_video_task(self, video_id: int, abs_video_path: str) -> dict:
     task_started_at = time.perf_counter()
@@ -32,7 +43,7 @@ def process_video_task(self, video_id: int, abs_video_path: str) -> dict:
             status=result["status"],
             segment_count=len(result.get("segments", ())) if result["status"] == "ready" else None,
         )
-        return result
+        return _compact_result(result, {"type": "video_transcript", "video_id": video_id})
     finally:
         service.close()
 
@@ -78,6 +89,9 @@ def process_asset_object_task(self, request: dict) -> dict:
             status=result["status"],
             segment_count=len(result.get("segments", ())) if result["status"] == "ready" else None,
         )
-        return result
+        return _compact_result(
+            result,
+            {"type": "processing_request_transcript", "processing_request_id": command.event_id},
+        )
     finally:
         service.close()
@@ -0,0 +1,94 @@
+"""Measure read-endpoint latency under concurrent clients against a running API.
+
+Usage (from backend/), once per database mode against the same data:
+
+    DATABASE_ASYNC_ENABLED=false uvicorn app.main:app --port 8000   # in another shell
+    python -m benchmarks.api_read_latency --base-url http://localhost:8000 \\
+        --path /internal/processing-requests/<id>/transcript-rows --clients 200 --requests 5000 --label sync
+
+    DATABASE_ASYNC_ENABLED=true uvicorn app.main:app --port 8000
+    python -m benchmarks.api_read_latency ... --label async
+
+Each of `--clients` tasks issues requests back to back until `--requests` have been sent in total.
+The report gives p50/p90/p99/max latency in milliseconds, throughput, and any non-2xx/304 statuses.
+Run the server with one worker process so the comparison isolates the database access path.
+"""
+import argparse
+import asyncio
+import json
+import time
+from collections import Counter
+from typing import Any
+
+import httpx
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float | None:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return round(sorted_values[index], 2)
+
+
+async def _run(base_url: str, paths: list[str], clients: int, total: int, timeout: float) -> dict[str, Any]:
+    latencies: list[float] = []
+    statuses: Counter[int | str] = Counter()
+    remaining = total
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client:
+
+        async def worker(client_index: int) -> None:
+            nonlocal remaining
+            sent = 0
+            while remaining > 0:
+                remaining -= 1
+                path = paths[(client_index + sent) % len(paths)]
+                sent += 1
+                started = time.perf_counter()
+                try:
+                    response = await client.get(path)
+                    statuses[response.status_code] += 1
+                except httpx.HTTPError as exc:
+                    statuses[type(exc).__name__] += 1
+                    continue
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(index) for index in range(clients)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "clients": clients,
+        "requests": total,
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(total / elapsed, 1) if elapsed else None,
+        "p50_ms": _percentile(latencies, 0.50),
+        "p90_ms": _percentile(latencies, 0.90),
+        "p99_ms": _percentile(latencies, 0.99),
+        "max_ms": _percentile(latencies, 1.0),
+        "statuses": {str(status): count for status, count in sorted(statuses.items(), key=str)},
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--path", action="append", required=True, help="repeat to rotate over several paths")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--label", default=None, help="free-form tag, e.g. sync or async")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(_run(args.base_url, args.path, args.clients, args.requests, args.timeout))
+    if args.label:
+        report = {"label": args.label, **report}
+    print(json.dumps(report, indent=2))
+    failed = any(status not in {"200", "304"} for status in report["statuses"])
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
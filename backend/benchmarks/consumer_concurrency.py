@@ -0,0 +1,104 @@
+"""Compare the single-threaded consumer loop with the key-hashed worker pool on simulated handoffs.
+
+Usage (from backend/):
+
+    python -m benchmarks.consumer_concurrency --messages 2000 --partitions 6 --keys 200 \\
+        --handoff-ms 5 --concurrency 1 4 8 16
+
+Each handoff sleeps `--handoff-ms` to stand in for the database and Celery round trips, so the
+numbers show how much waiting the pool overlaps rather than Python throughput. Every run also checks
+that each key's messages were handled in offset order and that all partitions commit to the end.
+"""
+import argparse
+import json
+import random
+import threading
+import time
+import zlib
+from types import SimpleNamespace
+from typing import Any
+
+from app.consumers.keyed_worker_pool import KeyedWorkerPool, PartitionOffsetTracker
+
+
+def _records(messages: int, partitions: int, keys: int, seed: int) -> dict[int, list[Any]]:
+    rng = random.Random(seed)
+    records: dict[int, list[Any]] = {partition: [] for partition in range(partitions)}
+    for _ in range(messages):
+        key = f"asset-{rng.randrange(keys)}"
+        partition = zlib.crc32(key.encode("utf-8")) % partitions
+        records[partition].append(SimpleNamespace(key=key, offset=len(records[partition])))
+    return records
+
+
+def _run(records: dict[int, list[Any]], concurrency: int, handoff_seconds: float, max_records: int) -> dict[str, Any]:
+    handled: dict[str, list[tuple[int, int]]] = {}
+    lock = threading.Lock()
+    tracker = PartitionOffsetTracker()
+
+    def handle(item) -> None:
+        partition, message = item
+        time.sleep(handoff_seconds)
+        with lock:
+            handled.setdefault(message.key, []).append((partition, message.offset))
+        tracker.complete(partition, message.offset)
+
+    polls: list[list[tuple[int, Any]]] = []
+    flat = [(partition, message) for partition, messages in records.items() for message in messages]
+    for start in range(0, len(flat), max_records):
+        polls.append(flat[start:start + max_records])
+
+    started = time.perf_counter()
+    if concurrency == 1:
+        for batch in polls:
+            for partition, message in batch:
+                tracker.start(partition, message.offset)
+                handle((partition, message))
+    else:
+        pool = KeyedWorkerPool(concurrency, handle, queue_size=max_records)
+        try:
+            for batch in polls:
+                for partition, message in batch:
+                    tracker.start(partition, message.offset)
+                    pool.submit(message.key, (partition, message))
+            pool.drain()
+        finally:
+            pool.close()
+    elapsed = time.perf_counter() - started
+
+    ordered = all(offsets == sorted(offsets) for offsets in handled.values())
+    expected = {partition: len(messages) for partition, messages in records.items() if messages}
+    return {
+        "mode": "single-threaded" if concurrency == 1 else "keyed-pool",
+        "concurrency": concurrency,
+        "messages": len(flat),
+        "seconds": round(elapsed, 3),
+        "messages_per_second": round(len(flat) / elapsed, 1) if elapsed else None,
+        "per_key_order_preserved": ordered,
+        "all_offsets_committable": tracker.committable() == expected,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--partitions", type=int, default=6)
+    parser.add_argument("--keys", type=int, default=200)
+    parser.add_argument("--handoff-ms", type=float, default=5.0)
+    parser.add_argument("--max-records", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    records = _records(args.messages, args.partitions, args.keys, args.seed)
+    reports = [
+        _run(records, concurrency, args.handoff_ms / 1000, args.max_records)
+        for concurrency in args.concurrency
+    ]
+    print(json.dumps(reports, indent=2))
+    failed = any(not (report["per_key_order_preserved"] and report["all_offsets_committable"]) for report in reports)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+"""Compare transcription engines on real media: load time, real-time factor, and peak RSS.
+
+Usage (from backend/):
+
+    python -m benchmarks.transcription_engines path/to/sample.mp4 --engines whisper faster-whisper
+
+Each engine runs in a fresh child process so model memory and thread pools do not leak between
+measurements. RTF is transcribe seconds divided by audio seconds; lower is better.
+"""
+import argparse
+import json
+import multiprocessing
+import queue as queue_module
+import resource
+import sys
+import time
+from typing import Any
+
+ENGINES = ("whisper", "faster-whisper")
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_engine(engine: str, media_path: str, compute_type: str, queue) -> None:
+    from app.processing.adapters.whisper_transcriber import normalize_whisper_result
+    from app.services import video_processing
+
+    try:
+        audio = video_processing.decode_audio_to_array(media_path)
+        audio_seconds = video_processing.audio_duration_seconds(audio)
+
+        started = time.perf_counter()
+        if engine == "faster-whisper":
+            video_processing.get_faster_whisper_model(compute_type=compute_type)
+        else:
+            video_processing.get_whisper_model()
+        load_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        if engine == "faster-whisper":
+            result = video_processing.transcribe_audio_with_faster_whisper(audio, compute_type=compute_type)
+        else:
+            result = video_processing.transcribe_audio_with_whisper(audio)
+        transcribe_seconds = time.perf_counter() - started
+        if result is None:
+            raise RuntimeError("transcription returned no result")
+
+        queue.put(
+            {
+                "engine": engine,
+                "compute_type": compute_type if engine == "faster-whisper" else None,
+                "audio_seconds": round(audio_seconds, 3),
+                "load_seconds": round(load_seconds, 3),
+                "transcribe_seconds": round(transcribe_seconds, 3),
+                "rtf": round(transcribe_seconds / audio_seconds, 4) if audio_seconds else None,
+                "peak_rss_mb": round(_peak_rss_mb(), 1),
+                "segments": len(normalize_whisper_result(result)),
+            }
+        )
+    except Exception as exc:
+        queue.put({"engine": engine, "error": f"{type(exc).__name__}: {exc}"})
+
+
+def benchmark(media_path: str, engines: list[str], compute_type: str) -> list[dict[str, Any]]:
+    context = multiprocessing.get_context("spawn")
+    reports: list[dict[str, Any]] = []
+    for engine in engines:
+        queue = context.Queue()
+        process = context.Process(target=_run_engine, args=(engine, media_path, compute_type, queue))
+        process.start()
+        process.join()
+        try:
+            reports.append(queue.get(timeout=1))
+        except queue_module.Empty:
+            reports.append({"engine": engine, "error": f"exit code {process.exitcode}"})
+    return reports
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("media_path")
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=list(ENGINES))
+    parser.add_argument("--compute-type", default="int8")
+    args = parser.parse_args(argv)
+
+    reports = benchmark(args.media_path, args.engines, args.compute_type)
+    print(json.dumps(reports, indent=2))
+    return 1 if any("error" in report for report in reports) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -7,6 +7,7 @@ import app.config.settings as settings_module
 from app.events.asset_processing import EventValidationError, parse_asset_processing_requested_event
 from app.relays import processing_outbox_auto_relay
 from app.result_delivery.adapters import kafka_publisher as processing_outbox_publisher
+from app.services.audio_segmentation import plan_transcription_windows
 
 
 def valid_event_dict() -> dict:
@@ -120,6 +121,40 @@ class ProcessingSettingsTest(unittest.TestCase):
             with self.subTest(overrides=overrides), self.assertRaises(ValueError):
                 self._load_settings(overrides)
 
+    def test_long_media_overlap_must_fit_inside_the_window(self) -> None:
+        import numpy as np
+
+        settings = self._load_settings(
+            {"WHISPER_LONG_MEDIA_WINDOW_SECONDS": "60", "WHISPER_LONG_MEDIA_OVERLAP_SECONDS": "29"}
+        )
+        self.assertEqual(settings.WHISPER_LONG_MEDIA_OVERLAP_SECONDS, 29)
+        plan_transcription_windows(
+            np.zeros(16_000 * 150, dtype=np.float32),
+            16_000,
+            window_seconds=settings.WHISPER_LONG_MEDIA_WINDOW_SECONDS,
+            overlap_seconds=settings.WHISPER_LONG_MEDIA_OVERLAP_SECONDS,
+        )
+        for overrides in (
+            {"WHISPER_LONG_MEDIA_OVERLAP_SECONDS": "-1"},
+            {"WHISPER_LONG_MEDIA_WINDOW_SECONDS": "60", "WHISPER_LONG_MEDIA_OVERLAP_SECONDS": "30"},
+            {"WHISPER_LONG_MEDIA_WINDOW_SECONDS": "60", "WHISPER_LONG_MEDIA_OVERLAP_SECONDS": "59"},
+        ):
+            with self.subTest(overrides=overrides), self.assertRaises(ValueError):
+                self._load_settings(overrides)
+
+    def test_adaptive_relay_min_idle_must_be_positive_and_within_the_interval(self) -> None:
+        settings = self._load_settings(
+            {"PROCESSING_OUTBOX_AUTO_RELAY_INTERVAL_SECONDS": "2", "PROCESSING_OUTBOX_AUTO_RELAY_MIN_IDLE_SECONDS": "2"}
+        )
+        self.assertEqual(settings.PROCESSING_OUTBOX_AUTO_RELAY_MIN_IDLE_SECONDS, 2.0)
+        for overrides in (
+            {"PROCESSING_OUTBOX_AUTO_RELAY_MIN_IDLE_SECONDS": "0"},
+            {"PROCESSING_OUTBOX_AUTO_RELAY_MIN_IDLE_SECONDS": "-0.5"},
+            {"PROCESSING_OUTBOX_AUTO_RELAY_INTERVAL_SECONDS": "2", "PROCESSING_OUTBOX_AUTO_RELAY_MIN_IDLE_SECONDS": "2.5"},
+        ):
+            with self.subTest(overrides=overrides), self.assertRaises(ValueError):
+                self._load_settings(overrides)
+
     def _load_settings(self, overrides: dict[str, str]):
         environment = {"DOTENV_PATH": "/tmp/nonexistent-project3-env", **overrides}
         try:
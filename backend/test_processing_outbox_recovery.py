@@ -210,6 +210,11 @@ class ProcessingOutboxRecoveryTest(unittest.TestCase):
             def publish(self, event) -> None:
                 self.ids.append(event.id)
 
+            def publish_batch(self, events):
+                for event in events:
+                    self.publish(event)
+                return tuple(None for _event in events)
+
         db = self.Session()
         event = new_event()
         db.add(event)
@@ -305,6 +310,52 @@ class AutomaticRelayRecoveryOwnershipTest(unittest.TestCase):
         relay.assert_called_once()
         self.assertNotIn("private detail", " ".join(captured.output))
 
+    def test_idle_wait_blocks_on_listener_when_available_and_polls_otherwise(self) -> None:
+        shutdown_requested = MagicMock()
+        shutdown_requested.is_set.return_value = False
+        listener = MagicMock()
+        processing_outbox_auto_relay._wait_for_next_iteration(shutdown_requested, listener, 7)
+        listener.wait.assert_called_once_with(7)
+        shutdown_requested.wait.assert_not_called()
+
+        processing_outbox_auto_relay._wait_for_next_iteration(shutdown_requested, None, 7)
+        shutdown_requested.wait.assert_called_once_with(7)
+
+    def test_listener_is_only_built_for_enabled_postgresql_relays(self) -> None:
+        from app.bootstrap import relay as relay_bootstrap
+
+        postgres = MagicMock()
+        postgres.dialect.name = "postgresql"
+        sqlite = MagicMock()
+        sqlite.dialect.name = "sqlite"
+        with patch.object(relay_bootstrap.settings, "PROCESSING_OUTBOX_AUTO_RELAY_LISTEN_ENABLED", True):
+            listener = relay_bootstrap.build_result_outbox_listener(postgres)
+            self.assertIsNotNone(listener)
+            listener.close()
+            self.assertIsNone(relay_bootstrap.build_result_outbox_listener(sqlite))
+        with patch.object(relay_bootstrap.settings, "PROCESSING_OUTBOX_AUTO_RELAY_LISTEN_ENABLED", False):
+            self.assertIsNone(relay_bootstrap.build_result_outbox_listener(postgres))
+
+    def test_loop_metrics_report_backlog_depth_and_rate_once_per_interval(self) -> None:
+        now = [0.0]
+        relay_service = MagicMock()
+        relay_service.backlog_depth.return_value = 1234
+        metrics = processing_outbox_auto_relay._RelayLoopMetrics(30, clock=lambda: now[0])
+        with (
+            patch.object(processing_outbox_auto_relay, "build_result_relay_service", return_value=relay_service),
+            self.assertLogs(processing_outbox_auto_relay.logger, level="INFO") as captured,
+        ):
+            for _ in range(59):
+                now[0] += 0.5
+                metrics.record_pass(MagicMock(), MagicMock(), batch_size=80, delay_seconds=0.0)
+            relay_service.backlog_depth.assert_not_called()
+            now[0] += 0.5
+            metrics.record_pass(MagicMock(), MagicMock(), batch_size=80, delay_seconds=0.0)
+
+        relay_service.backlog_depth.assert_called_once_with()
+        self.assertEqual(len(captured.output), 1)
+        self.assertIn("backlog_depth=1234 loop_rate_per_second=2.00 batch_size=80", captured.output[0])
+
 
 class ProcessingOutboxRecoverySchemaTest(unittest.TestCase):
     def test_existing_failed_rows_are_backfilled_unknown_without_replay_eligibility(self) -> None:
@@ -1,15 +1,42 @@
+import asyncio
+import os
+import tempfile
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from dataclasses import replace
 from datetime import UTC, datetime
+from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
+from uuid import uuid4
 
-from app.consumers.asset_processing_consumer import handle_asset_processing_message
+from botocore.exceptions import ClientError
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import models  # noqa: F401
+from app.config.settings import settings
+from app.core.database import Base
+from app.consumers.asset_processing_consumer import (
+    handle_asset_processing_message,
+    handle_asset_processing_messages,
+)
 from app.events.asset_processing import EventValidationError, parse_asset_processing_requested_event
 from app.processing.adapters.celery_dispatcher import (
     CeleryProcessingTaskDispatcher,
     encode_processing_task_payload,
 )
+from app.processing.adapters.media_source import (
+    ObjectStorageProcessingMediaSource,
+    RangedDownloadPolicy,
+    StreamingObjectStorageProcessingMediaSource,
+)
+from app.processing.adapters.queue_routing import ProcessingQueueRoutingPolicy
+from app.processing.adapters.sqlalchemy_stores import SqlAlchemyProcessingRequestRepository
+from app.processing.adapters.transcript_cache import SqlAlchemyProcessingTranscriptCache
 from app.processing.application.dispatch import DispatchProcessingApplicationService
 from app.processing.application.execute import ExecuteProcessingApplicationService
 from app.processing.domain.models import (
@@ -22,6 +49,9 @@ from app.processing.domain.models import (
 )
 from app.processing.ports.request_repository import ProcessingRequestState
 from app.processing.ports.task_dispatcher import ProcessingDispatch
+from app.routers.videos import get_task_status
+from app.services.media_cache import LocalMediaCache
+from app.services.object_storage import ObjectStorageClient
 from app.tasks.video_tasks import process_asset_object_task, process_video_task
 
 
@@ -113,6 +143,26 @@ class DispatchApplicationServiceTest(unittest.TestCase):
         )
         self.assertEqual(dispatched.task_id, "asset-processing-event-1")
 
+    def test_queue_routing_sends_jobs_to_short_long_and_huge_queues_by_audio_equivalent_size(self) -> None:
+        policy = ProcessingQueueRoutingPolicy(short_max_bytes=100, huge_min_bytes=1_000, video_bytes_ratio=8.0)
+
+        def sized(size_bytes: int, content_type: str) -> ProcessingExecutionCommand:
+            return replace(command(), size_bytes=size_bytes, content_type=content_type)
+
+        self.assertEqual(policy.select(sized(100, "audio/mpeg")), "processing.short")
+        self.assertEqual(policy.select(sized(800, "video/mp4")), "processing.short")
+        self.assertEqual(policy.select(sized(800, "audio/mpeg")), "processing.long")
+        self.assertEqual(policy.select(sized(8_000, "VIDEO/MP4")), "processing.huge")
+
+        enqueue = MagicMock(return_value=SimpleNamespace(id="asset-processing-event-1"))
+        CeleryProcessingTaskDispatcher(enqueue, queue_routing=policy).dispatch(sized(8_000, "audio/wav"))
+        self.assertEqual(enqueue.call_args.kwargs["queue"], "processing.huge")
+        with patch("celery.group") as group:
+            group.return_value.apply_async.return_value = SimpleNamespace(results=[SimpleNamespace(id="t")])
+            CeleryProcessingTaskDispatcher(queue_routing=policy).dispatch_many([command()])
+        [signature] = group.call_args.args[0]
+        self.assertEqual(signature.options["queue"], "processing.short")
+
     def test_completed_duplicate_does_not_dispatch(self) -> None:
         repository = MagicMock()
         repository.get_or_create.return_value = ProcessingRequestState(
@@ -125,9 +175,88 @@ class DispatchApplicationServiceTest(unittest.TestCase):
         self.assertEqual(result.task_id, "existing-task")
         dispatcher.dispatch.assert_not_called()
 
+    def test_dispatch_many_inserts_once_and_dispatches_only_accepted_requests(self) -> None:
+        engine = create_engine("sqlite+pysqlite:///:memory:")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+
+        def request_command(event_id: str) -> ProcessingRequestCommand:
+            event = request_event()
+            event["eventId"] = event_id
+            return parse_asset_processing_requested_event(event).to_processing_command()
+
+        repository = SqlAlchemyProcessingRequestRepository(db)
+        repository.get_or_create(request_command("event-ready"))
+        repository.mark_enqueued("event-ready", "asset-processing-event-ready")
+        db.query(models.ProcessingRequest).filter_by(event_id="event-ready").update({"status": "ready"})
+        repository.get_or_create(request_command("event-stuck"))
+        db.commit()
+        dispatcher = MagicMock()
+        dispatcher.dispatch_many.side_effect = lambda commands: tuple(
+            ProcessingDispatch(f"asset-processing-{command.event_id}") for command in commands
+        )
+        service = DispatchProcessingApplicationService(repository=repository, dispatcher=dispatcher)
+
+        with patch.object(db, "commit", wraps=db.commit) as commit:
+            results = service.dispatch_many(
+                [
+                    request_command("event-ready"),
+                    request_command("event-stuck"),
+                    request_command("event-new"),
+                    request_command("event-new"),
+                ]
+            )
+
+        self.assertEqual(commit.call_count, 2)
+        dispatched = dispatcher.dispatch_many.call_args.args[0]
+        self.assertEqual([command.event_id for command in dispatched], ["event-stuck", "event-new"])
+        self.assertIsInstance(dispatched[0], ProcessingExecutionCommand)
+        self.assertEqual(
+            [(result.event_id, result.duplicate, result.status, result.task_id) for result in results],
+            [
+                ("event-ready", True, "ready", "asset-processing-event-ready"),
+                ("event-stuck", False, "enqueued", "asset-processing-event-stuck"),
+                ("event-new", False, "enqueued", "asset-processing-event-new"),
+            ],
+        )
+        self.assertEqual(db.query(models.ProcessingRequest).count(), 3)
+        db.close()
+        engine.dispose()
+
+    def test_dispatch_many_publishes_one_celery_group_with_deterministic_task_ids(self) -> None:
+        group_result = SimpleNamespace(results=[SimpleNamespace(id="asset-processing-event-1")])
+        with patch("celery.group") as group:
+            group.return_value.apply_async.return_value = group_result
+            dispatched = CeleryProcessingTaskDispatcher().dispatch_many([command()])
+
+        [signature] = group.call_args.args[0]
+        self.assertEqual(signature.task, process_asset_object_task.name)
+        self.assertEqual(signature.options["task_id"], "asset-processing-event-1")
+        self.assertEqual(signature.args[0], encode_processing_task_payload(command()))
+        group.return_value.apply_async.assert_called_once_with()
+        self.assertEqual(dispatched, (ProcessingDispatch("asset-processing-event-1"),))
+        self.assertEqual(CeleryProcessingTaskDispatcher().dispatch_many([]), ())
+
+    def test_batch_consumer_adapter_rejects_invalid_events_and_bulk_dispatches_the_rest(self) -> None:
+        service = MagicMock()
+        service.dispatch_many.return_value = (
+            SimpleNamespace(accepted=True, duplicate=False, event_id="event-1", task_id="asset-processing-event-1"),
+        )
+        with patch(
+            "app.consumers.asset_processing_consumer.build_processing_dispatch_service",
+            return_value=service,
+        ):
+            results = handle_asset_processing_messages([b"not-json", request_event()], MagicMock())
+
+        [dispatched] = service.dispatch_many.call_args.args[0]
+        self.assertIsInstance(dispatched, ProcessingRequestCommand)
+        service.dispatch.assert_not_called()
+        self.assertTrue(results[0].rejected)
+        self.assertEqual((results[1].event_id, results[1].celery_task_id), ("event-1", "asset-processing-event-1"))
+
 
 class ExecuteProcessingApplicationServiceTest(unittest.TestCase):
-    def build_service(self, *, segments=None, failure=None, status=None):
+    def build_service(self, *, segments=None, failure=None, status=None, transcript_cache=None):
         store = MagicMock()
         store.claim.return_value = status
         sink = MagicMock()
@@ -141,8 +270,11 @@ class ExecuteProcessingApplicationServiceTest(unittest.TestCase):
             transcriber.transcribe.side_effect = failure
 
         class MediaSource:
+            acquired = 0
+
             @contextmanager
             def acquire(self, _command):
+                MediaSource.acquired += 1
                 yield "/tmp/media.mp4"
 
         fixed_now = datetime(2026, 7, 13, tzinfo=UTC)
@@ -151,8 +283,10 @@ class ExecuteProcessingApplicationServiceTest(unittest.TestCase):
             transcriber=transcriber,
             artifact_store=store,
             result_sink=sink,
+            transcript_cache=transcript_cache,
             clock=lambda: fixed_now,
         )
+        self.media_source = MediaSource
         return service, store, sink, transcriber
 
     def test_success_executes_linearly_and_records_one_canonical_outcome(self) -> None:
@@ -186,6 +320,408 @@ class ExecuteProcessingApplicationServiceTest(unittest.TestCase):
         sink.record.assert_not_called()
         store.commit.assert_not_called()
 
+    def test_cache_hit_skips_media_and_transcription_but_still_persists_and_records(self) -> None:
+        cached = (ProcessingTranscriptRow(0, "cached", 0, 900),)
+        cache = MagicMock()
+        cache.key_for.return_value = "content-key"
+        cache.get.return_value = cached
+        service, store, sink, transcriber = self.build_service(transcript_cache=cache)
+
+        outcome = service.execute(command())
+
+        self.assertIsInstance(outcome, ProcessingSucceeded)
+        self.assertEqual(outcome.artifact.rows, cached)
+        self.assertEqual(self.media_source.acquired, 0)
+        transcriber.transcribe.assert_not_called()
+        store.persist_success.assert_called_once_with(outcome)
+        sink.record.assert_called_once_with(outcome)
+        cache.put.assert_not_called()
+
+    def test_cache_miss_stores_rows_and_cache_faults_do_not_fail_processing(self) -> None:
+        cache = MagicMock()
+        cache.key_for.return_value = "content-key"
+        cache.get.return_value = None
+        cache.put.side_effect = RuntimeError("cache database unavailable")
+        service, store, _, transcriber = self.build_service(transcript_cache=cache)
+
+        outcome = service.execute(command())
+
+        self.assertIsInstance(outcome, ProcessingSucceeded)
+        self.assertEqual(self.media_source.acquired, 1)
+        transcriber.transcribe.assert_called_once()
+        cache.put.assert_called_once_with("content-key", outcome.artifact.rows)
+        store.commit.assert_called_once_with()
+
+
+class SqlAlchemyTranscriptCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.storage = MagicMock()
+        self.now = datetime(2026, 7, 13, tzinfo=UTC)
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self.engine.dispose()
+
+    def build_cache(self, *, profile: str = "whisper=1|model=base", max_bytes: int = 10_000):
+        return SqlAlchemyProcessingTranscriptCache(
+            self.db,
+            self.storage,
+            transcription_profile=lambda _command: profile,
+            max_bytes=max_bytes,
+            clock=lambda: self.now,
+        )
+
+    def test_key_depends_on_content_identity_and_transcription_profile(self) -> None:
+        self.storage.head_object.return_value = {"ETag": '"abc"', "ContentLength": 128}
+        copied = ProcessingExecutionCommand(**{**command().__dict__, "object_key": "other/copy.mp4"})
+
+        self.assertEqual(self.build_cache().key_for(command()), self.build_cache().key_for(copied))
+        self.assertNotEqual(
+            self.build_cache().key_for(command()),
+            self.build_cache(profile="faster-whisper=1|model=base").key_for(command()),
+        )
+        etag_key = self.build_cache().key_for(command())
+        self.storage.head_object.return_value = {"ETag": '"abc"', "ChecksumSHA256": "c2hh", "ContentLength": 128}
+        self.assertNotEqual(self.build_cache().key_for(command()), etag_key)
+        self.storage.head_object.return_value = {"ContentLength": 128}
+        self.assertIsNone(self.build_cache().key_for(command()))
+
+    def test_round_trip_and_least_recently_used_eviction(self) -> None:
+        cache = self.build_cache(max_bytes=60)
+        rows = (ProcessingTranscriptRow(0, "first", 0, 900), ProcessingTranscriptRow(1, "second", None, None))
+        cache.put("old", rows)
+        self.now = datetime(2026, 7, 14, tzinfo=UTC)
+        self.assertEqual(cache.get("old"), rows)
+        self.assertIsNone(cache.get("missing"))
+
+        self.now = datetime(2026, 7, 15, tzinfo=UTC)
+        cache.put("new", (ProcessingTranscriptRow(0, "newer", 0, 100),))
+        self.now = datetime(2026, 7, 16, tzinfo=UTC)
+        cache.put("newest", (ProcessingTranscriptRow(0, "newest", 0, 100),))
+
+        self.assertIsNone(cache.get("old"))
+        self.assertIsNotNone(cache.get("newest"))
+
+    def test_long_profiles_are_stored_as_a_digest_and_failed_puts_roll_back(self) -> None:
+        self.storage.head_object.return_value = {"ETag": '"abc"', "ContentLength": 128}
+        cache = self.build_cache(profile="whisper=1|" + "long_media=1800/600/5|" * 40)
+        key = cache.key_for(command())
+        cache.put(key, (ProcessingTranscriptRow(0, "first", 0, 900),))
+        stored = self.db.get(models.ProcessingTranscriptCacheEntry, key)
+        self.assertEqual(len(stored.transcription_profile), 64)
+
+        with patch.object(self.db, "commit", side_effect=RuntimeError("value too long")):
+            with patch.object(self.db, "rollback", wraps=self.db.rollback) as rollback:
+                with self.assertRaises(RuntimeError):
+                    cache.put("other", (ProcessingTranscriptRow(0, "second", 0, 900),))
+        rollback.assert_called_once_with()
+        self.assertIsNone(self.db.get(models.ProcessingTranscriptCacheEntry, "other"))
+
+
+class StreamingMediaSourceTest(unittest.TestCase):
+    def build_source(self, chunks, *, failure=None):
+        body = MagicMock()
+
+        def iter_chunks(_size):
+            yield from chunks
+            if failure is not None:
+                raise failure
+
+        body.iter_chunks.side_effect = iter_chunks
+        client = MagicMock()
+        client.open_object_stream.return_value = body
+        source = StreamingObjectStorageProcessingMediaSource(
+            client,
+            streamable_content_types=frozenset({"audio/mpeg"}),
+        )
+        return source, client, body
+
+    def audio_command(self, content_type: str = "audio/mpeg") -> ProcessingExecutionCommand:
+        return ProcessingExecutionCommand(**{**command().__dict__, "content_type": content_type})
+
+    def test_streamable_media_is_read_through_a_pipe_while_downloading(self) -> None:
+        source, client, body = self.build_source([b"ID3", b"frames"])
+        with source.acquire(self.audio_command("audio/mpeg; codecs=mp3")) as media_path:
+            with open(media_path, "rb") as media:
+                self.assertEqual(media.read(), b"ID3frames")
+        client.download_to_file.assert_not_called()
+        body.close.assert_called_once_with()
+
+    def test_truncated_stream_fails_when_the_context_exits(self) -> None:
+        source, _, _ = self.build_source([b"partial"], failure=ConnectionError("connection reset"))
+        with self.assertRaises(ConnectionError):
+            with source.acquire(self.audio_command()) as media_path:
+                with open(media_path, "rb") as media:
+                    media.read()
+
+    def test_get_object_failure_gives_the_reader_eof_and_fails_the_job(self) -> None:
+        source, client, _ = self.build_source([])
+        client.open_object_stream.side_effect = PermissionError("AccessDenied")
+        read: list[bytes] = []
+        with self.assertRaises(PermissionError):
+            with source.acquire(self.audio_command()) as media_path:
+                # Stands in for ffmpeg; a daemon thread so a regression fails instead of hanging the suite.
+                reader = threading.Thread(target=lambda: read.append(open(media_path, "rb").read()), daemon=True)
+                reader.start()
+                reader.join(3)
+                self.assertFalse(reader.is_alive())
+        self.assertEqual(read, [b""])
+
+    def test_unread_pipe_does_not_block_and_seekable_containers_download(self) -> None:
+        source, client, _ = self.build_source([b"x" * 70_000] * 4)
+        with source.acquire(self.audio_command()):
+            pass
+
+        client.download_to_file.return_value = "/tmp/asset/media.mp4"
+        with source.acquire(self.audio_command("video/mp4")) as media_path:
+            self.assertEqual(media_path, "/tmp/asset/media.mp4")
+        client.open_object_stream.assert_called_once()
+
+
+class LocalMediaCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def write(self, payload: bytes):
+        def download(path: str) -> None:
+            Path(path).write_bytes(payload)
+
+        return MagicMock(side_effect=download)
+
+    def test_concurrent_requests_download_once_and_get_private_links(self) -> None:
+        cache = LocalMediaCache(str(self.root / "cache"), max_bytes=1_000)
+        download = self.write(b"media")
+        destinations = [str(self.root / f"job-{index}.mp3") for index in range(4)]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            hits = list(pool.map(
+                lambda destination: cache.materialize(
+                    bucket="bucket",
+                    object_key="objects/a.mp3",
+                    etag="etag-1",
+                    destination_path=destination,
+                    download=download,
+                ),
+                destinations,
+            ))
+
+        download.assert_called_once()
+        self.assertEqual(sorted(hits), [False, True, True, True])
+        self.assertTrue(all(Path(destination).read_bytes() == b"media" for destination in destinations))
+        self.assertEqual(list((self.root / "cache" / "staging").iterdir()), [])
+
+    def test_least_recently_used_entries_are_evicted_over_budget(self) -> None:
+        cache = LocalMediaCache(str(self.root / "cache"), max_bytes=10)
+
+        def fetch(key: str, etag: str = "v1") -> bool:
+            destination = self.root / f"{key}-{etag}-{uuid4()}"
+            return cache.materialize(
+                bucket="bucket",
+                object_key=key,
+                etag=etag,
+                destination_path=str(destination),
+                download=self.write(b"12345"),
+            )
+
+        fetch("a")
+        fetch("b")
+        objects = self.root / "cache" / "objects"
+        os.utime(objects / LocalMediaCache.entry_name("bucket", "a", "v1"), (1, 1))
+        os.utime(objects / LocalMediaCache.entry_name("bucket", "b", "v1"), (2, 2))
+        self.assertTrue(fetch("a"))
+        fetch("c")
+
+        self.assertTrue(fetch("a"))
+        self.assertFalse(fetch("b"))
+        self.assertFalse(fetch("a", etag="v2"))
+
+    def test_media_source_uses_the_cache_keyed_by_etag(self) -> None:
+        client = MagicMock()
+        client.head_object.return_value = {"ETag": '"etag-1"'}
+        client.download_to_path.side_effect = lambda **kwargs: Path(kwargs["destination_path"]).write_bytes(b"x")
+        source = ObjectStorageProcessingMediaSource(
+            client,
+            media_cache=LocalMediaCache(str(self.root / "cache"), max_bytes=1_000),
+        )
+
+        for _ in range(2):
+            with source.acquire(command()) as media_path:
+                self.assertEqual(Path(media_path).read_bytes(), b"x")
+
+        client.download_to_path.assert_called_once()
+        self.assertEqual(client.download_to_path.call_args.kwargs["etag"], "etag-1")
+        client.download_to_file.assert_not_called()
+
+    def test_object_overwritten_after_head_is_served_but_not_cached_under_the_old_etag(self) -> None:
+        def download_file(bucket, key, destination, ExtraArgs=None):
+            if ExtraArgs is not None:
+                self.assertEqual(ExtraArgs, {"IfMatch": '"etag-1"'})
+                raise ClientError(
+                    {"Error": {"Code": "PreconditionFailed"}, "ResponseMetadata": {"HTTPStatusCode": 412}},
+                    "HeadObject",
+                )
+            Path(destination).write_bytes(b"new")
+
+        client = ObjectStorageClient(
+            endpoint_url="http://minio:9000",
+            access_key_id="key",
+            secret_access_key="secret",
+            region_name="us-east-1",
+        )
+        client._client = MagicMock()
+        client._client.head_object.return_value = {"ETag": '"etag-1"'}
+        client._client.download_file.side_effect = download_file
+        cache_root = self.root / "cache"
+        source = ObjectStorageProcessingMediaSource(client, media_cache=LocalMediaCache(str(cache_root), max_bytes=1_000))
+
+        with self.assertLogs("app.processing.adapters.timing", level="INFO") as logs:
+            with source.acquire(command()) as media_path:
+                self.assertEqual(Path(media_path).read_bytes(), b"new")
+
+        self.assertIn("cache_result=miss", logs.output[0])
+        self.assertEqual(list((cache_root / "objects").iterdir()), [])
+        self.assertEqual(list((cache_root / "staging").iterdir()), [])
+
+
+class RangedDownloadTest(unittest.TestCase):
+    def storage_client(
+        self,
+        payload: bytes,
+        *,
+        reported_size: int | None = None,
+        etags: list[str] | None = None,
+    ) -> ObjectStorageClient:
+        served_etags = iter(etags or [])
+
+        def get_object(*, Bucket, Key, Range, IfMatch=None):
+            etag = next(served_etags, "v1")
+            if IfMatch is not None and IfMatch != f'"{etag}"':
+                raise ClientError(
+                    {"Error": {"Code": "PreconditionFailed"}, "ResponseMetadata": {"HTTPStatusCode": 412}},
+                    "GetObject",
+                )
+            start, end = (int(value) for value in Range.removeprefix("bytes=").split("-"))
+            body = MagicMock()
+            data = payload[start:end + 1]
+            body.iter_chunks.side_effect = lambda _size: iter([data[:2], data[2:]])
+            total = len(payload) if reported_size is None else reported_size
+            return {"Body": body, "ContentRange": f"bytes {start}-{end}/{total}", "ETag": f'"{etag}"'}
+
+        client = ObjectStorageClient(
+            endpoint_url="http://minio:9000",
+            access_key_id="key",
+            secret_access_key="secret",
+            region_name="us-east-1",
+        )
+        client._client = MagicMock()
+        client._client.head_object.return_value = {"ContentLength": len(payload), "ETag": '"v1"'}
+        client._client.get_object.side_effect = get_object
+        return client
+
+    def download(self, client: ObjectStorageClient, temp_dir: str, *, part_size_bytes: int = 10) -> Path:
+        destination = Path(temp_dir) / "media.mp4"
+        client.download_ranged_to_path(
+            bucket="bucket",
+            object_key="objects/media.mp4",
+            destination_path=str(destination),
+            part_size_bytes=part_size_bytes,
+            concurrency=4,
+        )
+        return destination
+
+    def test_parts_are_fetched_concurrently_into_one_preallocated_file(self) -> None:
+        payload = bytes(range(97))
+        client = self.storage_client(payload)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.assertEqual(self.download(client, temp_dir).read_bytes(), payload)
+        self.assertEqual(client._client.get_object.call_count, 10)
+
+    def test_object_length_change_fails_the_download(self) -> None:
+        client = self.storage_client(bytes(40), reported_size=41)
+        with tempfile.TemporaryDirectory() as temp_dir, self.assertRaises(ValueError):
+            self.download(client, temp_dir, part_size_bytes=16)
+
+    def test_parts_are_pinned_to_the_head_etag_and_a_replaced_object_fails(self) -> None:
+        payload = bytes(range(40))
+        client = self.storage_client(payload)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.download(client, temp_dir)
+        client._client.head_object.assert_called_once()
+        self.assertEqual(
+            {call.kwargs["IfMatch"] for call in client._client.get_object.call_args_list},
+            {'"v1"'},
+        )
+
+        replaced = self.storage_client(payload, etags=["v1", "v2", "v2", "v2"])
+        with tempfile.TemporaryDirectory() as temp_dir, self.assertRaisesRegex(ValueError, "changed"):
+            self.download(replaced, temp_dir)
+
+    def test_stale_request_size_only_selects_the_mode_and_head_sizes_the_download(self) -> None:
+        payload = bytes(range(97))
+        client = self.storage_client(payload)
+        source = ObjectStorageProcessingMediaSource(
+            client,
+            ranged_download=RangedDownloadPolicy(min_size_bytes=1_000, part_size_bytes=10, concurrency=4),
+        )
+        stale = ProcessingExecutionCommand(**{**command().__dict__, "size_bytes": 5_000})
+        with source.acquire(stale) as media_path:
+            self.assertEqual(Path(media_path).read_bytes(), payload)
+        self.assertEqual(client._client.get_object.call_count, 10)
+
+    def test_cache_hits_log_no_download_mode_and_misses_log_fetched_bytes(self) -> None:
+        client = MagicMock()
+        client.head_object.return_value = {"ETag": '"abc"', "ContentLength": 300}
+        client.download_ranged_to_path.side_effect = (
+            lambda **kwargs: Path(kwargs["destination_path"]).write_bytes(b"x" * 300)
+        )
+        with tempfile.TemporaryDirectory() as cache_dir:
+            source = ObjectStorageProcessingMediaSource(
+                client,
+                media_cache=LocalMediaCache(cache_dir, max_bytes=10_000),
+                ranged_download=RangedDownloadPolicy(min_size_bytes=1_000, part_size_bytes=100, concurrency=2),
+            )
+            large = ProcessingExecutionCommand(**{**command().__dict__, "size_bytes": 5_000})
+            with self.assertLogs("app.processing.adapters.timing", level="INFO") as logs:
+                with source.acquire(large):
+                    pass
+                with source.acquire(large):
+                    pass
+
+        miss, hit = logs.output
+        self.assertIn("download_mode=ranged", miss)
+        self.assertIn("fetched_bytes=300", miss)
+        self.assertEqual(client.download_ranged_to_path.call_args.kwargs["head"], client.head_object.return_value)
+        client.head_object.assert_called()
+        self.assertIn("cache_result=hit", hit)
+        self.assertNotIn("download_mode", hit)
+        self.assertNotIn("throughput_mib_s", hit)
+
+    def test_request_size_selects_ranged_or_single_stream_download(self) -> None:
+        client = MagicMock()
+        client.download_to_file.return_value = "/tmp/asset/media.mp4"
+        source = ObjectStorageProcessingMediaSource(
+            client,
+            ranged_download=RangedDownloadPolicy(min_size_bytes=1_000, part_size_bytes=100, concurrency=2),
+        )
+
+        with source.acquire(command()):
+            pass
+        client.download_ranged_to_path.assert_not_called()
+
+        large = ProcessingExecutionCommand(**{**command().__dict__, "size_bytes": 5_000})
+        with source.acquire(large) as media_path:
+            self.assertTrue(media_path.endswith("media.mp4"))
+        client.download_ranged_to_path.assert_called_once()
+        self.assertNotIn("size_bytes", client.download_ranged_to_path.call_args.kwargs)
+        client.download_to_file.assert_called_once()
+
 
 class CeleryWorkerAdapterTest(unittest.TestCase):
     def test_task_names_and_worker_discovery_metadata_are_unchanged(self) -> None:
@@ -208,6 +744,61 @@ class CeleryWorkerAdapterTest(unittest.TestCase):
         self.assertEqual(result, {"status": "ready", "asset_id": "asset-1", "segments": ["first"]})
         service.close.assert_called_once_with()
 
+    def test_compact_results_drop_segment_text_and_the_task_route_reads_it_back(self) -> None:
+        outcome = ProcessingSucceeded(
+            "event-1",
+            "asset-1",
+            SimpleNamespace(rows=(SimpleNamespace(text="first"), SimpleNamespace(text="second")), segment_count=2),
+            datetime(2026, 7, 13, tzinfo=UTC),
+        )
+        service = MagicMock()
+        service.execute.return_value = outcome
+        with (
+            patch("app.tasks.video_tasks.build_processing_execution_service", return_value=service),
+            patch.object(settings, "CELERY_COMPACT_TASK_RESULTS_ENABLED", True),
+        ):
+            result = process_asset_object_task.run(encode_processing_task_payload(command()))
+        self.assertEqual(
+            result,
+            {
+                "status": "ready",
+                "asset_id": "asset-1",
+                "segment_count": 2,
+                "artifact": {"type": "processing_request_transcript", "processing_request_id": "event-1"},
+            },
+        )
+
+        engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine)()
+        SqlAlchemyProcessingRequestRepository(db).get_or_create(
+            parse_asset_processing_requested_event(request_event()).to_processing_command()
+        )
+        db.add_all(
+            [
+                models.ProcessingRequestTranscript(processing_request_event_id="event-1", segment_index=1, text="second"),
+                models.ProcessingRequestTranscript(processing_request_event_id="event-1", segment_index=0, text="first"),
+            ]
+        )
+        db.commit()
+        stored = SimpleNamespace(state="SUCCESS", result=result)
+
+        async def run(fn, *args):
+            return fn(db, *args)
+
+        with patch.object(process_video_task, "AsyncResult", return_value=stored):
+            compact = asyncio.run(get_task_status("asset-processing-event-1", run=run))
+            expanded = asyncio.run(get_task_status("asset-processing-event-1", include_segments=True, run=run))
+        self.assertNotIn("segments", compact["result"])
+        self.assertEqual(expanded["result"]["segments"], ["first", "second"])
+        self.assertEqual(expanded["result"]["segment_count"], 2)
+        db.close()
+        engine.dispose()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,11 @@
+import os
+import threading
+import time
 import unittest
+from dataclasses import replace
 from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -16,12 +20,18 @@ from app.processing.domain.models import (
 )
 from app.result_delivery.adapters.event_codec import ProcessingResultEventCodec
 from app.result_delivery.adapters.kafka_publisher import KafkaProcessingResultPublisher
+from app.result_delivery.adapters.outbox_notifications import (
+    PROCESSING_OUTBOX_NOTIFY_CHANNEL,
+    PostgresOutboxNotificationListener,
+)
 from app.result_delivery.adapters.sqlalchemy_repository import SqlAlchemyProcessingResultOutboxRepository
 from app.result_delivery.application.record_result import RecordProcessingResultApplicationService
 from app.result_delivery.application.relay import (
+    ProcessingOutboxRelayResult,
     ProcessingResultRelayPolicy,
     RelayProcessingResultsApplicationService,
 )
+from app.result_delivery.application.relay_schedule import AdaptiveRelayPolicy, AdaptiveRelaySchedule
 from app.result_delivery.domain.event import ProcessingResultEvent
 from app.result_delivery.domain.failures import (
     PermanentProcessingResultPublisherError,
@@ -163,24 +173,147 @@ class SqlAlchemyProcessingResultOutboxRepositoryTest(unittest.TestCase):
         self.assertEqual(db.query(models.ProcessingOutboxEvent).count(), 1)
         db.close()
 
-    def test_claim_is_compare_and_set_and_only_one_session_wins(self) -> None:
+    def test_append_notifies_listeners_in_the_same_transaction_on_postgresql(self) -> None:
+        from sqlalchemy.dialects import postgresql
+
+        db = MagicMock()
+        db.query.return_value.filter.return_value.first.return_value = None
+        db.get_bind.return_value.dialect.name = "postgresql"
+        SqlAlchemyProcessingResultOutboxRepository(db).append(ready_event())
+
+        db.add.assert_called_once()
+        sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        self.assertIn("pg_notify", sql)
+        db.commit.assert_not_called()
+
+    def test_count_due_events_ignores_future_and_claimed_rows(self) -> None:
+        from app import models
+
+        db = self.Session()
+        repository = SqlAlchemyProcessingResultOutboxRepository(db)
+        for index in range(3):
+            repository.append(replace(ready_event(f"result-{index}"), causation_event_id=f"request-{index}"))
+        db.commit()
+        db.query(models.ProcessingOutboxEvent).filter_by(id="result-1").update({"status": "publishing"})
+        db.query(models.ProcessingOutboxEvent).filter_by(id="result-2").update(
+            {"next_attempt_at": NOW + timedelta(minutes=1)}
+        )
+        db.commit()
+        self.assertEqual(repository.count_due_events(now=NOW), 1)
+        self.assertEqual(repository.count_due_events(now=NOW + timedelta(minutes=1)), 2)
+        db.close()
+
+    def test_claim_due_batch_is_compare_and_set_and_only_one_session_wins(self) -> None:
         db1 = self.Session()
         db2 = self.Session()
         repository1 = SqlAlchemyProcessingResultOutboxRepository(db1)
         repository2 = SqlAlchemyProcessingResultOutboxRepository(db2)
         repository1.append(ready_event())
         db1.commit()
-        self.assertIsNotNone(repository1.claim("result-1", now=NOW))
-        self.assertIsNone(repository2.claim("result-1", now=NOW))
+        self.assertEqual([event.id for event in repository1.claim_due_batch(now=NOW, limit=1)], ["result-1"])
+        self.assertEqual(repository2.claim_due_batch(now=NOW, limit=1), ())
         db1.close()
         db2.close()
 
+    def test_claim_due_batch_claims_due_events_once_in_creation_order(self) -> None:
+        from app import models
+
+        db1 = self.Session()
+        db2 = self.Session()
+        repository1 = SqlAlchemyProcessingResultOutboxRepository(db1)
+        repository2 = SqlAlchemyProcessingResultOutboxRepository(db2)
+        for index in range(3):
+            repository1.append(
+                replace(ready_event(f"result-{index}"), causation_event_id=f"request-{index}")
+            )
+            db1.flush()
+            db1.query(models.ProcessingOutboxEvent).filter_by(id=f"result-{index}").update(
+                {"created_at": NOW + timedelta(seconds=index)}
+            )
+        db1.query(models.ProcessingOutboxEvent).filter_by(id="result-2").update(
+            {"next_attempt_at": NOW + timedelta(minutes=5)}
+        )
+        db1.commit()
+
+        claimed = repository1.claim_due_batch(now=NOW, limit=10)
+
+        self.assertEqual([event.id for event in claimed], ["result-0", "result-1"])
+        self.assertEqual(claimed[0].payload, ready_event().payload)
+        self.assertEqual(claimed[1].causation_event_id, "request-1")
+        self.assertEqual(repository2.claim_due_batch(now=NOW, limit=10), ())
+        statuses = dict(db2.query(models.ProcessingOutboxEvent.id, models.ProcessingOutboxEvent.status).all())
+        self.assertEqual(
+            statuses,
+            {"result-0": "publishing", "result-1": "publishing", "result-2": "pending"},
+        )
+        self.assertTrue(repository1.finalize_published("result-0", now=NOW))
+        db1.close()
+        db2.close()
+
+    def test_claim_due_batch_locks_candidates_with_skip_locked_on_postgresql(self) -> None:
+        from sqlalchemy.dialects import postgresql
+
+        db = MagicMock()
+        db.execute.return_value.all.return_value = []
+        SqlAlchemyProcessingResultOutboxRepository(db).claim_due_batch(now=NOW, limit=25)
+
+        statement = db.execute.call_args.args[0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        self.assertIn("FOR UPDATE SKIP LOCKED", sql)
+        self.assertIn("RETURNING", sql)
+        db.commit.assert_called_once()
+
+    def test_bulk_transitions_apply_per_event_rules_in_one_commit(self) -> None:
+        from app import models
+        from app.result_delivery.domain.failure_classification import classify_publication_failure
+
+        db = self.Session()
+        repository = SqlAlchemyProcessingResultOutboxRepository(db)
+        for index in range(4):
+            repository.append(replace(ready_event(f"result-{index}"), causation_event_id=f"request-{index}"))
+        db.commit()
+        db.query(models.ProcessingOutboxEvent).filter_by(id="result-2").update({"attempt_count": 1})
+        db.query(models.ProcessingOutboxEvent).filter_by(id="result-3").update({"attempt_count": 1, "recovery_cycle_count": 3})
+        db.commit()
+        self.assertEqual(len(repository.claim_due_batch(now=NOW, limit=10)), 4)
+        transient = classify_publication_failure(TransientProcessingResultPublisherError())
+        permanent = classify_publication_failure(PermanentProcessingResultPublisherError())
+
+        with patch.object(db, "commit", wraps=db.commit) as commit:
+            finalized = repository.finalize_published_many(["result-0", "missing"], now=NOW)
+            transitions = repository.record_publication_failures(
+                [("result-1", transient), ("result-2", permanent), ("result-3", transient), ("missing", transient)],
+                now=NOW,
+                max_attempts=2,
+                retry_delay_seconds=60,
+                recovery_max_cycles=3,
+                recovery_cooldown_seconds=30,
+            )
+        self.assertEqual(commit.call_count, 2)
+
+        self.assertEqual(finalized, frozenset({"result-0"}))
+        self.assertEqual(transitions, {"result-1": True, "result-2": False, "result-3": False})
+        rows = {row.id: row for row in db.query(models.ProcessingOutboxEvent).all()}
+        self.assertEqual(rows["result-0"].status, "published")
+        self.assertEqual(rows["result-1"].status, "pending")
+        self.assertEqual(rows["result-1"].attempt_count, 1)
+        self.assertEqual(rows["result-1"].next_attempt_at, (NOW + timedelta(seconds=60)).replace(tzinfo=None))
+        self.assertIsNone(rows["result-1"].failure_disposition)
+        self.assertEqual(rows["result-2"].status, "failed")
+        self.assertEqual(rows["result-2"].failure_disposition, "permanent")
+        self.assertEqual(rows["result-2"].last_failure_category, permanent.safe_category)
+        self.assertIsNone(rows["result-2"].next_recovery_at)
+        self.assertEqual(rows["result-3"].failure_disposition, "recovery_exhausted")
+        self.assertEqual(rows["result-3"].recovery_exhausted_at, NOW.replace(tzinfo=None))
+        self.assertIsNone(rows["result-3"].next_recovery_at)
+        db.close()
+
     def test_publish_failure_returns_to_pending_then_exhausts_with_existing_limits(self) -> None:
         db = self.Session()
         repository = SqlAlchemyProcessingResultOutboxRepository(db)
         repository.append(ready_event())
         db.commit()
-        repository.claim("result-1", now=NOW)
+        repository.claim_due_batch(now=NOW, limit=1)
         from app.result_delivery.domain.failure_classification import classify_publication_failure
 
         retry = repository.record_publication_failure(
@@ -193,8 +326,9 @@ class SqlAlchemyProcessingResultOutboxRepositoryTest(unittest.TestCase):
             recovery_cooldown_seconds=60,
         )
         self.assertTrue(retry)
-        claimed = repository.claim("result-1", now=NOW + timedelta(seconds=60))
-        self.assertIsNotNone(claimed)
+        self.assertEqual(repository.claim_due_batch(now=NOW + timedelta(seconds=59), limit=1), ())
+        claimed = repository.claim_due_batch(now=NOW + timedelta(seconds=60), limit=1)
+        self.assertEqual([event.id for event in claimed], ["result-1"])
         retry = repository.record_publication_failure(
             "result-1",
             classification=classify_publication_failure(TransientProcessingResultPublisherError()),
@@ -214,13 +348,110 @@ class SqlAlchemyProcessingResultOutboxRepositoryTest(unittest.TestCase):
         db.close()
 
 
+class FakeListenConnection:
+    def __init__(self) -> None:
+        self.read_fd, self.write_fd = os.pipe()
+        self.notifies: list[object] = []
+        self.executed: list[str] = []
+        self.autocommit = False
+
+    def fileno(self) -> int:
+        return self.read_fd
+
+    def cursor(self):
+        connection = self
+
+        class Cursor:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *_exc) -> None:
+                return None
+
+            def execute(self, sql: str) -> None:
+                connection.executed.append(sql)
+
+        return Cursor()
+
+    def notify(self, payload: str) -> None:
+        os.write(self.write_fd, b"x")
+        self.notifies.append(SimpleNamespace(channel=PROCESSING_OUTBOX_NOTIFY_CHANNEL, payload=payload))
+
+    def poll(self) -> None:
+        os.read(self.read_fd, 512)
+
+
+class PostgresOutboxNotificationListenerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.connection = FakeListenConnection()
+        self.pooled = MagicMock(driver_connection=self.connection)
+        engine = MagicMock()
+        engine.raw_connection.return_value = self.pooled
+        self.listener = PostgresOutboxNotificationListener(engine)
+
+    def tearDown(self) -> None:
+        self.listener.close()
+        os.close(self.connection.read_fd)
+        os.close(self.connection.write_fd)
+
+    def test_listens_on_a_detached_autocommit_connection(self) -> None:
+        self.assertTrue(self.listener.listen())
+        self.pooled.detach.assert_called_once_with()
+        self.assertTrue(self.connection.autocommit)
+        self.assertEqual(self.connection.executed, [f"LISTEN {PROCESSING_OUTBOX_NOTIFY_CHANNEL}"])
+
+    def test_wait_returns_on_notification_wake_or_timeout(self) -> None:
+        self.listener.listen()
+        self.connection.notify("result-1")
+        self.connection.notify("result-2")
+        self.assertTrue(self.listener.wait(5))
+        self.assertEqual(self.connection.notifies, [])
+
+        self.listener.wake()
+        started = time.monotonic()
+        self.assertFalse(self.listener.wait(5))
+        self.assertLess(time.monotonic() - started, 1)
+
+        self.assertFalse(self.listener.wait(0.01))
+
+    def test_wake_after_close_is_a_no_op_and_close_is_idempotent(self) -> None:
+        self.listener.listen()
+        self.listener.close()
+        with patch("app.result_delivery.adapters.outbox_notifications.os.write") as write:
+            self.listener.wake()
+        write.assert_not_called()
+        self.listener.close()
+        self.pooled.close.assert_called_once_with()
+
+    def test_wake_from_a_signal_handler_during_close_does_not_block(self) -> None:
+        engine = MagicMock()
+        listener = PostgresOutboxNotificationListener(engine)
+        engine.raw_connection.return_value.close.side_effect = listener.wake
+        engine.raw_connection.return_value.driver_connection = MagicMock()
+        listener.listen()
+        closer = threading.Thread(target=listener.close, daemon=True)
+        closer.start()
+        closer.join(2)
+        self.assertFalse(closer.is_alive())
+
+    def test_listen_failure_degrades_to_timeout(self) -> None:
+        engine = MagicMock()
+        engine.raw_connection.side_effect = ConnectionError("database down")
+        listener = PostgresOutboxNotificationListener(engine)
+        try:
+            with self.assertLogs("app.result_delivery.adapters.outbox_notifications", level="WARNING"):
+                self.assertFalse(listener.wait(0.01))
+        finally:
+            listener.close()
+
+
 class RelayProcessingResultsApplicationServiceTest(unittest.TestCase):
     def test_relay_publishes_neutral_event_and_finalizes_through_repository(self) -> None:
         repository = MagicMock()
-        repository.select_due_event_ids.return_value = ("result-1",)
-        repository.claim.return_value = ready_event()
-        repository.finalize_published.return_value = True
+        repository.claim_due_batch.return_value = (ready_event(),)
+        repository.finalize_published_many.return_value = frozenset({"result-1"})
         publisher = MagicMock()
+        publisher.publish_batch.return_value = (None,)
         service = RelayProcessingResultsApplicationService(
             repository=repository,
             publisher=publisher,
@@ -228,17 +459,17 @@ class RelayProcessingResultsApplicationServiceTest(unittest.TestCase):
             clock=lambda: NOW,
         )
         result = service.relay_once(enabled=True)
-        publisher.publish.assert_called_once_with(ready_event())
-        repository.finalize_published.assert_called_once_with("result-1", now=NOW)
+        repository.claim_due_batch.assert_called_once_with(now=NOW, limit=10)
+        publisher.publish_batch.assert_called_once_with((ready_event(),))
+        repository.finalize_published_many.assert_called_once_with(["result-1"], now=NOW)
         self.assertEqual(result.published, 1)
 
     def test_transient_publisher_failure_uses_the_same_failure_transition(self) -> None:
         repository = MagicMock()
-        repository.select_due_event_ids.return_value = ("result-1",)
-        repository.claim.return_value = ready_event()
-        repository.record_publication_failure.return_value = True
+        repository.claim_due_batch.return_value = (ready_event(),)
+        repository.record_publication_failures.return_value = {"result-1": True}
         publisher = MagicMock()
-        publisher.publish.side_effect = TransientProcessingResultPublisherError("down")
+        publisher.publish_batch.return_value = (TransientProcessingResultPublisherError("down"),)
         service = RelayProcessingResultsApplicationService(
             repository=repository,
             publisher=publisher,
@@ -247,10 +478,86 @@ class RelayProcessingResultsApplicationServiceTest(unittest.TestCase):
         )
         result = service.relay_once(enabled=True)
         self.assertEqual(result.retried, 1)
-        classification = repository.record_publication_failure.call_args.kwargs["classification"]
+        [(_event_id, classification)] = repository.record_publication_failures.call_args.args[0]
         self.assertEqual(classification.disposition.value, "transient")
 
 
+    def test_relay_records_each_batch_outcome_independently(self) -> None:
+        repository = MagicMock()
+        repository.claim_due_batch.return_value = (
+            ready_event("result-1"),
+            ready_event("result-2"),
+            ready_event("result-3"),
+        )
+        repository.finalize_published_many.return_value = frozenset({"result-1"})
+        repository.record_publication_failures.return_value = {"result-2": True}
+        publisher = MagicMock()
+        publisher.publish_batch.return_value = (
+            None,
+            TransientProcessingResultPublisherError("down"),
+            PermanentProcessingResultPublisherError("bad"),
+        )
+        service = RelayProcessingResultsApplicationService(
+            repository=repository,
+            publisher=publisher,
+            policy=ProcessingResultRelayPolicy(10, 5, 60, 3, 60),
+            clock=lambda: NOW,
+        )
+
+        result = service.relay_once(enabled=True)
+
+        publisher.publish.assert_not_called()
+        repository.finalize_published.assert_not_called()
+        repository.record_publication_failure.assert_not_called()
+        repository.finalize_published_many.assert_called_once_with(["result-1"], now=NOW)
+        failures = repository.record_publication_failures.call_args.args[0]
+        self.assertEqual([event_id for event_id, _ in failures], ["result-2", "result-3"])
+        self.assertEqual(
+            (result.claimed, result.published, result.retried, result.failed, result.skipped),
+            (3, 1, 1, 0, 1),
+        )
+
+class AdaptiveRelayScheduleTest(unittest.TestCase):
+    def schedule(self) -> AdaptiveRelaySchedule:
+        return AdaptiveRelaySchedule(
+            AdaptiveRelayPolicy(
+                min_batch_size=10,
+                max_batch_size=40,
+                min_idle_seconds=0.5,
+                max_idle_seconds=4,
+                target_pass_seconds=1,
+            )
+        )
+
+    def test_full_fast_batches_loop_immediately_and_grow_to_the_cap(self) -> None:
+        schedule = self.schedule()
+        delays = []
+        for _ in range(4):
+            delays.append(schedule.observe(ProcessingOutboxRelayResult(claimed=schedule.batch_size), 0.1))
+        self.assertEqual(delays, [0.0, 0.0, 0.0, 0.0])
+        self.assertEqual(schedule.batch_size, 40)
+
+    def test_slow_passes_shrink_the_batch_but_not_below_the_floor(self) -> None:
+        schedule = self.schedule()
+        schedule.observe(ProcessingOutboxRelayResult(claimed=10), 0.1)
+        schedule.observe(ProcessingOutboxRelayResult(claimed=20), 0.1)
+        self.assertEqual(schedule.batch_size, 40)
+        self.assertEqual(schedule.observe(ProcessingOutboxRelayResult(claimed=40), 2.5), 0.0)
+        self.assertEqual(schedule.batch_size, 20)
+        schedule.observe(ProcessingOutboxRelayResult(claimed=3), 2.5)
+        schedule.observe(ProcessingOutboxRelayResult(claimed=3), 2.5)
+        self.assertEqual(schedule.batch_size, 10)
+        schedule.observe(ProcessingOutboxRelayResult(claimed=10), None)
+        self.assertEqual(schedule.batch_size, 10)
+
+    def test_idle_passes_back_off_exponentially_and_work_resets_the_delay(self) -> None:
+        schedule = self.schedule()
+        idle = [schedule.observe(ProcessingOutboxRelayResult(), 0.01) for _ in range(6)]
+        self.assertEqual(idle, [0.5, 1.0, 2.0, 4, 4, 4])
+        self.assertEqual(schedule.observe(ProcessingOutboxRelayResult(claimed=2), 0.01), 0.5)
+        self.assertEqual(schedule.observe(ProcessingOutboxRelayResult(), 0.01), 0.5)
+
+
 class KafkaProcessingResultPublisherTest(unittest.TestCase):
     def test_adapter_preserves_topic_key_ack_timeout_and_idempotence(self) -> None:
         publisher = KafkaProcessingResultPublisher(
@@ -276,6 +583,41 @@ class KafkaProcessingResultPublisherTest(unittest.TestCase):
         self.assertEqual(config["acks"], "all")
         self.assertTrue(config["enable_idempotence"])
 
+    def test_batch_sends_all_events_flushes_once_and_reports_each_outcome(self) -> None:
+        publisher = KafkaProcessingResultPublisher(
+            topic="asset.processing.result.v1",
+            bootstrap_servers=["broker:9092"],
+            send_timeout_seconds=10,
+            linger_ms=5,
+            batch_size_bytes=65536,
+            compression_type="lz4",
+        )
+        delivered = MagicMock()
+        delivered.get.return_value = SimpleNamespace(
+            topic="asset.processing.result.v1", partition=0, offset=1
+        )
+        timed_out = MagicMock()
+        timed_out.get.side_effect = TimeoutError("no ack")
+        producer = MagicMock()
+        producer.send.side_effect = [delivered, timed_out, ValueError("bad payload")]
+        publisher._producer = producer
+
+        outcomes = publisher.publish_batch(
+            (ready_event("result-1"), ready_event("result-2"), ready_event("result-3"))
+        )
+
+        self.assertEqual(producer.send.call_count, 3)
+        producer.flush.assert_called_once()
+        self.assertIsNone(outcomes[0])
+        self.assertIsInstance(outcomes[1], TransientProcessingResultPublisherError)
+        self.assertIn("event_id=result-2", str(outcomes[1]))
+        self.assertIsInstance(outcomes[2], PermanentProcessingResultPublisherError)
+        config = publisher._producer_config()
+        self.assertEqual(config["linger_ms"], 5)
+        self.assertEqual(config["batch_size"], 65536)
+        self.assertEqual(config["compression_type"], "lz4")
+        self.assertEqual(publisher.publish_batch(()), ())
+
 
 if __name__ == "__main__":
     unittest.main()
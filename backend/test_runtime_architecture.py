@@ -1,11 +1,20 @@
 import ast
+import asyncio
 import importlib
+import json
+import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import httpx
 from fastapi.routing import APIRoute
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app.bootstrap.api import create_api_app
 from app.bootstrap.consumer import build_processing_dispatch_service
@@ -14,9 +23,14 @@ from app.bootstrap.relay import (
     build_result_relay_service,
 )
 from app.consumers import asset_processing_consumer
+from app.consumers.keyed_worker_pool import KeyedWorkerPool, PartitionOffsetTracker
+from app import models
+from app.config.settings import settings
+from app.core import database
 from app.core.celery_app import celery_app
 from app.processing.application.dispatch import DispatchProcessingApplicationService
 from app.relays import processing_outbox_relay
+from app.routers import internal_processing
 from app.result_delivery.application.reconcile import ReconcileFailedProcessingResultsApplicationService
 from app.result_delivery.application.relay import RelayProcessingResultsApplicationService
 
@@ -100,6 +114,7 @@ class RuntimeCompositionSmokeTest(unittest.TestCase):
                 ("/videos/{video_id}", "GET"),
                 ("/videos/{video_id}/transcript", "GET"),
                 ("/internal/processing-requests/{processingRequestId}/transcript-rows", "GET"),
+                ("/internal/processing-requests/{processingRequestId}/transcript-rows/stream", "GET"),
                 ("/internal/assistant/answer", "POST"),
             }.issubset(routes)
         )
@@ -216,6 +231,370 @@ class KafkaConsumerCommitSemanticsTest(unittest.TestCase):
         consumer.close.assert_called_once_with()
         db.close.assert_called_once_with()
 
+    def _run_one_batch(self, handler):
+        runner = asset_processing_consumer.AssetProcessingKafkaConsumer()
+        records = {
+            "partition-0": [SimpleNamespace(value=b"a", offset=10), SimpleNamespace(value=b"b", offset=11)],
+            "partition-1": [SimpleNamespace(value=b"c", offset=4)],
+        }
+        consumer = MagicMock()
+
+        def poll_once(**_kwargs):
+            runner.stop()
+            return records
+
+        consumer.poll.side_effect = poll_once
+        db = MagicMock()
+        with (
+            patch.object(asset_processing_consumer.settings, "KAFKA_CONSUMER_BATCH_ENABLED", True),
+            patch.object(asset_processing_consumer.settings, "KAFKA_CONSUMER_BATCH_MAX_RECORDS", 50),
+            patch.object(asset_processing_consumer.settings, "KAFKA_RECONNECT_BACKOFF_SECONDS", 0),
+            patch.object(runner, "build_consumer", return_value=consumer),
+            patch.object(asset_processing_consumer, "SessionLocal", return_value=db) as session_factory,
+            patch.object(
+                asset_processing_consumer,
+                "handle_asset_processing_messages",
+                side_effect=handler,
+            ) as handle,
+        ):
+            runner.run_forever()
+        return consumer, db, session_factory, handle
+
+    def test_batch_mode_hands_off_every_message_through_one_session_then_commits_once(self) -> None:
+        result = asset_processing_consumer.MessageHandlingResult(accepted=True, duplicate=False, rejected=False)
+        consumer, db, session_factory, handle = self._run_one_batch(lambda values, _db: [result] * len(values))
+
+        self.assertEqual(consumer.poll.call_args.kwargs["max_records"], 50)
+        handle.assert_called_once_with([b"a", b"b", b"c"], db)
+        session_factory.assert_called_once_with()
+        consumer.commit.assert_called_once_with()
+        consumer.seek.assert_not_called()
+        db.close.assert_called_once_with()
+
+    def test_batch_handoff_failure_rewinds_every_partition_without_committing(self) -> None:
+        def fail(_raw_values, _db):
+            raise RuntimeError("handoff failed")
+
+        consumer, db, _session_factory, _handle = self._run_one_batch(fail)
+
+        consumer.commit.assert_not_called()
+        consumer.seek.assert_any_call("partition-0", 10)
+        consumer.seek.assert_any_call("partition-1", 4)
+        db.rollback.assert_called_once_with()
+        db.close.assert_called_once_with()
+
+
+def keyed_message(offset: int, aggregate_id: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        offset=offset,
+        key=None,
+        value=json.dumps({"eventId": f"event-{offset}", "aggregateId": aggregate_id}).encode("utf-8"),
+    )
+
+
+class PartitionOffsetTrackerTest(unittest.TestCase):
+    def test_commits_only_contiguous_completed_prefix_per_partition(self) -> None:
+        tracker = PartitionOffsetTracker()
+        for offset in (5, 6, 7):
+            tracker.start("p0", offset)
+        tracker.start("p1", 0)
+        tracker.complete("p0", 6)
+        tracker.complete("p1", 0)
+        self.assertEqual(tracker.committable(), {"p0": 5, "p1": 1})
+        tracker.mark_committed({"p0": 5, "p1": 1})
+        self.assertEqual(tracker.committable(), {})
+
+        tracker.complete("p0", 5)
+        self.assertEqual(tracker.committable(), {"p0": 7})
+        tracker.complete("p0", 7)
+        self.assertEqual(tracker.committable(["p0"]), {"p0": 8})
+
+    def test_failure_pins_the_partition_and_flags_later_offsets(self) -> None:
+        tracker = PartitionOffsetTracker()
+        for offset in (1, 2, 3):
+            tracker.start("p0", offset)
+        tracker.complete("p0", 1)
+        tracker.fail("p0", 2)
+        tracker.complete("p0", 3)
+        self.assertTrue(tracker.failed_before("p0", 3))
+        self.assertFalse(tracker.failed_before("p0", 2))
+        self.assertEqual(tracker.failed_offsets(), {"p0": 2})
+        self.assertEqual(tracker.committable(), {"p0": 2})
+        tracker.forget(["p0"])
+        self.assertEqual((tracker.failed_offsets(), tracker.committable()), ({}, {}))
+
+
+class KeyedWorkerPoolTest(unittest.TestCase):
+    def test_same_key_items_run_in_order_while_keys_run_in_parallel(self) -> None:
+        handled: dict[str, list[int]] = {}
+        threads: set[str] = set()
+        lock = threading.Lock()
+
+        def handler(item) -> None:
+            key, sequence = item
+            time.sleep(0.001)
+            with lock:
+                handled.setdefault(key, []).append(sequence)
+                threads.add(threading.current_thread().name)
+
+        pool = KeyedWorkerPool(4, handler, queue_size=8)
+        try:
+            for sequence in range(20):
+                for key in ("asset-a", "asset-b", "asset-c", "asset-d", "asset-e"):
+                    pool.submit(key, (key, sequence))
+            pool.drain()
+        finally:
+            pool.close()
+
+        self.assertEqual(set(handled), {"asset-a", "asset-b", "asset-c", "asset-d", "asset-e"})
+        for sequences in handled.values():
+            self.assertEqual(sequences, list(range(20)))
+        self.assertGreater(len(threads), 1)
+
+
+class KeyedKafkaConsumerTest(unittest.TestCase):
+    def _run(self, polls, handler):
+        runner = asset_processing_consumer.AssetProcessingKafkaConsumer()
+        consumer = MagicMock()
+        remaining = list(polls)
+        idle_polls = [0]
+
+        def poll(**_kwargs):
+            if remaining:
+                return remaining.pop(0)
+            idle_polls[0] += 1
+            if idle_polls[0] > 1:
+                runner.stop()
+            else:
+                time.sleep(0.2)  # let the workers finish the polled records
+            return {}
+
+        consumer.poll.side_effect = poll
+        with (
+            patch.object(asset_processing_consumer.settings, "KAFKA_CONSUMER_CONCURRENCY", 3),
+            patch.object(asset_processing_consumer.settings, "KAFKA_RECONNECT_BACKOFF_SECONDS", 0),
+            patch.object(runner, "build_consumer", return_value=consumer),
+            patch.object(asset_processing_consumer, "SessionLocal", side_effect=lambda: MagicMock()),
+            patch.object(asset_processing_consumer, "handle_asset_processing_message", side_effect=handler),
+        ):
+            runner.run_forever()
+        committed: dict[str, int] = {}
+        for call in consumer.commit.call_args_list:
+            committed.update({partition: value.offset for partition, value in call.kwargs["offsets"].items()})
+        return consumer, committed
+
+    def test_subscribes_with_rebalance_listener_and_commits_each_partition(self) -> None:
+        handled: list[bytes] = []
+        lock = threading.Lock()
+
+        def handler(raw_value, _db):
+            with lock:
+                handled.append(raw_value)
+            return asset_processing_consumer.MessageHandlingResult(accepted=True, duplicate=False, rejected=False)
+
+        consumer, committed = self._run(
+            [{"p0": [keyed_message(0, "a"), keyed_message(1, "b")], "p1": [keyed_message(7, "c")]}],
+            handler,
+        )
+
+        listener = consumer.subscribe.call_args.kwargs["listener"]
+        self.assertTrue(hasattr(listener, "on_partitions_revoked"))
+        self.assertEqual(len(handled), 3)
+        self.assertEqual(committed, {"p0": 2, "p1": 8})
+        consumer.seek.assert_not_called()
+
+    def test_failed_handoff_rewinds_its_partition_and_skips_later_messages(self) -> None:
+        handled: list[int] = []
+        lock = threading.Lock()
+
+        def handler(raw_value, _db):
+            event = json.loads(raw_value)
+            if event["eventId"] == "event-1":
+                raise RuntimeError("database unavailable")
+            with lock:
+                handled.append(int(event["eventId"].split("-")[1]))
+            return asset_processing_consumer.MessageHandlingResult(accepted=True, duplicate=False, rejected=False)
+
+        consumer, committed = self._run(
+            [{"p0": [keyed_message(0, "a"), keyed_message(1, "a"), keyed_message(2, "a")], "p1": [keyed_message(4, "b")]}],
+            handler,
+        )
+
+        self.assertEqual(sorted(handled), [0, 4])
+        consumer.seek.assert_called_once_with("p0", 1)
+        self.assertEqual(committed, {"p0": 1, "p1": 5})
+
+    def test_lower_offset_failing_during_drain_is_the_rewind_point(self) -> None:
+        handled: list[int] = []
+        lock = threading.Lock()
+
+        def handler(raw_value, _db):
+            offset = int(json.loads(raw_value)["eventId"].split("-")[1])
+            with lock:
+                handled.append(offset)
+            if offset == 0:
+                time.sleep(0.5)  # still running when the fast failure below is noticed
+            raise RuntimeError("database unavailable")
+
+        consumer, committed = self._run([{"p0": [keyed_message(0, "a"), keyed_message(1, "b")]}], handler)
+
+        self.assertEqual(sorted(handled), [0, 1])
+        consumer.seek.assert_called_once_with("p0", 0)
+        self.assertEqual(committed.get("p0", 0), 0)
+
+    def test_revoked_partitions_are_drained_and_committed(self) -> None:
+        pool = KeyedWorkerPool(2, lambda _item: None)
+        tracker = PartitionOffsetTracker()
+        tracker.start("p0", 3)
+        tracker.complete("p0", 3)
+        consumer = MagicMock()
+        try:
+            listener = asset_processing_consumer._build_rebalance_listener(consumer, pool, tracker)
+            listener.on_partitions_revoked(["p0"])
+        finally:
+            pool.close()
+        self.assertEqual(consumer.commit.call_args.kwargs["offsets"]["p0"].offset, 4)
+        self.assertEqual(tracker.committable(), {})
+
+
+
+class AsyncDatabaseAccessTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        self.Session = self._seed(self.engine)
+
+    @staticmethod
+    def _seed(engine):
+        database.Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine)
+        db = Session()
+        db.add(
+            models.ProcessingRequest(
+                event_id="9d0d6e36-d45f-41dc-8a73-33ebf0f31749",
+                asset_id="asset-1",
+                storage_bucket="workspace-media",
+                object_key="objects/media.mp4",
+                content_type="video/mp4",
+                size_bytes=128,
+                status="ready",
+                segment_count=1,
+            )
+        )
+        db.add(
+            models.ProcessingRequestTranscript(
+                processing_request_event_id="9d0d6e36-d45f-41dc-8a73-33ebf0f31749",
+                segment_index=0,
+                text="first",
+            )
+        )
+        db.commit()
+        db.close()
+        return Session
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+
+    def _get(self, *paths: str, headers: dict | None = None) -> list[httpx.Response]:
+        async def fetch() -> list[httpx.Response]:
+            transport = httpx.ASGITransport(app=create_api_app())
+            async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+                return [await client.get(path, headers=headers) for path in paths]
+
+        return asyncio.run(fetch())
+
+    def test_async_url_swaps_only_the_driver(self) -> None:
+        self.assertEqual(
+            database.async_database_url("postgresql://user:secret@db:5432/userdb"),
+            "postgresql+asyncpg://user:secret@db:5432/userdb",
+        )
+        self.assertEqual(
+            database.async_database_url("postgresql+psycopg2://user:secret@db/userdb"),
+            "postgresql+asyncpg://user:secret@db/userdb",
+        )
+
+    def test_read_endpoints_use_the_threadpool_session_by_default(self) -> None:
+        with patch.object(database, "SessionLocal", self.Session):
+            rows, missing_video = self._get(
+                "/internal/processing-requests/9d0d6e36-d45f-41dc-8a73-33ebf0f31749/transcript-rows",
+                "/videos/404",
+            )
+            [cached] = self._get(
+                "/internal/processing-requests/9d0d6e36-d45f-41dc-8a73-33ebf0f31749/transcript-rows",
+                headers={"If-None-Match": rows.headers["ETag"]},
+            )
+
+        self.assertEqual([row["text"] for row in rows.json()], ["first"])
+        self.assertEqual(missing_video.status_code, 404)
+        self.assertEqual(cached.status_code, 304)
+
+    def test_async_mode_runs_queries_through_run_sync_and_rendering_on_the_threadpool(self) -> None:
+        sessions = []
+        synced = []
+
+        class FakeAsyncSession:
+            async def __aenter__(self):
+                self.db = self.Session()
+                sessions.append(self)
+                return self
+
+            async def __aexit__(self, *_exc) -> None:
+                self.db.close()
+
+            async def run_sync(self, fn, *args):
+                synced.append(fn.__name__)
+                return fn(self.db, *args)
+
+        FakeAsyncSession.Session = self.Session
+        with (
+            patch.object(settings, "DATABASE_ASYNC_ENABLED", True),
+            patch.object(database, "get_async_session_factory", return_value=FakeAsyncSession),
+            patch.object(database, "run_in_threadpool", side_effect=AssertionError("threadpool used")),
+            patch.object(
+                internal_processing, "run_in_threadpool", wraps=internal_processing.run_in_threadpool,
+            ) as render_in_pool,
+        ):
+            [response] = self._get("/internal/processing-requests/9d0d6e36-d45f-41dc-8a73-33ebf0f31749/transcript-rows")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row["text"] for row in response.json()], ["first"])
+        self.assertEqual(len(sessions), 1)
+        self.assertEqual(synced, ["_load_transcript_rows"])
+        render_in_pool.assert_called_once()
+
+    def test_async_mode_reads_through_a_real_async_engine(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            url = f"sqlite:///{Path(temp_dir) / 'async.db'}"
+            sync_engine = create_engine(url)
+            self._seed(sync_engine)
+
+            async def fetch() -> list[httpx.Response]:
+                transport = httpx.ASGITransport(app=create_api_app())
+                async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+                    responses = [
+                        await client.get(
+                            "/internal/processing-requests/9d0d6e36-d45f-41dc-8a73-33ebf0f31749/transcript-rows"
+                        ),
+                        await client.get("/videos/404"),
+                    ]
+                await database.get_async_session_factory().kw["bind"].dispose()
+                return responses
+
+            with (
+                patch.object(settings, "DATABASE_URL", url),
+                patch.object(settings, "DATABASE_ASYNC_ENABLED", True),
+                patch.object(database, "_async_session_factory", None),
+                patch.object(database, "run_in_threadpool", side_effect=AssertionError("threadpool used")),
+            ):
+                rows, missing_video = asyncio.run(fetch())
+            sync_engine.dispose()
+
+        self.assertEqual([row["text"] for row in rows.json()], ["first"])
+        self.assertEqual(missing_video.status_code, 404)
+
 
 if __name__ == "__main__":
     unittest.main()
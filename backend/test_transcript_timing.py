@@ -1,16 +1,35 @@
+import asyncio
+import gzip
+import io
+import json
 import math
+import multiprocessing
+import struct
 import unittest
 from datetime import UTC, datetime
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
-from sqlalchemy import create_engine, inspect, text
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app import models
+from app.config.settings import settings
 from app.core import schema
 from app.core.database import Base
+from app.bootstrap import worker as worker_bootstrap
+from app.processing.adapters.faster_whisper_transcriber import FasterWhisperProcessingTranscriptionProvider
+from app.processing.adapters.long_media import (
+    LongMediaTranscriptionPolicy,
+    stitch_window_results,
+    transcribe_long_media,
+)
+from app.processing.adapters.model_selection import TranscriptionModelSelectionPolicy
+from app.processing.adapters import sqlalchemy_stores
 from app.processing.adapters.sqlalchemy_stores import SqlAlchemyProcessingArtifactStore
 from app.processing.adapters.whisper_transcriber import (
     WhisperProcessingTranscriptionProvider,
@@ -19,10 +38,22 @@ from app.processing.adapters.whisper_transcriber import (
 )
 from app.processing.domain.models import (
     ProcessingArtifact,
+    ProcessingExecutionCommand,
     ProcessingSucceeded,
     ProcessingTranscriptRow,
 )
-from app.routers.internal_processing import get_processing_request_transcript_rows
+from app.bootstrap.api import create_api_app
+from app.core.database import get_db_runner
+from app.routers.internal_processing import stream_processing_request_transcript_rows
+from app.services import video_processing
+from app.processing.adapters.voice_activity import VoiceActivityPolicy
+from app.services.audio_segmentation import (
+    AudioWindow,
+    compact_speech,
+    detect_speech_regions,
+    plan_transcription_windows,
+)
+from app.services.model_registry import ModelKey, TranscriptionModelRegistry, estimate_model_bytes
 
 
 class WhisperTimestampNormalizationTest(unittest.TestCase):
@@ -80,15 +111,381 @@ class WhisperTimestampNormalizationTest(unittest.TestCase):
         fallback_chunker.assert_not_called()
 
 
+class PipeAudioDecodeTest(unittest.TestCase):
+    def test_pcm_stream_is_decoded_to_float32_across_odd_chunk_boundaries(self) -> None:
+        process = MagicMock()
+        process.stdout = io.BytesIO(struct.pack("<4h", 0, 16384, -32768, 32767))
+        process.wait.return_value = 0
+        with patch.object(video_processing.subprocess, "Popen", return_value=process) as popen:
+            samples = video_processing.decode_audio_to_array("/tmp/media.mp4", chunk_bytes=3)
+
+        self.assertEqual(str(samples.dtype), "float32")
+        self.assertEqual(samples.tolist(), [0.0, 0.5, -1.0, 32767 / 32768])
+        self.assertIn("pipe:1", popen.call_args.args[0])
+
+    def test_failed_ffmpeg_decode_raises_instead_of_returning_partial_audio(self) -> None:
+        process = MagicMock()
+        process.stdout = io.BytesIO(b"")
+        process.wait.return_value = 1
+        with (
+            patch.object(video_processing.subprocess, "Popen", return_value=process),
+            self.assertRaises(video_processing.subprocess.CalledProcessError),
+        ):
+            video_processing.decode_audio_to_array("/tmp/missing.mp4")
+
+    def test_pipe_mode_passes_decoded_samples_to_the_model_without_a_wav_file(self) -> None:
+        samples = object()
+        with (
+            patch(
+                "app.processing.adapters.whisper_transcriber.decode_audio_to_array",
+                return_value=samples,
+            ) as decode,
+            patch("app.processing.adapters.whisper_transcriber.extract_audio_to_wav") as extract,
+            patch(
+                "app.processing.adapters.whisper_transcriber.transcribe_audio_with_whisper",
+                return_value={"segments": [{"text": "first", "start": 0.0, "end": 1.0}]},
+            ) as transcribe,
+        ):
+            rows = WhisperProcessingTranscriptionProvider(audio_decode_mode="pipe").transcribe("/tmp/media.mp4")
+
+        decode.assert_called_once_with("/tmp/media.mp4")
+        extract.assert_not_called()
+        transcribe.assert_called_once_with(samples, model_name="base")
+        self.assertEqual(rows, (ProcessingTranscriptRow(0, "first", 0, 1000),))
+
+
+def _transcribe_long_media_in_daemon(results) -> None:
+    """Run the windowed path the way a Celery prefork child does: inside a daemonic process."""
+    import numpy as np
+
+    def transcribe(samples, model_name):
+        middle = len(samples) / 16_000 / 2
+        return {"segments": [{"text": f"window-{len(samples)}", "start": middle - 0.25, "end": middle + 0.25}]}
+
+    try:
+        with patch("app.processing.adapters.long_media.transcribe_audio_with_whisper", side_effect=transcribe):
+            result, window_count = transcribe_long_media(
+                np.zeros(16_000 * 25, dtype=np.float32),
+                LongMediaTranscriptionPolicy(min_duration_seconds=1, workers=2, window_seconds=10, overlap_seconds=1),
+            )
+        results.put((window_count, len(result["segments"])))
+    except BaseException as exc:
+        results.put(repr(exc))
+
+
+class LongMediaTranscriptionTest(unittest.TestCase):
+    def test_windows_transcribe_inside_a_daemonic_worker_process(self) -> None:
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        child = context.Process(target=_transcribe_long_media_in_daemon, args=(results,), daemon=True)
+        child.start()
+        try:
+            outcome = results.get(timeout=30)
+        finally:
+            child.join(5)
+        self.assertEqual(outcome, (3, 3))
+
+
+    def test_windows_cut_inside_silence_and_own_contiguous_ranges(self) -> None:
+        import numpy as np
+
+        samples = np.full(100, 0.5, dtype=np.float32)
+        samples[44:52] = 0.0
+        windows = plan_transcription_windows(
+            samples,
+            10,
+            window_seconds=4,
+            overlap_seconds=1,
+            search_seconds=1,
+        )
+
+        self.assertEqual(windows[1].keep_start_sample, windows[0].keep_end_sample)
+        self.assertTrue(44 <= windows[0].keep_end_sample < 52)
+        self.assertEqual(windows[0].end_sample, windows[0].keep_end_sample + 10)
+        self.assertEqual(windows[1].start_sample, windows[1].keep_start_sample - 10)
+        self.assertEqual(windows[-1].keep_end_sample, 100)
+
+    def test_stitching_offsets_window_segments_and_drops_overlap_duplicates(self) -> None:
+        windows = (AudioWindow(0, 12, 0, 10), AudioWindow(8, 20, 10, 20))
+        results = [
+            {"segments": [
+                {"text": "first", "start": 0.0, "end": 0.8},
+                {"text": "shared", "start": 0.8, "end": 1.1},
+            ]},
+            {"segments": [
+                {"text": "shared", "start": 0.0, "end": 0.3},
+                {"text": "last", "start": 0.4, "end": 1.2},
+            ]},
+        ]
+
+        stitched = stitch_window_results(windows, results, sample_rate=10)
+
+        self.assertEqual(
+            normalize_whisper_result(stitched),
+            (
+                ProcessingTranscriptRow(0, "first", 0, 800),
+                ProcessingTranscriptRow(1, "shared", 800, 1100),
+                ProcessingTranscriptRow(2, "last", 1200, 2000),
+            ),
+        )
+
+    def test_untimed_window_text_is_dropped_when_windows_overlap_neighbours(self) -> None:
+        windows = (AudioWindow(0, 12, 0, 10), AudioWindow(8, 20, 10, 20))
+        results = [
+            {"segments": [{"text": "first", "start": 0.0, "end": 0.8}]},
+            {"text": "shared and last", "segments": []},
+        ]
+
+        stitched = stitch_window_results(windows, results, sample_rate=10)
+
+        self.assertEqual(stitched, {"text": "first", "segments": [{"text": "first", "start": 0.0, "end": 0.8}]})
+        single = stitch_window_results(windows[:1], [{"text": "only window"}], sample_rate=10)
+        self.assertEqual(single["segments"], [{"text": "only window"}])
+
+    def test_media_over_the_duration_threshold_uses_the_windowed_path(self) -> None:
+        import numpy as np
+
+        policy = LongMediaTranscriptionPolicy(
+            min_duration_seconds=1,
+            workers=2,
+            window_seconds=600,
+            overlap_seconds=5,
+        )
+        samples = np.zeros(32_000, dtype=np.float32)
+        with (
+            patch(
+                "app.processing.adapters.whisper_transcriber.decode_audio_to_array",
+                return_value=samples,
+            ),
+            patch(
+                "app.processing.adapters.whisper_transcriber.transcribe_long_media",
+                return_value=({"segments": [{"text": "long", "start": 0.0, "end": 2.0}]}, 1),
+            ) as windowed,
+            patch("app.processing.adapters.whisper_transcriber.transcribe_audio_with_whisper") as single,
+        ):
+            rows = WhisperProcessingTranscriptionProvider(
+                audio_decode_mode="pipe",
+                long_media=policy,
+            ).transcribe("/tmp/media.mp4")
+
+        windowed.assert_called_once_with(samples, policy, engine="whisper", model_name="base", compute_type=None)
+        single.assert_not_called()
+        self.assertEqual(rows, (ProcessingTranscriptRow(0, "long", 0, 2000),))
+
+
+class VoiceActivityPrePassTest(unittest.TestCase):
+    def test_long_silences_are_removed_and_times_map_back_to_the_media(self) -> None:
+        import numpy as np
+
+        samples = np.zeros(1_000, dtype=np.float32)
+        samples[100:300] = 0.5
+        samples[700:800] = 0.5
+        regions = detect_speech_regions(samples, 100, min_silence_seconds=1.0, padding_seconds=0.0)
+
+        self.assertEqual(regions, ((99, 300), (699, 801)))
+        compacted, time_map = compact_speech(samples, regions, 100)
+        self.assertEqual(len(compacted), 303)
+        self.assertAlmostEqual(time_map.to_original_seconds(0.5), 1.49)
+        self.assertAlmostEqual(time_map.to_original_seconds(2.01, is_end=True), 3.0)
+        self.assertAlmostEqual(time_map.to_original_seconds(2.5), 7.48)
+
+    def test_short_pauses_stay_inside_one_speech_region(self) -> None:
+        import numpy as np
+
+        samples = np.full(1_000, 0.5, dtype=np.float32)
+        samples[400:450] = 0.0
+
+        self.assertEqual(detect_speech_regions(samples, 100, min_silence_seconds=1.0), ((0, 1_000),))
+
+    def test_provider_skips_silence_and_keeps_original_timestamps(self) -> None:
+        import numpy as np
+
+        samples = np.zeros(16_000 * 10, dtype=np.float32)
+        samples[96_000:127_680] = 0.5
+        policy = VoiceActivityPolicy(rms_threshold=0.01, min_silence_seconds=1.0, padding_seconds=0.0)
+        with (
+            patch(
+                "app.processing.adapters.whisper_transcriber.decode_audio_to_array",
+                return_value=samples,
+            ),
+            patch(
+                "app.processing.adapters.whisper_transcriber.transcribe_audio_with_whisper",
+                return_value={"segments": [{"text": "speech", "start": 0.5, "end": 1.5}]},
+            ) as transcribe,
+            self.assertLogs("app.processing.adapters.timing", level="INFO") as logs,
+        ):
+            rows = WhisperProcessingTranscriptionProvider(
+                audio_decode_mode="pipe",
+                voice_activity=policy,
+            ).transcribe("/tmp/media.mp4")
+
+        self.assertEqual(len(transcribe.call_args.args[0]), 31_680)
+        self.assertEqual(rows, (ProcessingTranscriptRow(0, "speech", 6500, 7500),))
+        self.assertTrue(any("skipped_audio_ratio=0.802" in line for line in logs.output))
+
+
+class TranscriptionEngineSelectionTest(unittest.TestCase):
+    def test_faster_whisper_result_is_normalized_like_whisper(self) -> None:
+        with (
+            patch(
+                "app.processing.adapters.whisper_transcriber.extract_audio_to_wav",
+                return_value="/tmp/audio.wav",
+            ),
+            patch(
+                "app.processing.adapters.faster_whisper_transcriber.transcribe_audio_with_faster_whisper",
+                return_value={"text": "hi", "segments": [{"id": 0, "start": 0.25, "end": 1.5, "text": " hi"}]},
+            ) as faster,
+            patch("app.processing.adapters.whisper_transcriber.transcribe_audio_with_whisper") as whisper,
+        ):
+            rows = FasterWhisperProcessingTranscriptionProvider(compute_type="int8").transcribe("/tmp/media.mp4")
+
+        faster.assert_called_once_with("/tmp/audio.wav", compute_type="int8", model_name="base")
+        whisper.assert_not_called()
+        self.assertEqual(rows, (ProcessingTranscriptRow(0, "hi", 250, 1500),))
+
+    def test_bootstrap_selects_the_configured_engine(self) -> None:
+        with patch.object(worker_bootstrap.settings, "TRANSCRIPTION_ENGINE", "whisper"):
+            self.assertIs(type(worker_bootstrap.build_transcription_provider()), WhisperProcessingTranscriptionProvider)
+        with (
+            patch.object(worker_bootstrap.settings, "TRANSCRIPTION_ENGINE", "faster-whisper"),
+            patch.object(worker_bootstrap.settings, "FASTER_WHISPER_COMPUTE_TYPE", "int8_float32"),
+        ):
+            provider = worker_bootstrap.build_transcription_provider()
+        self.assertIsInstance(provider, FasterWhisperProcessingTranscriptionProvider)
+        self.assertEqual(provider.compute_type, "int8_float32")
+
+
+class ModelPreloadTest(unittest.TestCase):
+    def test_warm_up_loads_the_model_and_transcribes_synthetic_silence(self) -> None:
+        with (
+            patch("app.processing.adapters.whisper_transcriber.get_whisper_model") as load,
+            patch("app.processing.adapters.whisper_transcriber.transcribe_audio_with_whisper") as transcribe,
+            self.assertLogs("app.processing.adapters.timing", level="INFO") as logs,
+        ):
+            WhisperProcessingTranscriptionProvider().warm_up()
+
+        load.assert_called_once_with("base")
+        clip = transcribe.call_args.args[0]
+        self.assertEqual((len(clip), float(abs(clip).max())), (16_000, 0.0))
+        self.assertTrue(any("model_load_ms=" in line and "engine=whisper" in line for line in logs.output))
+        self.assertTrue(any("model_warmup_ms=" in line for line in logs.output))
+
+    def test_worker_process_hook_preloads_only_when_enabled(self) -> None:
+        from app.core import celery_app as celery_app_module
+
+        with (
+            patch.object(celery_app_module.settings, "WHISPER_PRELOAD_ENABLED", False),
+            patch("app.bootstrap.worker.preload_transcription_model") as preload,
+        ):
+            celery_app_module.preload_worker_transcription_model()
+        preload.assert_not_called()
+
+        with (
+            patch.object(celery_app_module.settings, "WHISPER_PRELOAD_ENABLED", True),
+            patch("app.bootstrap.worker.preload_transcription_model") as preload,
+        ):
+            celery_app_module.preload_worker_transcription_model()
+        preload.assert_called_once_with()
+
+    def test_preload_failure_is_logged_and_left_to_lazy_loading(self) -> None:
+        provider = MagicMock()
+        provider.warm_up.side_effect = RuntimeError("model download failed")
+        with (
+            patch.object(worker_bootstrap, "build_transcription_provider", return_value=provider),
+            self.assertLogs("app.bootstrap.worker", level="ERROR"),
+        ):
+            worker_bootstrap.preload_transcription_model()
+
+
+class TranscriptionModelRegistryTest(unittest.TestCase):
+    def test_models_are_keyed_by_engine_name_and_compute_type(self) -> None:
+        registry = TranscriptionModelRegistry(memory_budget_bytes=10 * 1024**3)
+        loader = MagicMock(side_effect=lambda: object())
+
+        tiny = registry.get(ModelKey("whisper", "tiny"), loader)
+        self.assertIs(registry.get(ModelKey("whisper", "tiny"), loader), tiny)
+        self.assertIsNot(registry.get(ModelKey("whisper", "base"), loader), tiny)
+        self.assertIsNot(registry.get(ModelKey("faster-whisper", "tiny", "int8"), loader), tiny)
+        self.assertEqual(loader.call_count, 3)
+
+    def test_least_recently_used_model_is_unloaded_over_budget(self) -> None:
+        tiny, base, small = ModelKey("whisper", "tiny"), ModelKey("whisper", "base"), ModelKey("whisper", "small")
+        registry = TranscriptionModelRegistry(
+            memory_budget_bytes=estimate_model_bytes(small) + estimate_model_bytes(tiny),
+        )
+        registry.get(tiny, object)
+        registry.get(base, object)
+        registry.get(tiny, object)
+        registry.get(small, object)
+
+        self.assertEqual(registry.loaded_keys(), (tiny, small))
+
+    def test_selection_uses_audio_equivalent_size_and_content_type(self) -> None:
+        policy = TranscriptionModelSelectionPolicy(
+            default_model="base",
+            small_media_model="tiny",
+            small_media_max_bytes=1_000,
+            large_media_model="small",
+            large_media_min_bytes=10_000,
+            video_bytes_ratio=8,
+        )
+
+        def job(content_type: str, size_bytes: int) -> ProcessingExecutionCommand:
+            return ProcessingExecutionCommand(
+                "event-1", "asset-1", None, None, "bucket", "key", None, content_type, size_bytes,
+            )
+
+        self.assertEqual(policy.select(None), "base")
+        self.assertEqual(policy.select(job("audio/mpeg", 900)), "tiny")
+        self.assertEqual(policy.select(job("video/mp4", 7_000)), "tiny")
+        self.assertEqual(policy.select(job("audio/mpeg", 5_000)), "base")
+        self.assertEqual(policy.select(job("video/mp4", 80_000)), "small")
+        provider = WhisperProcessingTranscriptionProvider(model_selection=policy)
+        self.assertIn("model=tiny", provider.cache_profile(job("audio/mpeg", 900)))
+        self.assertIn("model=small", provider.cache_profile(job("audio/mpeg", 20_000)))
+
+    def test_cache_profile_ignores_pool_size_but_tracks_output_settings(self) -> None:
+        def provider(workers: int, overlap_seconds: int) -> WhisperProcessingTranscriptionProvider:
+            return WhisperProcessingTranscriptionProvider(
+                long_media=LongMediaTranscriptionPolicy(1_800, workers, 600, overlap_seconds),
+                voice_activity=VoiceActivityPolicy(0.01, 1.0, 0.2),
+            )
+
+        self.assertEqual(provider(2, 5).cache_profile(), provider(16, 5).cache_profile())
+        self.assertNotEqual(provider(2, 5).cache_profile(), provider(2, 10).cache_profile())
+        self.assertNotIn("workers", provider(2, 5).cache_profile())
+
+
 class TranscriptArtifactCompatibilityTest(unittest.TestCase):
     def setUp(self) -> None:
-        self.engine = create_engine("sqlite+pysqlite:///:memory:")
+        self.engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
         Base.metadata.create_all(bind=self.engine)
         self.Session = sessionmaker(bind=self.engine)
 
     def tearDown(self) -> None:
         self.engine.dispose()
 
+    def _client(self, db) -> TestClient:
+        """Serve the real API app with its DB runner bound to the test session."""
+
+        async def run(fn, *args):
+            return fn(db, *args)
+
+        api = create_api_app()
+        api.dependency_overrides[get_db_runner] = lambda: run
+        return TestClient(api, headers={"Accept-Encoding": "identity"})
+
+    def _get_rows(self, db, event_id: str, *, headers: dict | None = None, **params):
+        return self._client(db).get(
+            f"/internal/processing-requests/{event_id}/transcript-rows",
+            params=params,
+            headers=headers,
+        )
+
     def _request(self, db, *, status: str = "processing") -> models.ProcessingRequest:
         request = models.ProcessingRequest(
             event_id=str(uuid4()),
@@ -118,13 +515,61 @@ class TranscriptArtifactCompatibilityTest(unittest.TestCase):
 
         saved = db.query(models.ProcessingRequestTranscript).one()
         self.assertEqual((saved.start_ms, saved.end_ms), (0, 1235))
-        response = get_processing_request_transcript_rows(request.event_id, db)
-        payload = response[0].model_dump(mode="json")
+        payload = self._get_rows(db, request.event_id).json()[0]
         self.assertEqual(payload["start_ms"], 0)
         self.assertEqual(payload["end_ms"], 1235)
         self.assertNotIn("start_seconds", payload)
         db.close()
 
+    def test_large_artifacts_are_inserted_in_bulk_rather_than_per_row(self) -> None:
+        db = self.Session()
+        request = self._request(db)
+        rows = tuple(
+            ProcessingTranscriptRow(index, f"segment {index}", *((None, None) if index % 2 else (index, index)))
+            for index in range(1_200)
+        )
+        outcome = ProcessingSucceeded(request.event_id, request.asset_id, ProcessingArtifact(rows), datetime.now(UTC))
+        inserts = []
+
+        def listener(_conn, _cursor, statement, *_args) -> None:
+            if statement.startswith("INSERT"):
+                inserts.append(statement)
+
+        event.listen(self.engine, "before_cursor_execute", listener)
+        try:
+            store = SqlAlchemyProcessingArtifactStore(db)
+            store.persist_success(outcome)
+            store.commit()
+        finally:
+            event.remove(self.engine, "before_cursor_execute", listener)
+
+        self.assertLess(len(inserts), 20)
+        self.assertEqual(db.query(models.ProcessingRequestTranscript).count(), 1_200)
+        self.assertEqual(db.get(models.ProcessingRequest, request.event_id).segment_count, 1_200)
+        db.close()
+
+    def test_postgres_copy_payload_keeps_nulls_and_quotes_text(self) -> None:
+        cursor = MagicMock()
+        captured = {}
+        cursor.copy_expert.side_effect = lambda sql, buffer: captured.update(sql=sql, data=buffer.read())
+
+        sqlalchemy_stores._copy_transcript_rows(
+            cursor,
+            [
+                {
+                    "processing_request_event_id": "event-1",
+                    "segment_index": 0,
+                    "text": 'said "hi", then\nleft',
+                    "start_ms": None,
+                    "end_ms": None,
+                },
+                {"processing_request_event_id": "event-1", "segment_index": 1, "text": "x", "start_ms": 5, "end_ms": 9},
+            ],
+        )
+
+        self.assertIn("FORCE_NOT_NULL (text)", captured["sql"])
+        self.assertEqual(captured["data"], 'event-1,0,"said ""hi"", then\nleft",,\r\nevent-1,1,x,5,9\r\n')
+
     def test_legacy_artifact_without_timing_remains_readable(self) -> None:
         db = self.Session()
         request = self._request(db, status="ready")
@@ -135,11 +580,165 @@ class TranscriptArtifactCompatibilityTest(unittest.TestCase):
         ))
         db.commit()
 
-        payload = get_processing_request_transcript_rows(request.event_id, db)[0].model_dump(mode="json")
+        payload = self._get_rows(db, request.event_id).json()[0]
         self.assertIsNone(payload["start_ms"])
         self.assertIsNone(payload["end_ms"])
         db.close()
 
+    def _ready_request_with_rows(self, db, count: int) -> models.ProcessingRequest:
+        request = self._request(db, status="ready")
+        db.add_all(
+            models.ProcessingRequestTranscript(
+                processing_request_event_id=request.event_id,
+                segment_index=index,
+                text=f"segment {index}",
+            )
+            for index in range(count)
+        )
+        db.commit()
+        return request
+
+    def test_transcript_rows_are_paged_by_segment_index_keyset(self) -> None:
+        db = self.Session()
+        request = self._ready_request_with_rows(db, 5)
+
+        pages, cursor = [], None
+        while True:
+            params = {"limit": 2} if cursor is None else {"limit": 2, "after_segment_index": cursor}
+            response = self._get_rows(db, request.event_id, **params)
+            pages.append([row["segment_index"] for row in response.json()])
+            cursor = response.headers.get("X-Next-After-Segment-Index")
+            if cursor is None:
+                break
+
+        self.assertEqual(pages, [[0, 1], [2, 3], [4]])
+        self.assertEqual(self._get_rows(db, request.event_id, after_segment_index=4, limit=2).json(), [])
+        self.assertEqual(self._get_rows(db, request.event_id, limit=0).status_code, 400)
+        db.close()
+
+    def test_matching_if_none_match_returns_304_without_reading_rows(self) -> None:
+        db = self.Session()
+        request = self._ready_request_with_rows(db, 3)
+        response = self._get_rows(db, request.event_id)
+        etag = response.headers["ETag"]
+        self.assertEqual(response.headers["Cache-Control"], "no-cache")
+
+        statements = []
+
+        def listener(_conn, _cursor, statement, *_args) -> None:
+            statements.append(statement)
+
+        event.listen(self.engine, "before_cursor_execute", listener)
+        try:
+            not_modified = self._get_rows(db, request.event_id, headers={"If-None-Match": f'"other", W/{etag}'})
+        finally:
+            event.remove(self.engine, "before_cursor_execute", listener)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.headers["ETag"], etag)
+        self.assertFalse(any("processing_request_transcripts" in statement for statement in statements))
+
+        with patch.object(settings, "PROCESSING_TRANSCRIPT_ROWS_CACHE_MAX_AGE_SECONDS", 60):
+            paged = self._get_rows(db, request.event_id, limit=2)
+        self.assertNotEqual(paged.headers["ETag"], etag)
+        self.assertEqual(paged.headers["Cache-Control"], "public, max-age=60, must-revalidate")
+
+        db.get(models.ProcessingRequest, request.event_id).segment_count = 4
+        db.commit()
+        modified = self._get_rows(db, request.event_id, headers={"If-None-Match": etag})
+        self.assertEqual(len(modified.json()), 3)
+        db.close()
+
+    def test_precomputed_gzip_artifact_is_served_without_reading_rows(self) -> None:
+        db = self.Session()
+        request = self._request(db)
+        rows = (ProcessingTranscriptRow(0, "first", 0, 900), ProcessingTranscriptRow(1, "second"))
+        outcome = ProcessingSucceeded(request.event_id, request.asset_id, ProcessingArtifact(rows), datetime.now(UTC))
+        store = SqlAlchemyProcessingArtifactStore(db, transcript_artifact_enabled=True)
+        store.persist_success(outcome)
+        store.commit()
+
+        artifact = db.get(models.ProcessingTranscriptArtifact, request.event_id)
+        self.assertEqual((artifact.content_encoding, artifact.segment_count), ("gzip", 2))
+        expected = self._get_rows(db, request.event_id).json()
+        self.assertEqual(json.loads(gzip.decompress(artifact.payload)), expected)
+
+        payload = artifact.payload
+        db.expunge_all()
+        statements = []
+
+        def listener(_conn, _cursor, statement, *_args) -> None:
+            statements.append(statement)
+
+        event.listen(self.engine, "before_cursor_execute", listener)
+        try:
+            with patch.object(settings, "PROCESSING_TRANSCRIPT_ARTIFACT_ENABLED", True):
+                with self._client(db).stream(
+                    "GET",
+                    f"/internal/processing-requests/{request.event_id}/transcript-rows",
+                    headers={"Accept-Encoding": "br, gzip;q=0.8"},
+                ) as gzipped:
+                    gzipped_body = b"".join(gzipped.iter_raw())
+                db.expunge_all()
+                identity = self._get_rows(db, request.event_id, headers={"Accept-Encoding": "gzip;q=0"})
+                db.expunge_all()
+                served_statements = len(statements)
+                not_modified = self._get_rows(
+                    db,
+                    request.event_id,
+                    headers={"Accept-Encoding": "gzip", "If-None-Match": gzipped.headers["ETag"]},
+                )
+        finally:
+            event.remove(self.engine, "before_cursor_execute", listener)
+        # One request-and-artifact lookup plus one payload load per served response; a 304 skips the payload.
+        self.assertEqual(served_statements, 4)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(len(statements), 5)
+        self.assertNotIn("payload", statements[-1])
+        self.assertFalse(any("FROM processing_request_transcripts" in statement for statement in statements))
+        self.assertEqual(gzipped.headers["Content-Encoding"], "gzip")
+        self.assertEqual(gzipped_body, payload)
+        self.assertNotIn("Content-Encoding", identity.headers)
+        self.assertEqual(identity.json(), expected)
+        self.assertNotEqual(gzipped.headers["ETag"], identity.headers["ETag"])
+
+        SqlAlchemyProcessingArtifactStore(db).persist_success(outcome)
+        db.commit()
+        self.assertIsNone(db.get(models.ProcessingTranscriptArtifact, request.event_id))
+        db.close()
+
+    def test_transcript_rows_stream_as_ndjson_and_stop_at_an_unusable_row(self) -> None:
+        engine = create_engine(
+            "sqlite+pysqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine)
+        db = Session()
+        request = self._ready_request_with_rows(db, 3)
+
+        async def body(response) -> list[dict]:
+            return [json.loads(line) async for chunk in response.body_iterator for line in chunk.splitlines()]
+
+        with patch("app.routers.internal_processing.SessionLocal", Session):
+            response = stream_processing_request_transcript_rows(request.event_id, db, after_segment_index=0)
+            self.assertEqual(response.media_type, "application/x-ndjson")
+            self.assertEqual([row["segment_index"] for row in asyncio.run(body(response))], [1, 2])
+
+            db.query(models.ProcessingRequestTranscript).filter_by(segment_index=2).update({"text": "  "})
+            db.commit()
+            lines = asyncio.run(body(stream_processing_request_transcript_rows(request.event_id, db)))
+            self.assertEqual([line.get("segment_index") for line in lines[:-1]], [0, 1])
+            self.assertEqual(lines[-1], {"error": "Processing transcript artifacts are not usable"})
+
+            db.query(models.ProcessingRequestTranscript).delete()
+            db.commit()
+            with self.assertRaises(HTTPException) as raised:
+                stream_processing_request_transcript_rows(request.event_id, db)
+            self.assertEqual(raised.exception.status_code, 409)
+        db.close()
+        engine.dispose()
+
     def test_database_constraint_rejects_partial_or_backward_timing(self) -> None:
         for start_ms, end_ms in ((0, None), (100, 99), (-1, 0)):
             db = self.Session()